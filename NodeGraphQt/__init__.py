@@ -48,7 +48,9 @@ from .pkg_info import __license__ as LICENSE
 
 # node graph
 from .base.graph import NodeGraph, SubGraph
+from .base.layout import LayeredNodeLayout
 from .base.menu import NodesMenu, NodeGraphMenu, NodeGraphCommand
+from .qgraphics.pixmap_cache import PixmapCache
 
 # nodes & ports
 from .base.port import Port
@@ -75,6 +77,7 @@ __all__ = [
     'BaseNodeCircle',
     'GroupNode',
     'LICENSE',
+    'LayeredNodeLayout',
     'NodeBaseWidget',
     'NodeGraph',
     'NodeGraphCommand',
@@ -84,6 +87,7 @@ __all__ = [
     'NodePropEditorWidget',
     'NodesTreeWidget',
     'NodesMenu',
+    'PixmapCache',
     'Port',
     'PropertiesBinWidget',
     'SubGraph',
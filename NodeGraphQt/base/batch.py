@@ -0,0 +1,123 @@
+#!/usr/bin/python
+"""
+Node graph signal batching.
+
+The :class:`GraphChanges` collects the node graph change signals emitted
+while in a :meth:`NodeGraph.batch` so they can be emitted once, without
+duplicates, when the batch ends.
+"""
+
+
+class GraphChanges(object):
+    """
+    Queue of the graph change signals emitted in a batch, the node,
+    connection and selection changes are kept as the net change from the
+    state before the batch so changes that cancel each other out (eg. a
+    node created then deleted) and repeated signals are dropped, only the
+    last value of a node property is kept.
+    """
+
+    def __init__(self):
+        # {key: [state before the batch, current state, value]}
+        self.nodes = {}
+        self.connections = {}
+        self.selection = {}
+        self.properties = {}
+
+    def __bool__(self):
+        return any(self.to_dict().values())
+
+    @staticmethod
+    def _set_state(states, key, state, value=None):
+        """
+        Set the current state of the key, the state before the batch is
+        taken as the opposite of the first state set.
+
+        Args:
+            states (dict): node, connection or selection states.
+            key (object): state key.
+            state (bool): current state.
+            value (object): value returned for the key. (optional)
+        """
+        if key not in states:
+            states[key] = [not state, state, value]
+            return
+        states[key][1] = state
+        if value is not None:
+            states[key][2] = value
+
+    @staticmethod
+    def _changed(states, state):
+        """
+        Returns the values of the keys changed to the state in the batch.
+
+        Args:
+            states (dict): node, connection or selection states.
+            state (bool): current state.
+
+        Returns:
+            list: key values.
+        """
+        return [value for before, current, value in states.values()
+                if current == state and before != state]
+
+    def add(self, signal_name, args):
+        """
+        Queue a node graph signal.
+
+        Args:
+            signal_name (str): node graph signal name.
+            args (tuple): signal arguments.
+        """
+        if signal_name == 'node_created':
+            node = args[0]
+            self._set_state(self.nodes, node.id, True, node)
+        elif signal_name == 'nodes_deleted':
+            for node_id in args[0]:
+                state = self.nodes.get(node_id)
+                if state and not state[0]:
+                    # node was created in the batch so it's dropped.
+                    self.selection.pop(state[2], None)
+                self._set_state(self.nodes, node_id, False)
+                self.properties.pop(node_id, None)
+        elif signal_name in ('port_connected', 'port_disconnected'):
+            connected = signal_name == 'port_connected'
+            self._set_state(self.connections, args, connected, args)
+        elif signal_name in ('ports_connected', 'ports_disconnected'):
+            connected = signal_name == 'ports_connected'
+            for pair in args[0]:
+                pair = tuple(pair)
+                self._set_state(self.connections, pair, connected, pair)
+        elif signal_name == 'property_changed':
+            node, name = args[0], args[1]
+            self.properties.setdefault(node.id, {})[name] = args
+        elif signal_name == 'node_selection_changed':
+            for node in args[1]:
+                self._set_state(self.selection, node, False, node)
+            for node in args[0]:
+                self._set_state(self.selection, node, True, node)
+        else:
+            raise ValueError(
+                'Signal "{}" can\'t be batched.'.format(signal_name))
+
+    def to_dict(self):
+        """
+        Returns the queued changes.
+
+        Returns:
+            dict: changes emitted from :attr:`NodeGraph.graph_changed`.
+        """
+        deleted = [node_id for node_id, (before, current, _) in
+                   self.nodes.items() if before and not current]
+        return {
+            'nodes_created': self._changed(self.nodes, True),
+            'nodes_deleted': deleted,
+            'ports_connected': self._changed(self.connections, True),
+            'ports_disconnected': self._changed(self.connections, False),
+            'properties_changed': [
+                args for props in self.properties.values()
+                for args in props.values()
+            ],
+            'nodes_selected': self._changed(self.selection, True),
+            'nodes_deselected': self._changed(self.selection, False),
+        }
@@ -3,6 +3,10 @@ from PyQt5 import QtWidgets
 
 from NodeGraphQt.constants import PortTypeEnum
 
+# undo command ids used for merging consecutive commands.
+_PROPERTY_CHANGED_ID = 1
+_NODES_MOVED_ID = 2
+
 
 class PropertyChangedCmd(QtWidgets.QUndoCommand):
     """
@@ -28,6 +32,11 @@ class PropertyChangedCmd(QtWidgets.QUndoCommand):
         """
         # set model data.
         model = self.node.model
+        graph_model = self.node.graph.model
+        if name == 'name' and self.node.id in graph_model.nodes:
+            # keep the graph node name registry in sync.
+            graph_model.remove_node_name(model.name, self.node.id)
+            graph_model.add_node_name(value, self.node.id)
         model.set_property(name, value)
 
         # set view data.
@@ -49,7 +58,28 @@ class PropertyChangedCmd(QtWidgets.QUndoCommand):
 
         # emit property changed signal.
         graph = self.node.graph
-        graph.property_changed.emit(self.node, self.name, value)
+        graph._emit_signal('property_changed', self.node, self.name, value)
+
+    def id(self):
+        return _PROPERTY_CHANGED_ID
+
+    def mergeWith(self, other):
+        """
+        Merge consecutive changes of the same node property into one
+        command. (eg. the values from dragging a slider widget)
+
+        Args:
+            other (PropertyChangedCmd): next command pushed to the stack.
+
+        Returns:
+            bool: true if merged.
+        """
+        if other.node is not self.node or other.name != self.name:
+            return False
+        self.new_val = other.new_val
+        # the command is removed from the stack if it changes nothing.
+        self.setObsolete(self.old_val == self.new_val)
+        return True
 
     def undo(self):
         if self.old_val != self.new_val:
@@ -94,7 +124,7 @@ class NodeVisibleCmd(QtWidgets.QUndoCommand):
 
         # emit property changed signal.
         graph = self.node.graph
-        graph.property_changed.emit(self.node, 'visible', visible)
+        graph._emit_signal('property_changed', self.node, 'visible', visible)
 
     def undo(self):
         self.set_node_visible(not self.visible)
@@ -157,6 +187,93 @@ class NodeMovedCmd(QtWidgets.QUndoCommand):
         self.node.model.pos = self.pos
 
 
+class NodesMovedCmd(QtWidgets.QUndoCommand):
+    """
+    Nodes moved command, the positions are stored by node id so moving a
+    large number of nodes is a single command.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        positions (dict): {<node_id>: (<new_pos>, <previous_pos>)}
+    """
+
+    def __init__(self, graph, positions):
+        QtWidgets.QUndoCommand.__init__(self)
+        self.graph = graph
+        self.positions = positions
+
+    def id(self):
+        return _NODES_MOVED_ID
+
+    def mergeWith(self, other):
+        """
+        Merge consecutive moves of the same nodes into one command.
+
+        Args:
+            other (NodesMovedCmd): next command pushed to the stack.
+
+        Returns:
+            bool: true if merged.
+        """
+        if other.positions.keys() != self.positions.keys():
+            return False
+        self.positions = {
+            node_id: (other.positions[node_id][0], prev_pos)
+            for node_id, (pos, prev_pos) in self.positions.items()
+        }
+        # the command is removed from the stack if it changes nothing.
+        self.setObsolete(
+            all(pos == prev_pos for pos, prev_pos in self.positions.values())
+        )
+        return True
+
+    def set_positions(self, index):
+        for node_id, positions in self.positions.items():
+            node = self.graph.get_node_by_id(node_id)
+            node.view.xy_pos = positions[index]
+            node.model.pos = positions[index]
+
+    def undo(self):
+        self.set_positions(1)
+
+    def redo(self):
+        self.set_positions(0)
+
+
+class NodesSelectedCmd(QtWidgets.QUndoCommand):
+    """
+    Node selection changed command, the nodes are (de)selected in one go
+    and the selection changed signal is emitted once.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        selected (list[NodeGraphQt.BaseNode]): nodes to select.
+        deselected (list[NodeGraphQt.BaseNode]): nodes to deselect.
+    """
+
+    def __init__(self, graph, selected, deselected):
+        QtWidgets.QUndoCommand.__init__(self)
+        self.graph = graph
+        self.selected = selected
+        self.deselected = deselected
+
+    def set_selection(self, selected, deselected):
+        for node in deselected:
+            node.model.selected = False
+            node.view.setSelected(False)
+        for node in selected:
+            node.model.selected = True
+            node.view.setSelected(True)
+        self.graph._emit_signal(
+            'node_selection_changed', selected, deselected)
+
+    def undo(self):
+        self.set_selection(self.deselected, self.selected)
+
+    def redo(self):
+        self.set_selection(self.selected, self.deselected)
+
+
 class NodeAddedCmd(QtWidgets.QUndoCommand):
     """
     Node added command.
@@ -180,13 +297,15 @@ class NodeAddedCmd(QtWidgets.QUndoCommand):
         node_id = self.node.id
         self.pos = self.pos or self.node.pos()
         self.graph.model.nodes.pop(self.node.id)
+        self.graph.model.remove_node_name(self.node.name(), self.node.id)
         self.node.view.delete()
 
         if self.emit_signal:
-            self.graph.nodes_deleted.emit([node_id])
+            self.graph._emit_signal('nodes_deleted', [node_id])
 
     def redo(self):
         self.graph.model.nodes[self.node.id] = self.node
+        self.graph.model.add_node_name(self.node.name(), self.node.id)
         self.graph.viewer().add_node(self.node.view, self.pos)
 
         # node width & height is calculated when it's added to the scene,
@@ -195,7 +314,7 @@ class NodeAddedCmd(QtWidgets.QUndoCommand):
         self.node.model.height = self.node.view.height
 
         if self.emit_signal:
-            self.graph.node_created.emit(self.node)
+            self.graph._emit_signal('node_created', self.node)
 
 
 class NodesRemovedCmd(QtWidgets.QUndoCommand):
@@ -218,20 +337,22 @@ class NodesRemovedCmd(QtWidgets.QUndoCommand):
     def undo(self):
         for node in self.nodes:
             self.graph.model.nodes[node.id] = node
+            self.graph.model.add_node_name(node.name(), node.id)
             self.graph.scene().addItem(node.view)
 
             if self.emit_signal:
-                self.graph.node_created.emit(node)
+                self.graph._emit_signal('node_created', node)
 
     def redo(self):
         node_ids = []
         for node in self.nodes:
             node_ids.append(node.id)
             self.graph.model.nodes.pop(node.id)
+            self.graph.model.remove_node_name(node.name(), node.id)
             node.view.delete()
 
         if self.emit_signal:
-            self.graph.nodes_deleted.emit(node_ids)
+            self.graph._emit_signal('nodes_deleted', node_ids)
 
 
 class NodeInputConnectedCmd(QtWidgets.QUndoCommand):
@@ -311,16 +432,19 @@ class PortConnectedCmd(QtWidgets.QUndoCommand):
         trg_id = self.target.node().id
 
         port_names = src_model.connected_ports.get(trg_id)
-        if port_names is []:
-            del src_model.connected_ports[trg_id]
         if port_names and self.target.name() in port_names:
             port_names.remove(self.target.name())
+        if port_names == []:
+            del src_model.connected_ports[trg_id]
 
         port_names = trg_model.connected_ports.get(src_id)
-        if port_names is []:
-            del trg_model.connected_ports[src_id]
         if port_names and self.source.name() in port_names:
             port_names.remove(self.source.name())
+        if port_names == []:
+            del trg_model.connected_ports[src_id]
+
+        graph_model = self.source.node().graph.model
+        graph_model.remove_port_connection(self.source, self.target)
 
         self.source.view.disconnect_from(self.target.view)
 
@@ -328,8 +452,9 @@ class PortConnectedCmd(QtWidgets.QUndoCommand):
         if self.emit_signal:
             ports = {p.type_(): p for p in [self.source, self.target]}
             graph = self.source.node().graph
-            graph.port_disconnected.emit(ports[PortTypeEnum.IN.value],
-                                         ports[PortTypeEnum.OUT.value])
+            graph._emit_signal('port_disconnected',
+                               ports[PortTypeEnum.IN.value],
+                               ports[PortTypeEnum.OUT.value])
 
     def redo(self):
         src_model = self.source.model
@@ -340,14 +465,20 @@ class PortConnectedCmd(QtWidgets.QUndoCommand):
         src_model.connected_ports[trg_id].append(self.target.name())
         trg_model.connected_ports[src_id].append(self.source.name())
 
-        self.source.view.connect_to(self.target.view)
+        graph = self.source.node().graph
+        graph.model.add_port_connection(self.source, self.target)
+
+        # the viewer is passed in as the port view is outside the scene
+        # while its node is culled.
+        self.source.view.connect_to(self.target.view, graph.viewer())
 
         # emit "port_connected" signal from the parent graph.
         if self.emit_signal:
             ports = {p.type_(): p for p in [self.source, self.target]}
             graph = self.source.node().graph
-            graph.port_connected.emit(ports[PortTypeEnum.IN.value],
-                                      ports[PortTypeEnum.OUT.value])
+            graph._emit_signal('port_connected',
+                               ports[PortTypeEnum.IN.value],
+                               ports[PortTypeEnum.OUT.value])
 
 
 class PortDisconnectedCmd(QtWidgets.QUndoCommand):
@@ -375,14 +506,20 @@ class PortDisconnectedCmd(QtWidgets.QUndoCommand):
         src_model.connected_ports[trg_id].append(self.target.name())
         trg_model.connected_ports[src_id].append(self.source.name())
 
-        self.source.view.connect_to(self.target.view)
+        graph = self.source.node().graph
+        graph.model.add_port_connection(self.source, self.target)
+
+        # the viewer is passed in as the port view is outside the scene
+        # while its node is culled.
+        self.source.view.connect_to(self.target.view, graph.viewer())
 
         # emit "port_connected" signal from the parent graph.
         if self.emit_signal:
             ports = {p.type_(): p for p in [self.source, self.target]}
             graph = self.source.node().graph
-            graph.port_connected.emit(ports[PortTypeEnum.IN.value],
-                                      ports[PortTypeEnum.OUT.value])
+            graph._emit_signal('port_connected',
+                               ports[PortTypeEnum.IN.value],
+                               ports[PortTypeEnum.OUT.value])
 
     def redo(self):
         src_model = self.source.model
@@ -391,16 +528,19 @@ class PortDisconnectedCmd(QtWidgets.QUndoCommand):
         trg_id = self.target.node().id
 
         port_names = src_model.connected_ports.get(trg_id)
-        if port_names is []:
-            del src_model.connected_ports[trg_id]
         if port_names and self.target.name() in port_names:
             port_names.remove(self.target.name())
+        if port_names == []:
+            del src_model.connected_ports[trg_id]
 
         port_names = trg_model.connected_ports.get(src_id)
-        if port_names is []:
-            del trg_model.connected_ports[src_id]
         if port_names and self.source.name() in port_names:
             port_names.remove(self.source.name())
+        if port_names == []:
+            del trg_model.connected_ports[src_id]
+
+        graph_model = self.source.node().graph.model
+        graph_model.remove_port_connection(self.source, self.target)
 
         self.source.view.disconnect_from(self.target.view)
 
@@ -408,8 +548,151 @@ class PortDisconnectedCmd(QtWidgets.QUndoCommand):
         if self.emit_signal:
             ports = {p.type_(): p for p in [self.source, self.target]}
             graph = self.source.node().graph
-            graph.port_disconnected.emit(ports[PortTypeEnum.IN.value],
-                                         ports[PortTypeEnum.OUT.value])
+            graph._emit_signal('port_disconnected',
+                               ports[PortTypeEnum.IN.value],
+                               ports[PortTypeEnum.OUT.value])
+
+
+class PortConnectionsChangedCmd(QtWidgets.QUndoCommand):
+    """
+    Bulk port connections changed command.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        connected (list[tuple]): ``(input_port, output_port)`` to connect.
+        disconnected (list[tuple]): ``(input_port, output_port)`` to
+            disconnect before the new connections are made.
+        emit_signal (bool): emit the bulk port connection signals.
+    """
+
+    def __init__(self, graph, connected=None, disconnected=None,
+                 emit_signal=True):
+        QtWidgets.QUndoCommand.__init__(self)
+        self.setText('changed port connections')
+        self.graph = graph
+        self.connected = connected or []
+        self.disconnected = disconnected or []
+        self.emit_signal = emit_signal
+        self.commands = []
+        for in_port, out_port in self.disconnected:
+            self.commands += [
+                PortDisconnectedCmd(in_port, out_port, emit_signal=False),
+                NodeInputDisconnectedCmd(in_port, out_port)
+            ]
+        for in_port, out_port in self.connected:
+            self.commands += [
+                PortConnectedCmd(in_port, out_port, emit_signal=False),
+                NodeInputConnectedCmd(in_port, out_port)
+            ]
+
+    def undo(self):
+        for cmd in reversed(self.commands):
+            cmd.undo()
+
+        # emit "ports_disconnected" & "ports_connected" from the graph.
+        if self.emit_signal:
+            if self.connected:
+                self.graph._emit_signal(
+                    'ports_disconnected', list(self.connected))
+            if self.disconnected:
+                self.graph._emit_signal(
+                    'ports_connected', list(self.disconnected))
+
+    def redo(self):
+        for cmd in self.commands:
+            cmd.redo()
+
+        # emit "ports_disconnected" & "ports_connected" from the graph.
+        if self.emit_signal:
+            if self.disconnected:
+                self.graph._emit_signal(
+                    'ports_disconnected', list(self.disconnected))
+            if self.connected:
+                self.graph._emit_signal(
+                    'ports_connected', list(self.connected))
+
+
+class StructureRemovedCmd(QtWidgets.QUndoCommand):
+    """
+    Bulk structural edit command, the port locks, connections and nodes are
+    removed in one go from a compact snapshot of the node ids and port names.
+
+    The port signals are emitted for each connection followed by the bulk
+    ``ports_disconnected`` (``ports_connected`` on undo) signal.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        connections (list[tuple]): ``(input_port, output_port)`` to
+            disconnect.
+        locked_ports (list[NodeGraphQt.Port]): locked ports to unlock.
+        nodes (list[NodeGraphQt.BaseNode]): nodes to remove. (optional)
+        emit_signal (bool): emit the connection & node signals.
+    """
+
+    def __init__(self, graph, connections, locked_ports=None, nodes=None,
+                 emit_signal=True):
+        QtWidgets.QUndoCommand.__init__(self)
+        self.setText('removed node(s)')
+        self.graph = graph
+        self.emit_signal = emit_signal
+        self.connections = [
+            (in_port.node().id, in_port.name(),
+             out_port.node().id, out_port.name())
+            for in_port, out_port in connections
+        ]
+        self.locked_ports = [
+            (port.node().id, port.type_(), port.name())
+            for port in locked_ports or []
+        ]
+        self.nodes_cmd = None
+        if nodes:
+            self.nodes_cmd = NodesRemovedCmd(graph, nodes, emit_signal)
+
+    def _connected_ports(self):
+        nodes = self.graph.model.nodes
+        return [
+            (nodes[in_id].get_input(in_name),
+             nodes[out_id].get_output(out_name))
+            for in_id, in_name, out_id, out_name in self.connections
+        ]
+
+    def _set_locked(self, locked):
+        nodes = self.graph.model.nodes
+        for node_id, port_type, name in self.locked_ports:
+            if port_type == PortTypeEnum.IN.value:
+                port = nodes[node_id].get_input(name)
+            else:
+                port = nodes[node_id].get_output(name)
+            port.model.locked = locked
+            port.view.locked = locked
+
+    def undo(self):
+        if self.nodes_cmd:
+            self.nodes_cmd.undo()
+
+        pairs = self._connected_ports()
+        for in_port, out_port in pairs:
+            PortDisconnectedCmd(in_port, out_port, self.emit_signal).undo()
+            NodeInputDisconnectedCmd(in_port, out_port).undo()
+        self._set_locked(True)
+
+        # emit "ports_connected" from the graph.
+        if self.emit_signal and pairs:
+            self.graph._emit_signal('ports_connected', pairs)
+
+    def redo(self):
+        self._set_locked(False)
+        pairs = self._connected_ports()
+        for in_port, out_port in pairs:
+            PortDisconnectedCmd(in_port, out_port, self.emit_signal).redo()
+            NodeInputDisconnectedCmd(in_port, out_port).redo()
+
+        # emit "ports_disconnected" from the graph.
+        if self.emit_signal and pairs:
+            self.graph._emit_signal('ports_disconnected', pairs)
+
+        if self.nodes_cmd:
+            self.nodes_cmd.redo()
 
 
 class PortLockedCmd(QtWidgets.QUndoCommand):
@@ -4,31 +4,50 @@ import copy
 import json
 import os
 import re
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
 from pathlib import PosixPath
 
 from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtCore import pyqtSignal
 
+from NodeGraphQt.base.batch import GraphChanges
 from NodeGraphQt.base.commands import (NodeAddedCmd,
                                        NodesRemovedCmd,
-                                       NodeMovedCmd,
-                                       PortConnectedCmd)
+                                       NodesMovedCmd,
+                                       NodesSelectedCmd,
+                                       PortConnectedCmd,
+                                       PortConnectionsChangedCmd,
+                                       StructureRemovedCmd)
 from NodeGraphQt.base.factory import NodeFactory
+from NodeGraphQt.base.layout import LayeredNodeLayout
 from NodeGraphQt.base.menu import NodeGraphMenu, NodesMenu
 from NodeGraphQt.base.model import NodeGraphModel
 from NodeGraphQt.base.node import NodeObject
 from NodeGraphQt.base.port import Port
+from NodeGraphQt.base.session_format import (
+    is_binary_session,
+    read_binary_session,
+    write_binary_session
+)
+from NodeGraphQt.base.session_loader import SessionLoader
 from NodeGraphQt.constants import (
     MIME_TYPE,
     URI_SCHEME,
     URN_SCHEME,
     LayoutDirectionEnum,
     PipeLayoutEnum,
+    PortEnum,
     PortTypeEnum,
-    ViewerEnum
+    ViewerEnum,
+    ViewerRenderEnum
+)
+from NodeGraphQt.errors import (
+    NodeCreationError,
+    NodeDeletionError,
+    PortError
 )
-from NodeGraphQt.errors import NodeCreationError, NodeDeletionError
 from NodeGraphQt.nodes.backdrop_node import BackdropNode
 from NodeGraphQt.nodes.base_node import BaseNode
 from NodeGraphQt.nodes.group_node import GroupNode
@@ -108,6 +127,22 @@ class NodeGraph(QtCore.QObject):
     :parameters: :class:`NodeGraphQt.Port`, :class:`NodeGraphQt.Port`
     :emits: input port, output port
     """
+    ports_connected = pyqtSignal(list)
+    """
+    Signal triggered when node ports have been connected with
+    :meth:`NodeGraph.connect_many`.
+
+    :parameters: list[tuple(:class:`NodeGraphQt.Port`, :class:`NodeGraphQt.Port`)]
+    :emits: list of (input port, output port)
+    """
+    ports_disconnected = pyqtSignal(list)
+    """
+    Signal triggered when node ports have been disconnected with
+    :meth:`NodeGraph.connect_many` or :meth:`NodeGraph.disconnect_many`.
+
+    :parameters: list[tuple(:class:`NodeGraphQt.Port`, :class:`NodeGraphQt.Port`)]
+    :emits: list of (input port, output port)
+    """
     property_changed = pyqtSignal(NodeObject, str, object)
     """
     Signal is triggered when a property has changed on a node.
@@ -138,6 +173,16 @@ class NodeGraph(QtCore.QObject):
         :class:`NodeGraphQt.BaseNode`
     :emits: triggered context menu, node object.
     """
+    graph_changed = pyqtSignal(dict)
+    """
+    Signal is triggered once at the end of a :meth:`NodeGraph.batch` with
+    the changes made in the batch.
+
+    :parameters: dict
+    :emits: ``{"nodes_created", "nodes_deleted", "ports_connected",
+        "ports_disconnected", "properties_changed", "nodes_selected",
+        "nodes_deselected"}`` lists of the changes.
+    """
 
     def __init__(self, parent=None, **kwargs):
         """
@@ -157,6 +202,9 @@ class NodeGraph(QtCore.QObject):
         )
         self._widget = None
         self._sub_graphs = {}
+        self._session_loader = None
+        self._batch_depth = 0
+        self._batch_changes = None
         self._viewer = (
             kwargs.get('viewer') or NodeViewer(undo_stack=self._undo_stack)
         )
@@ -343,7 +391,7 @@ class NodeGraph(QtCore.QObject):
         """
         sel_nodes = [self.get_node_by_id(nid) for nid in sel_ids]
         unsel_nodes = [self.get_node_by_id(nid) for nid in desel_ids]
-        self.node_selection_changed.emit(sel_nodes, unsel_nodes)
+        self._emit_signal('node_selection_changed', sel_nodes, unsel_nodes)
 
     def _on_node_data_dropped(self, mimedata, pos):
         """
@@ -408,11 +456,13 @@ class NodeGraph(QtCore.QObject):
         Args:
             node_data (dict): {<node_view>: <previous_pos>}
         """
-        self._undo_stack.beginMacro('move nodes')
+        positions = {}
         for node_view, prev_pos in node_data.items():
             node = self._model.nodes[node_view.id]
-            self._undo_stack.push(NodeMovedCmd(node, node.pos(), prev_pos))
-        self._undo_stack.endMacro()
+            positions[node.id] = (node.pos(), prev_pos)
+        undo_cmd = NodesMovedCmd(self, positions)
+        undo_cmd.setText('move nodes')
+        self._undo_stack.push(undo_cmd)
 
     def _on_node_backdrop_updated(self, node_id, update_property, value):
         """
@@ -716,6 +766,36 @@ class NodeGraph(QtCore.QObject):
         """
         self._undo_stack.clear()
 
+    def undo_limit(self):
+        """
+        Returns the max number of commands kept in the undo stack.
+
+        See Also:
+            :meth:`NodeGraph.set_undo_limit`
+
+        Returns:
+            int: undo limit (0 if there's no limit).
+        """
+        return self._undo_stack.undoLimit()
+
+    def set_undo_limit(self, limit=0):
+        """
+        Set the max number of commands kept in the undo stack, the oldest
+        commands are dropped when the limit is reached.
+
+        Note:
+            The undo stack is cleared as the ``QUndoStack`` limit can only
+            be set on an empty stack.
+
+        See Also:
+            :meth:`NodeGraph.undo_limit`
+
+        Args:
+            limit (int): max number of undo commands (0 for no limit).
+        """
+        self._undo_stack.clear()
+        self._undo_stack.setUndoLimit(max(0, int(limit)))
+
     def begin_undo(self, name):
         """
         Start of an undo block followed by a
@@ -733,6 +813,99 @@ class NodeGraph(QtCore.QObject):
         """
         self._undo_stack.endMacro()
 
+    def begin_batch(self):
+        """
+        Start of a batch of changes followed by a
+        :meth:`NodeGraph.end_batch()`.
+
+        See Also:
+            :meth:`NodeGraph.batch()`
+        """
+        if not self._batch_depth:
+            self._batch_changes = GraphChanges()
+            self._viewer.begin_batch()
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """
+        End of a batch of changes started by
+        :meth:`NodeGraph.begin_batch()`, the queued signals and the
+        :attr:`NodeGraph.graph_changed` signal are emitted when the outer
+        most batch ends.
+        """
+        if not self._batch_depth:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+
+        changes, self._batch_changes = self._batch_changes, None
+        self._viewer.end_batch()
+        if not changes:
+            return
+
+        diff = changes.to_dict()
+        if diff['nodes_deleted']:
+            self.nodes_deleted.emit(diff['nodes_deleted'])
+        if diff['ports_disconnected']:
+            self.ports_disconnected.emit(diff['ports_disconnected'])
+        for node in diff['nodes_created']:
+            self.node_created.emit(node)
+        if diff['ports_connected']:
+            self.ports_connected.emit(diff['ports_connected'])
+        for node, name, value in diff['properties_changed']:
+            self.property_changed.emit(node, name, value)
+        if diff['nodes_selected'] or diff['nodes_deselected']:
+            self.node_selection_changed.emit(
+                diff['nodes_selected'], diff['nodes_deselected']
+            )
+        self.graph_changed.emit(diff)
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that batches the node graph signals, the viewport
+        is repainted once and the queued signals are emitted without
+        duplicates when the batch ends.
+
+        Note:
+            The connection changes in a batch are emitted with the
+            :attr:`NodeGraph.ports_connected` and
+            :attr:`NodeGraph.ports_disconnected` signals and a property
+            changed in the batch is only emitted with its last value.
+
+        .. code-block:: python
+            :linenos:
+
+            with graph.batch():
+                for node in graph.all_nodes():
+                    node.set_property('color', (255, 0, 0, 255))
+
+        See Also:
+            :meth:`NodeGraph.begin_batch()`,
+            :meth:`NodeGraph.end_batch()`,
+            :attr:`NodeGraph.graph_changed`
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def _emit_signal(self, signal_name, *args):
+        """
+        Emit the node graph signal or queue it while in a batch.
+        (called from the undo commands)
+
+        Args:
+            signal_name (str): node graph signal name.
+            *args: signal arguments.
+        """
+        if self._batch_changes is None:
+            getattr(self, signal_name).emit(*args)
+        else:
+            self._batch_changes.add(signal_name, args)
+
     def context_menu(self):
         """
         Returns the context menu for the node graph.
@@ -1062,6 +1235,135 @@ class NodeGraph(QtCore.QObject):
         self._model.pipe_style = style
         self._viewer.set_pipe_layout(style)
 
+    def virtualized(self):
+        """
+        Returns true if the node items outside the view are culled from the
+        scene.
+
+        See Also:
+            :meth:`NodeGraph.set_virtualized`
+
+        Returns:
+            bool: true if virtualized.
+        """
+        return self._viewer.is_virtualized()
+
+    def set_virtualized(self, mode=True):
+        """
+        Enable/Disable the virtualized scene.
+
+        When enabled only the node items near the view and the selected node
+        items are kept in the scene, the other node items are removed from
+        the scene and added back as the view is panned or zoomed to them.
+        Pipes between two culled nodes are drawn as a single straight line
+        summary, useful for graphs with a very large number of nodes.
+
+        Note:
+            The nodes still create their node items, the culled node items
+            are just not in the scene.
+
+        See Also:
+            :meth:`NodeGraph.virtualized`
+
+        Args:
+            mode (bool): False to disable the virtualized scene.
+        """
+        self._viewer.set_virtualized(mode)
+
+    def incremental_selection(self):
+        """
+        Returns true if the marquee selection is updated incrementally.
+
+        See Also:
+            :meth:`NodeGraph.set_incremental_selection`
+
+        Returns:
+            bool: true if incremental.
+        """
+        return self._viewer.get_incremental_selection()
+
+    def set_incremental_selection(self, mode=True):
+        """
+        Enable/Disable the incremental marquee selection.
+
+        When enabled dragging the selection marquee only (de)selects the
+        items entering or leaving the marquee, the selection is updated at
+        most once a frame and zoomed out items are picked by their bounding
+        rect instead of their shape, useful for graphs with a very large
+        number of nodes.
+
+        See Also:
+            :meth:`NodeGraph.incremental_selection`
+
+        Args:
+            mode (bool): False to disable the incremental selection.
+        """
+        self._viewer.set_incremental_selection(mode)
+
+    def port_snap_radius(self):
+        """
+        Returns the distance a dragged connection snaps to a port.
+
+        See Also:
+            :meth:`NodeGraph.set_port_snap_radius`
+
+        Returns:
+            float: snap radius in view pixels.
+        """
+        return self._viewer.get_port_snap_radius()
+
+    def set_port_snap_radius(self, radius=PortEnum.SNAP_RADIUS.value):
+        """
+        Set the distance a dragged connection snaps to the nearest port it
+        can be connected to when the cursor isn't over a port.
+
+        See Also:
+            :meth:`NodeGraph.port_snap_radius`
+
+        Args:
+            radius (float): snap radius in view pixels (0 to disable).
+        """
+        self._viewer.set_port_snap_radius(radius)
+
+    def render_profile(self):
+        """
+        Returns the current rendering profile.
+
+        See Also:
+            :meth:`NodeGraph.set_render_profile`
+
+        Returns:
+            int: rendering profile. :attr:`NodeGraphQt.constants.ViewerRenderEnum`
+        """
+        return self._viewer.get_render_profile()
+
+    def set_render_profile(self, profile=ViewerRenderEnum.FULL.value):
+        """
+        Set how the node graph viewer repaints when items change.
+
+        - :attr:`NodeGraphQt.constants.ViewerRenderEnum.FULL` repaints the
+          whole viewport `(default)`.
+        - :attr:`NodeGraphQt.constants.ViewerRenderEnum.BOUNDING_RECT`
+          repaints the area of the changed items without item caching,
+          useful for large graphs where hovering a node or port would
+          otherwise repaint every item.
+        - :attr:`NodeGraphQt.constants.ViewerRenderEnum.SMART` lets Qt pick
+          the repainted areas with cached items.
+
+        .. code-block:: python
+            :linenos:
+
+            graph = NodeGraph()
+            graph.set_render_profile(ViewerRenderEnum.BOUNDING_RECT.value)
+
+        Args:
+            profile (int): rendering profile.
+        """
+        profiles = [e.value for e in ViewerRenderEnum]
+        if profile not in profiles:
+            profile = ViewerRenderEnum.FULL.value
+        self._viewer.set_render_profile(profile)
+
     def layout_direction(self):
         """
         Return the current node graph layout direction.
@@ -1196,6 +1498,65 @@ class NodeGraph(QtCore.QObject):
         self._viewer.rebuild_tab_search()
         self.nodes_registered.emit(nodes)
 
+    def _register_node_attrs(self, node, register_constraints=True):
+        """
+        Register the node common properties and port connection constraints
+        to the graph model.
+        (used internally by the node graph)
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+            register_constraints (bool): register the port accept & reject
+                connection types, can be skipped if the node type has already
+                been registered.
+        """
+        wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
+        prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
+
+        if self.model.get_node_common_properties(node.type_) is None:
+            node_attrs = {node.type_: {
+                n: {'widget_type': wt} for n, wt in wid_types.items()
+            }}
+            for pname, pattrs in prop_attrs.items():
+                node_attrs[node.type_][pname].update(pattrs)
+            self.model.set_node_common_properties(node_attrs)
+
+        accept_types = node.model.__dict__.pop(
+            '_TEMP_accept_connection_types'
+        )
+        reject_types = node.model.__dict__.pop(
+            '_TEMP_reject_connection_types'
+        )
+        if not register_constraints:
+            return
+
+        for ptype, pdata in accept_types.get(node.type_, {}).items():
+            for pname, accept_data in pdata.items():
+                for accept_ntype, accept_ndata in accept_data.items():
+                    for accept_ptype, accept_pnames in accept_ndata.items():
+                        for accept_pname in accept_pnames:
+                            self._model.add_port_accept_connection_type(
+                                port_name=pname,
+                                port_type=ptype,
+                                node_type=node.type_,
+                                accept_pname=accept_pname,
+                                accept_ptype=accept_ptype,
+                                accept_ntype=accept_ntype
+                            )
+        for ptype, pdata in reject_types.get(node.type_, {}).items():
+            for pname, reject_data in pdata.items():
+                for reject_ntype, reject_ndata in reject_data.items():
+                    for reject_ptype, reject_pnames in reject_ndata.items():
+                        for reject_pname in reject_pnames:
+                            self._model.add_port_reject_connection_type(
+                                port_name=pname,
+                                port_type=ptype,
+                                node_type=node.type_,
+                                reject_pname=reject_pname,
+                                reject_ptype=reject_ptype,
+                                reject_ntype=reject_ntype
+                            )
+
     def create_node(self, node_type, name=None, selected=True, color=None,
                     text_color=None, pos=None, push_undo=True):
         """
@@ -1221,49 +1582,7 @@ class NodeGraph(QtCore.QObject):
             node._graph = self
             node.model._graph_model = self.model
 
-            wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
-            prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
-
-            if self.model.get_node_common_properties(node.type_) is None:
-                node_attrs = {node.type_: {
-                    n: {'widget_type': wt} for n, wt in wid_types.items()
-                }}
-                for pname, pattrs in prop_attrs.items():
-                    node_attrs[node.type_][pname].update(pattrs)
-                self.model.set_node_common_properties(node_attrs)
-
-            accept_types = node.model.__dict__.pop(
-                '_TEMP_accept_connection_types'
-            )
-            for ptype, pdata in accept_types.get(node.type_, {}).items():
-                for pname, accept_data in pdata.items():
-                    for accept_ntype, accept_ndata in accept_data.items():
-                        for accept_ptype, accept_pnames in accept_ndata.items():
-                            for accept_pname in accept_pnames:
-                                self._model.add_port_accept_connection_type(
-                                    port_name=pname,
-                                    port_type=ptype,
-                                    node_type=node.type_,
-                                    accept_pname=accept_pname,
-                                    accept_ptype=accept_ptype,
-                                    accept_ntype=accept_ntype
-                                )
-            reject_types = node.model.__dict__.pop(
-                '_TEMP_reject_connection_types'
-            )
-            for ptype, pdata in reject_types.get(node.type_, {}).items():
-                for pname, reject_data in pdata.items():
-                    for reject_ntype, reject_ndata in reject_data.items():
-                        for reject_ptype, reject_pnames in reject_ndata.items():
-                            for reject_pname in reject_pnames:
-                                self._model.add_port_reject_connection_type(
-                                    port_name=pname,
-                                    port_type=ptype,
-                                    node_type=node.type_,
-                                    reject_pname=reject_pname,
-                                    reject_ptype=reject_ptype,
-                                    reject_ntype=reject_ntype
-                                )
+            self._register_node_attrs(node)
 
             node.NODE_NAME = self.get_unique_name(name or node.NODE_NAME)
             node.model.name = node.NODE_NAME
@@ -1293,13 +1612,12 @@ class NodeGraph(QtCore.QObject):
             if push_undo:
                 undo_label = 'create node: "{}"'.format(node.NODE_NAME)
                 self._undo_stack.beginMacro(undo_label)
-                for n in self.selected_nodes():
-                    n.set_property('selected', False, push_undo=True)
+                self.clear_selection()
                 self._undo_stack.push(undo_cmd)
                 self._undo_stack.endMacro()
             else:
-                for n in self.selected_nodes():
-                    n.set_property('selected', False, push_undo=False)
+                self._set_selection([], self.selected_nodes(),
+                                    'clear selection', push_undo=False)
                 undo_cmd.redo()
 
             return node
@@ -1320,49 +1638,7 @@ class NodeGraph(QtCore.QObject):
         """
         assert isinstance(node, NodeObject), 'node must be a Node instance.'
 
-        wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
-        prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
-
-        if self.model.get_node_common_properties(node.type_) is None:
-            node_attrs = {node.type_: {
-                n: {'widget_type': wt} for n, wt in wid_types.items()
-            }}
-            for pname, pattrs in prop_attrs.items():
-                node_attrs[node.type_][pname].update(pattrs)
-            self.model.set_node_common_properties(node_attrs)
-
-        accept_types = node.model.__dict__.pop(
-            '_TEMP_accept_connection_types'
-        )
-        for ptype, pdata in accept_types.get(node.type_, {}).items():
-            for pname, accept_data in pdata.items():
-                for accept_ntype, accept_ndata in accept_data.items():
-                    for accept_ptype, accept_pnames in accept_ndata.items():
-                        for accept_pname in accept_pnames:
-                            self._model.add_port_accept_connection_type(
-                                port_name=pname,
-                                port_type=ptype,
-                                node_type=node.type_,
-                                accept_pname=accept_pname,
-                                accept_ptype=accept_ptype,
-                                accept_ntype=accept_ntype
-                            )
-        reject_types = node.model.__dict__.pop(
-            '_TEMP_reject_connection_types'
-        )
-        for ptype, pdata in reject_types.get(node.type_, {}).items():
-            for pname, reject_data in pdata.items():
-                for reject_ntype, reject_ndata in reject_data.items():
-                    for reject_ptype, reject_pnames in reject_ndata.items():
-                        for reject_pname in reject_pnames:
-                            self._model.add_port_reject_connection_type(
-                                port_name=pname,
-                                port_type=ptype,
-                                node_type=node.type_,
-                                reject_pname=reject_pname,
-                                reject_ptype=reject_ptype,
-                                reject_ntype=reject_ntype
-                            )
+        self._register_node_attrs(node)
 
         node._graph = self
         node.NODE_NAME = self.get_unique_name(node.NODE_NAME)
@@ -1385,6 +1661,31 @@ class NodeGraph(QtCore.QObject):
         else:
             undo_cmd.redo()
 
+    def _bulk_add_node(self, node, pos=None):
+        """
+        Add a node into the node graph without registering an undo command
+        or drawing the node item.
+        (used internally by the node graph when bulk loading a session)
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+            pos (list[float]): node x,y position. (optional)
+        """
+        node._graph = self
+        node.NODE_NAME = self.get_unique_name(node.NODE_NAME)
+        node.model._graph_model = self.model
+        node.model.name = node.NODE_NAME
+
+        # initial node direction layout.
+        node.model.layout_direction = self.layout_direction()
+
+        # update method must be called before it's been added to the viewer.
+        node.update()
+
+        self.model.nodes[node.id] = node
+        self.model.add_node_name(node.name(), node.id)
+        self._viewer.add_node(node.view, pos, draw=False)
+
     def delete_node(self, node, push_undo=True):
         """
         Remove the node from the node graph.
@@ -1395,32 +1696,17 @@ class NodeGraph(QtCore.QObject):
         """
         assert isinstance(node, NodeObject), \
             'node must be a instance of a NodeObject.'
-        node_id = node.id
-        if push_undo:
-            self._undo_stack.beginMacro('delete node: "{}"'.format(node.name()))
-
-        if isinstance(node, BaseNode):
-            for p in node.input_ports():
-                if p.locked():
-                    p.set_locked(False,
-                                 connected_ports=False,
-                                 push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-            for p in node.output_ports():
-                if p.locked():
-                    p.set_locked(False,
-                                 connected_ports=False,
-                                 push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-
         # collapse group node before removing.
         if isinstance(node, GroupNode) and node.is_expanded:
             node.collapse()
 
-        undo_cmd = NodesRemovedCmd(self, [node], emit_signal=True)
+        connections, locked_ports = self._structure_snapshot([node])
+        undo_cmd = StructureRemovedCmd(
+            self, connections, locked_ports, nodes=[node]
+        )
         if push_undo:
+            undo_cmd.setText('delete node: "{}"'.format(node.name()))
             self._undo_stack.push(undo_cmd)
-            self._undo_stack.endMacro()
         else:
             undo_cmd.redo()
 
@@ -1479,40 +1765,21 @@ class NodeGraph(QtCore.QObject):
         if len(nodes) == 1:
             self.delete_node(nodes[0], push_undo=push_undo)
             return
-        node_ids = [n.id for n in nodes]
-        if push_undo:
-            self._undo_stack.beginMacro(
-                'deleted "{}" node(s)'.format(len(nodes))
-            )
         for node in nodes:
-
             # collapse group node before removing.
             if isinstance(node, GroupNode) and node.is_expanded:
                 node.collapse()
 
-            if isinstance(node, BaseNode):
-                for p in node.input_ports():
-                    if p.locked():
-                        p.set_locked(False,
-                                     connected_ports=False,
-                                     push_undo=push_undo)
-                    p.clear_connections(push_undo=push_undo)
-                for p in node.output_ports():
-                    if p.locked():
-                        p.set_locked(False,
-                                     connected_ports=False,
-                                     push_undo=push_undo)
-                    p.clear_connections(push_undo=push_undo)
-
-        undo_cmd = NodesRemovedCmd(self, nodes, emit_signal=True)
+        connections, locked_ports = self._structure_snapshot(nodes)
+        undo_cmd = StructureRemovedCmd(
+            self, connections, locked_ports, nodes=nodes
+        )
         if push_undo:
+            undo_cmd.setText('deleted "{}" node(s)'.format(len(nodes)))
             self._undo_stack.push(undo_cmd)
-            self._undo_stack.endMacro()
         else:
             undo_cmd.redo()
 
-        self.nodes_deleted.emit(node_ids)
-
     def extract_nodes(self, nodes, push_undo=True, prompt_warning=True):
         """
         Extract select nodes from its connections.
@@ -1546,20 +1813,289 @@ class NodeGraph(QtCore.QObject):
                 self._viewer.message_dialog(message, 'Can\'t Extract Nodes')
             return
 
+        connections, _ = self._structure_snapshot(
+            base_nodes, external_only=True
+        )
+        if not connections:
+            return
+        undo_cmd = StructureRemovedCmd(self, connections)
         if push_undo:
-            self._undo_stack.beginMacro(
-                'extracted "{}" node(s)'.format(len(nodes))
-            )
+            undo_cmd.setText('extracted "{}" node(s)'.format(len(nodes)))
+            self._undo_stack.push(undo_cmd)
+        else:
+            undo_cmd.redo()
+
+    def _structure_snapshot(self, nodes, external_only=False):
+        """
+        Collect the port connections and locked ports of the nodes for the
+        bulk structural edit command.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): list of node instances.
+            external_only (bool): only collect the connections to nodes
+                that are not in the list.
+
+        Raises:
+            PortError: if a connected port on another node is locked.
 
-        for node in base_nodes:
+        Returns:
+            tuple(list[tuple], list[NodeGraphQt.Port]):
+                ``(input_port, output_port)`` connections & locked ports.
+        """
+        node_ids = {n.id for n in nodes}
+        connections = {}
+        locked_ports = []
+        for node in nodes:
+            if not isinstance(node, BaseNode):
+                continue
             for port in node.input_ports() + node.output_ports():
+                if port.locked():
+                    locked_ports.append(port)
                 for connected_port in port.connected_ports():
-                    if connected_port.node() in base_nodes:
+                    external = connected_port.node().id not in node_ids
+                    if external_only and not external:
                         continue
-                    port.disconnect_from(connected_port, push_undo=push_undo)
+                    if external and connected_port.locked():
+                        raise PortError(
+                            'Can\'t disconnect port because "{}" is locked.'
+                            .format(connected_port.name()))
+                    connections[self._port_pair(port, connected_port)] = None
+        return list(connections), locked_ports
+
+    @staticmethod
+    def _port_pair(port1, port2):
+        """
+        Returns the 2 ports as a ``(input_port, output_port)`` pair.
+
+        Args:
+            port1 (NodeGraphQt.Port): port object.
+            port2 (NodeGraphQt.Port): port object.
+
+        Returns:
+            tuple(NodeGraphQt.Port, NodeGraphQt.Port): input & output port.
+        """
+        if port1.type_() == PortTypeEnum.IN.value:
+            return port1, port2
+        return port2, port1
+
+    @staticmethod
+    def _validate_port_constraints(in_port, out_port):
+        """
+        Validate the accept & reject connection constraints between 2 ports.
+
+        Args:
+            in_port (NodeGraphQt.Port): input port.
+            out_port (NodeGraphQt.Port): output port.
+
+        Returns:
+            bool: true if the connection is allowed.
+        """
+        for port, other in [(in_port, out_port), (out_port, in_port)]:
+            node_type = other.node().type_
+            accepted_types = port.accepted_port_types().get(node_type)
+            if accepted_types:
+                accepted_pnames = accepted_types.get(other.type_()) or set([])
+                if other.name() not in accepted_pnames:
+                    return False
+            rejected_types = port.rejected_port_types().get(node_type)
+            if rejected_types:
+                rejected_pnames = rejected_types.get(other.type_()) or set([])
+                if other.name() in rejected_pnames:
+                    return False
+        return True
+
+    def _has_cycle(self, connected, disconnected):
+        """
+        Check if the node graph would have a cycle after the connections
+        are changed.
+
+        Args:
+            connected (list[tuple]): ``(input_port, output_port)`` to connect.
+            disconnected (list[tuple]): ``(input_port, output_port)`` to
+                disconnect.
+
+        Returns:
+            bool: true if the nodes would have a cycle.
+        """
+        # number of connections between each node.
+        edges = {}
+        for node in self._model.nodes.values():
+            if not isinstance(node, BaseNode):
+                continue
+            for port in node.output_ports():
+                for connected_port in port.connected_ports():
+                    key = (node, connected_port.node())
+                    edges[key] = edges.get(key, 0) + 1
+        for in_port, out_port in disconnected:
+            edges[(out_port.node(), in_port.node())] -= 1
+        for in_port, out_port in connected:
+            key = (out_port.node(), in_port.node())
+            edges[key] = edges.get(key, 0) + 1
+
+        adjacency = {}
+        in_degree = {}
+        for (src, trg), count in edges.items():
+            if count < 1:
+                continue
+            adjacency.setdefault(src, []).append(trg)
+            in_degree.setdefault(src, 0)
+            in_degree[trg] = in_degree.get(trg, 0) + 1
+
+        queue = deque(n for n, degree in in_degree.items() if degree == 0)
+        visited = 0
+        while queue:
+            node = queue.popleft()
+            visited += 1
+            for trg in adjacency.get(node, []):
+                in_degree[trg] -= 1
+                if in_degree[trg] == 0:
+                    queue.append(trg)
+        return visited != len(in_degree)
+
+    def connect_many(self, pairs, push_undo=True, emit_signal=True):
+        """
+        Connect multiple ports at once as a single undo command and emits the
+        :attr:`NodeGraph.ports_connected` signal once for all the connections.
+
+        Ports that don't allow multiple connections will be disconnected
+        from their current connection (or an earlier pair in the list) the
+        same as with :meth:`Port.connect_to`.
+
+        Note:
+            Pairs that are already connected or not allowed by the accept &
+            reject connection constraints are skipped.
+
+        Args:
+            pairs (list[tuple]): list of ``(port, port)`` to connect.
+            push_undo (bool): register the command to the undo stack.
+                (default: True)
+            emit_signal (bool): emit the port connection signals.
+                (default: True)
+
+        Returns:
+            list[tuple]: the ``(input_port, output_port)`` connections made.
+        """
+        # the pairs are resolved against the connections as they would be
+        # after each of the earlier pairs in the list has been connected.
+        peers = {}
+        connected = {}
+        disconnected = {}
+        constraints = {}
+
+        def port_peers(port):
+            if port not in peers:
+                peers[port] = dict.fromkeys(port.connected_ports())
+            return peers[port]
+
+        def set_connected(pair, connect):
+            in_port, out_port = pair
+            if connect:
+                port_peers(in_port)[out_port] = None
+                port_peers(out_port)[in_port] = None
+                added, removed = connected, disconnected
+            else:
+                port_peers(in_port).pop(out_port, None)
+                port_peers(out_port).pop(in_port, None)
+                added, removed = disconnected, connected
+            if pair in removed:
+                del removed[pair]
+            else:
+                added[pair] = None
+
+        for port1, port2 in pairs:
+            if port1.type_() == port2.type_():
+                continue
+            in_port, out_port = self._port_pair(port1, port2)
+            if out_port in port_peers(in_port):
+                continue
 
+            if in_port.locked() or out_port.locked():
+                name = [p.name() for p in [in_port, out_port] if p.locked()][0]
+                raise PortError(
+                    'Can\'t connect port because "{}" is locked.'.format(name))
+
+            # validate the constraints once for each port type pairing.
+            key = (in_port.node().type_, in_port.name(),
+                   out_port.node().type_, out_port.name())
+            if key not in constraints:
+                constraints[key] = self._validate_port_constraints(
+                    in_port, out_port
+                )
+            if not constraints[key]:
+                continue
+
+            # detach connections from ports that only allow one connection.
+            for port in (in_port, out_port):
+                if port.multi_connection():
+                    continue
+                for connected_port in list(port_peers(port)):
+                    set_connected(
+                        self._port_pair(port, connected_port), False
+                    )
+            set_connected((in_port, out_port), True)
+
+        connected = list(connected)
+        disconnected = list(disconnected)
+        if not connected:
+            return []
+
+        if self.acyclic() and self._has_cycle(connected, disconnected):
+            raise PortError(
+                'Can\'t connect ports because it would create a cycle.')
+
+        undo_cmd = PortConnectionsChangedCmd(
+            self, connected, disconnected, emit_signal
+        )
         if push_undo:
-            self._undo_stack.endMacro()
+            undo_cmd.setText('connect ports')
+            self._undo_stack.push(undo_cmd)
+        else:
+            undo_cmd.redo()
+        return connected
+
+    def disconnect_many(self, pairs, push_undo=True, emit_signal=True):
+        """
+        Disconnect multiple ports at once as a single undo command and emits
+        the :attr:`NodeGraph.ports_disconnected` signal once for all the
+        connections.
+
+        Args:
+            pairs (list[tuple]): list of ``(port, port)`` to disconnect.
+            push_undo (bool): register the command to the undo stack.
+                (default: True)
+            emit_signal (bool): emit the port connection signals.
+                (default: True)
+
+        Returns:
+            list[tuple]: the ``(input_port, output_port)`` disconnected.
+        """
+        disconnected = {}
+        for port1, port2 in pairs:
+            if port1.type_() == port2.type_():
+                continue
+            in_port, out_port = self._port_pair(port1, port2)
+            if out_port not in in_port.connected_ports():
+                continue
+            if in_port.locked() or out_port.locked():
+                name = [p.name() for p in [in_port, out_port] if p.locked()][0]
+                raise PortError(
+                    'Can\'t disconnect port because "{}" is locked.'
+                    .format(name))
+            disconnected[(in_port, out_port)] = None
+
+        disconnected = list(disconnected)
+        if not disconnected:
+            return []
+
+        undo_cmd = PortConnectionsChangedCmd(
+            self, disconnected=disconnected, emit_signal=emit_signal
+        )
+        if push_undo:
+            undo_cmd.setText('disconnect ports')
+            self._undo_stack.push(undo_cmd)
+        else:
+            undo_cmd.redo()
+        return disconnected
 
     def all_nodes(self):
         """
@@ -1583,33 +2119,71 @@ class NodeGraph(QtCore.QObject):
             nodes.append(node)
         return nodes
 
+    def _set_selection(self, selected, deselected, text, push_undo=True):
+        """
+        (De)select the nodes with a single undo command.
+
+        Args:
+            selected (list[NodeGraphQt.BaseNode]): nodes to select.
+            deselected (list[NodeGraphQt.BaseNode]): nodes to deselect.
+            text (str): undo command label.
+            push_undo (bool): register the command to the undo stack.
+        """
+        if not (selected or deselected):
+            return
+        undo_cmd = NodesSelectedCmd(self, selected, deselected)
+        if push_undo:
+            undo_cmd.setText(text)
+            self._undo_stack.push(undo_cmd)
+        else:
+            undo_cmd.redo()
+
+    def select_nodes(self, nodes, selected=True, push_undo=True):
+        """
+        Select or deselect the nodes in one go, the change is registered as
+        a single undo command and the
+        :attr:`NodeGraph.node_selection_changed` signal is emitted once.
+
+        See Also:
+            :meth:`NodeObject.set_selected`
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): list of nodes.
+            selected (bool): True to select the nodes.
+            push_undo (bool): register the command to the undo stack.
+                (default: True)
+        """
+        current = set(self._viewer.selected_nodes())
+        nodes = [n for n in nodes if (n.view in current) != selected]
+        if selected:
+            text = 'select ({}) nodes'.format(len(nodes))
+            self._set_selection(nodes, [], text, push_undo)
+        else:
+            text = 'deselect ({}) nodes'.format(len(nodes))
+            self._set_selection([], nodes, text, push_undo)
+
     def select_all(self):
         """
         Select all nodes in the node graph.
         """
-        self._undo_stack.beginMacro('select all')
-        [node.set_selected(True) for node in self.all_nodes()]
-        self._undo_stack.endMacro()
+        current = set(self._viewer.selected_nodes())
+        nodes = [n for n in self.all_nodes() if n.view not in current]
+        self._set_selection(nodes, [], 'select all')
 
     def clear_selection(self):
         """
         Clears the selection in the node graph.
         """
-        self._undo_stack.beginMacro('clear selection')
-        [node.set_selected(False) for node in self.all_nodes()]
-        self._undo_stack.endMacro()
+        self._set_selection([], self.selected_nodes(), 'clear selection')
 
     def invert_selection(self):
         """
         Inverts the current node selection.
         """
-        if not self.selected_nodes():
-            self.select_all()
-            return
-        self._undo_stack.beginMacro('invert selection')
-        for node in self.all_nodes():
-            node.set_selected(not node.selected())
-        self._undo_stack.endMacro()
+        current = set(self._viewer.selected_nodes())
+        selected = [n for n in self.all_nodes() if n.view not in current]
+        self._set_selection(selected, self.selected_nodes(),
+                            'invert selection')
 
     def get_node_by_id(self, node_id=None):
         """
@@ -1632,9 +2206,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             NodeGraphQt.NodeObject: node object.
         """
-        for node_id, node in self._model.nodes.items():
-            if node.name() == name:
-                return node
+        node_id = self._model.get_node_id_by_name(name)
+        return self._model.nodes.get(node_id)
 
     def get_nodes_by_type(self, node_type):
         """
@@ -1659,25 +2232,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             str: unique node name.
         """
-        name = ' '.join(name.split())
-        node_names = [n.name() for n in self.all_nodes()]
-        if name not in node_names:
-            return name
-
-        regex = re.compile(r'\w+ (\d+)$')
-        search = regex.search(name)
-        if not search:
-            for x in range(1, len(node_names) + 2):
-                new_name = '{} {}'.format(name, x)
-                if new_name not in node_names:
-                    return new_name
-
-        version = search.group(1)
-        name = name[:len(version) * -1].strip()
-        for x in range(1, len(node_names) + 2):
-            new_name = '{} {}'.format(name, x)
-            if new_name not in node_names:
-                return new_name
+        return self._model.get_unique_node_name(name)
 
     def current_session(self):
         """
@@ -1693,17 +2248,8 @@ class NodeGraph(QtCore.QObject):
         Clears the current node graph session.
         """
         nodes = self.all_nodes()
-        for n in nodes:
-            if isinstance(n, BaseNode):
-                for p in n.input_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False)
-                    p.clear_connections()
-                for p in n.output_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False)
-                    p.clear_connections()
-        self._undo_stack.push(NodesRemovedCmd(self, nodes))
+        connections, locked_ports = self._structure_snapshot(nodes)
+        StructureRemovedCmd(self, connections, locked_ports, nodes).redo()
         self._undo_stack.clear()
         self._model.session = ''
 
@@ -1740,6 +2286,11 @@ class NodeGraph(QtCore.QObject):
             node_dict = n.model.to_dict
             nodes_data.update(node_dict)
 
+        # connections are keyed by (out_node, out_port, in_node, in_port) so
+        # each pipe is only serialized once, the order of the serialized
+        # connections follows the order they're first found in.
+        connection_keys = set()
+
         for n_id, n_data in nodes_data.items():
             serial_data['nodes'][n_id] = n_data
 
@@ -1750,41 +2301,60 @@ class NodeGraph(QtCore.QObject):
             for pname, conn_data in inputs.items():
                 for conn_id, prt_names in conn_data.items():
                     for conn_prt in prt_names:
-                        pipe = {
+                        key = (conn_id, conn_prt, n_id, pname)
+                        if key in connection_keys:
+                            continue
+                        connection_keys.add(key)
+                        serial_data['connections'].append({
                             PortTypeEnum.IN.value: [n_id, pname],
                             PortTypeEnum.OUT.value: [conn_id, conn_prt]
-                        }
-                        if pipe not in serial_data['connections']:
-                            serial_data['connections'].append(pipe)
+                        })
 
             for pname, conn_data in outputs.items():
                 for conn_id, prt_names in conn_data.items():
                     for conn_prt in prt_names:
-                        pipe = {
+                        key = (n_id, pname, conn_id, conn_prt)
+                        if key in connection_keys:
+                            continue
+                        connection_keys.add(key)
+                        serial_data['connections'].append({
                             PortTypeEnum.OUT.value: [n_id, pname],
                             PortTypeEnum.IN.value: [conn_id, conn_prt]
-                        }
-                        if pipe not in serial_data['connections']:
-                            serial_data['connections'].append(pipe)
+                        })
 
         if not serial_data['connections']:
             serial_data.pop('connections')
 
         return serial_data
 
-    def _deserialize(self, data, relative_pos=False, pos=None):
+    def _deserialize(self, data, relative_pos=False, pos=None,
+                     push_undo=True, node_map=None):
         """
         deserialize node data.
         (used internally by the node graph)
 
+        Note:
+            When ``push_undo`` is ``False`` the nodes are bulk loaded, no undo
+            commands are created, port constraints are only registered once
+            per node type and the nodes are drawn in a single pass after
+            they've all been added to the scene.
+
         Args:
             data (dict): node data.
             relative_pos (bool): position node relative to the cursor.
             pos (tuple or list): custom x, y position.
+            push_undo (bool): register the commands to the undo stack.
+                (default: True)
+            node_map (dict): {serialized node id: node} used to look up the
+                connected nodes built by a previous call, the nodes built
+                here are added to it. (used when loading in chunks)
 
         Returns:
             list[NodeGraphQt.Nodes]: list of node instances.
         """
+        if node_map is None:
+            node_map = {}
+
         # update node graph properties.
         for attr_name, attr_value in data.get('graph', {}).items():
             if attr_name == 'layout_direction':
@@ -1804,8 +2374,16 @@ class NodeGraph(QtCore.QObject):
             elif attr_name == 'reject_connection_types':
                 self.model.reject_connection_types = attr_value
 
+        # hold off the scene indexing while bulk loading.
+        scene = self._viewer.scene()
+        index_method = scene.itemIndexMethod()
+        if not push_undo:
+            scene.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+
         # build the nodes.
         nodes = {}
+        bulk_nodes = []
+        registered_types = set()
         for n_id, n_data in data.get('nodes', {}).items():
             identifier = n_data['type_']
             node = self._node_factory.create_node_instance(identifier)
@@ -1823,7 +2401,16 @@ class NodeGraph(QtCore.QObject):
                             node.view.widgets[prop].set_value(val)
 
                 nodes[n_id] = node
-                self.add_node(node, n_data.get('pos'))
+                if push_undo:
+                    self.add_node(node, n_data.get('pos'))
+                else:
+                    self._register_node_attrs(
+                        node,
+                        register_constraints=node.type_ not in registered_types
+                    )
+                    registered_types.add(node.type_)
+                    self._bulk_add_node(node, n_data.get('pos'))
+                    bulk_nodes.append(node)
 
                 if n_data.get('port_deletion_allowed', None):
                     node.set_ports({
@@ -1831,19 +2418,26 @@ class NodeGraph(QtCore.QObject):
                         'output_ports': n_data['output_ports']
                     })
 
+        # draw the bulk loaded nodes in a single pass now the ports are set.
+        for node in bulk_nodes:
+            node.view.post_init(self._viewer, node.view.xy_pos)
+            node.model.width = node.view.width
+            node.model.height = node.view.height
+        node_map.update(nodes)
+
         # build the connections.
         for connection in data.get('connections', []):
             nid, pname = connection.get('in', ('', ''))
-            in_node = nodes.get(nid) or self.get_node_by_id(nid)
+            in_node = node_map.get(nid) or self.get_node_by_id(nid)
             if not in_node:
                 continue
-            in_port = in_node.inputs().get(pname) if in_node else None
+            in_port = in_node.get_input(pname) if in_node else None
 
             nid, pname = connection.get('out', ('', ''))
-            out_node = nodes.get(nid) or self.get_node_by_id(nid)
+            out_node = node_map.get(nid) or self.get_node_by_id(nid)
             if not out_node:
                 continue
-            out_port = out_node.outputs().get(pname) if out_node else None
+            out_port = out_node.get_output(pname) if out_node else None
 
             if in_port and out_port:
                 # only connect if input port is not connected yet or input port
@@ -1852,14 +2446,21 @@ class NodeGraph(QtCore.QObject):
                 allow_connection = any([not in_port.model.connected_ports,
                                         in_port.model.multi_connection])
                 if allow_connection:
-                    self._undo_stack.push(
-                        PortConnectedCmd(in_port, out_port, emit_signal=False)
+                    undo_cmd = PortConnectedCmd(
+                        in_port, out_port, emit_signal=False
                     )
+                    if push_undo:
+                        self._undo_stack.push(undo_cmd)
+                    else:
+                        undo_cmd.redo()
 
                 # Run on_input_connected to ensure connections are fully set up
                 # after deserialization.
                 in_node.on_input_connected(in_port, out_port)
 
+        if not push_undo:
+            scene.setItemIndexMethod(index_method)
+
         node_objs = nodes.values()
         if relative_pos:
             self._viewer.move_nodes([n.view for n in node_objs])
@@ -1901,7 +2502,9 @@ class NodeGraph(QtCore.QObject):
         """
         if clear_session:
             self.clear_session()
-        self._deserialize(layout_data)
+        # the undo stack is cleared afterwards so we bulk load the session
+        # without creating any undo commands.
+        self._deserialize(layout_data, push_undo=not clear_undo_stack)
         self.clear_selection()
         if clear_undo_stack:
             self._undo_stack.clear()
@@ -1910,12 +2513,23 @@ class NodeGraph(QtCore.QObject):
         """
         Saves the current node graph session layout to a `JSON` formatted file.
 
+        Note:
+            If the file path has the ``".ngb"`` extension the session is
+            saved in the compact binary format instead.
+            (see :func:`NodeGraphQt.base.session_format.convert_session_file`
+            to convert between the formats)
+
         Args:
             file_path (str): path to the saved node layout.
         """
         serialized_data = self.serialize_session()
         file_path = file_path.strip()
 
+        if is_binary_session(file_path):
+            write_binary_session(serialized_data, file_path)
+            self._model.session = file_path
+            return
+
         # Convert non-serializable objects like set and PosixPath
         cleaned_data = convert_non_serializable(serialized_data)
 
@@ -1971,8 +2585,11 @@ class NodeGraph(QtCore.QObject):
             raise IOError('file does not exist: {}'.format(file_path))
 
         try:
-            with open(file_path) as data_file:
-                layout_data = json.load(data_file)
+            if is_binary_session(file_path):
+                layout_data = read_binary_session(file_path)
+            else:
+                with open(file_path) as data_file:
+                    layout_data = json.load(data_file)
         except Exception as e:
             layout_data = None
             print('Cannot read data from file.\n{}'.format(e))
@@ -1989,6 +2606,43 @@ class NodeGraph(QtCore.QObject):
 
         self.session_changed.emit(file_path)
 
+    def load_session_incremental(self, file_path, clear_session=True,
+                                 chunk_size=200, progress_callback=None):
+        """
+        Load a node graph session file in chunks from the Qt event loop so
+        large sessions are loaded progressively without blocking the UI.
+
+        The ``JSON`` session nodes & connections are parsed one at a time
+        while loading instead of reading the whole file upfront.
+
+        See Also:
+            :meth:`NodeGraph.load_session`,
+            :class:`NodeGraphQt.base.session_loader.SessionLoader`
+
+        Args:
+            file_path (str): path to the serialized layout file.
+            clear_session (bool): clear the current session before loading.
+            chunk_size (int): number of nodes or connections built per chunk.
+            progress_callback (function): called after each chunk with the
+                loaded and total file size in bytes.
+
+        Returns:
+            NodeGraphQt.base.session_loader.SessionLoader: the session loader
+                to monitor the progress or cancel the load.
+        """
+        # a running load is rolled back before the new load takes its
+        # snapshot of the node graph.
+        if self._session_loader and self._session_loader.is_running():
+            self._session_loader.cancel()
+        self._session_loader = SessionLoader(
+            self, file_path,
+            clear_session=clear_session,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback
+        )
+        self._session_loader.start()
+        return self._session_loader
+
     def copy_nodes(self, nodes=None):
         """
         Copy nodes to the clipboard as a JSON formatted ``str``.
@@ -2038,29 +2692,15 @@ class NodeGraph(QtCore.QObject):
         """
         nodes = nodes or self.selected_nodes()
         self.copy_nodes(nodes)
-        self._undo_stack.beginMacro('cut nodes')
-
         for node in nodes:
-            if isinstance(node, BaseNode):
-                for p in node.input_ports():
-                    if p.locked():
-                        p.set_locked(False,
-                                     connected_ports=False,
-                                     push_undo=True)
-                    p.clear_connections()
-                for p in node.output_ports():
-                    if p.locked():
-                        p.set_locked(False,
-                                     connected_ports=False,
-                                     push_undo=True)
-                    p.clear_connections()
-
             # collapse group node before removing.
             if isinstance(node, GroupNode) and node.is_expanded:
                 node.collapse()
 
-        self._undo_stack.push(NodesRemovedCmd(self, nodes))
-        self._undo_stack.endMacro()
+        connections, locked_ports = self._structure_snapshot(nodes)
+        undo_cmd = StructureRemovedCmd(self, connections, locked_ports, nodes)
+        undo_cmd.setText('cut nodes')
+        self._undo_stack.push(undo_cmd)
 
     def paste_nodes(self):
         """
@@ -2084,7 +2724,7 @@ class NodeGraph(QtCore.QObject):
         self._undo_stack.beginMacro('pasted nodes')
         self.clear_selection()
         nodes = self._deserialize(serial_data, relative_pos=True)
-        [n.set_selected(True) for n in nodes]
+        self.select_nodes(nodes)
         self._undo_stack.endMacro()
         return nodes
 
@@ -2109,7 +2749,7 @@ class NodeGraph(QtCore.QObject):
         for n in new_nodes:
             x, y = n.pos()
             n.set_pos(x + offset, y + offset)
-            n.set_property('selected', True)
+        self.select_nodes(new_nodes)
 
         self._undo_stack.endMacro()
         return new_nodes
@@ -2164,37 +2804,33 @@ class NodeGraph(QtCore.QObject):
     # auto layout node functions.
     # --------------------------------------------------------------------------
 
-    @staticmethod
-    def _update_node_rank(node, nodes_rank, down_stream=True):
+    def _connected_node_ids(self, node, down_stream=True):
         """
-        Recursive function for updating the node ranking.
+        Returns the ids of the nodes connected to the node, read from the
+        port models.
 
         Args:
-            node (NodeGraphQt.BaseNode): node to start from.
-            nodes_rank (dict): node ranking object to be updated.
-            down_stream (bool): true to rank down stram.
-        """
-        if down_stream:
-            node_values = node.connected_output_nodes().values()
-        else:
-            node_values = node.connected_input_nodes().values()
-
-        connected_nodes = set()
-        for nodes in node_values:
-            connected_nodes.update(nodes)
+            node (NodeGraphQt.NodeObject): node object.
+            down_stream (bool): true for the down stream connected nodes.
 
-        rank = nodes_rank[node] + 1
-        for n in connected_nodes:
-            if n in nodes_rank:
-                nodes_rank[n] = max(nodes_rank[n], rank)
-            else:
-                nodes_rank[n] = rank
-            NodeGraph._update_node_rank(n, nodes_rank, down_stream)
+        Returns:
+            list[str]: connected node ids.
+        """
+        port_models = node.model.outputs if down_stream else node.model.inputs
+        node_ids = {}
+        for port_model in port_models.values():
+            for node_id, port_names in port_model.connected_ports.items():
+                if port_names and node_id in self._model.nodes:
+                    node_ids[node_id] = None
+        return list(node_ids)
 
-    @staticmethod
-    def _compute_node_rank(nodes, down_stream=True):
+    def _compute_node_rank(self, nodes, down_stream=True):
         """
-        Compute the ranking of nodes.
+        Compute the ranking of nodes with a longest path layering.
+
+        Note:
+            If the nodes are in a cycle the cycle is broken at the
+            first visited node that is still waiting on a ranked node.
 
         Args:
             nodes (list[NodeGraphQt.BaseNode]): nodes to start ranking from.
@@ -2203,13 +2839,51 @@ class NodeGraph(QtCore.QObject):
         Returns:
             dict: {NodeGraphQt.BaseNode: node_rank, ...}
         """
-        nodes_rank = {}
-        for node in nodes:
-            nodes_rank[node] = 0
-            NodeGraph._update_node_rank(node, nodes_rank, down_stream)
+        # collect the nodes reachable from the start nodes.
+        adjacency = {}
+        visited = list(dict.fromkeys(nodes))
+        in_degree = {n: 0 for n in visited}
+        idx = 0
+        while idx < len(visited):
+            node = visited[idx]
+            idx += 1
+            adjacency[node] = []
+            for node_id in self._connected_node_ids(node, down_stream):
+                connected_node = self._model.nodes[node_id]
+                adjacency[node].append(connected_node)
+                if connected_node not in in_degree:
+                    in_degree[connected_node] = 0
+                    visited.append(connected_node)
+                in_degree[connected_node] += 1
+
+        nodes_rank = {n: 0 for n in nodes}
+        queue = deque(n for n in visited if in_degree[n] == 0)
+        ranked = set()
+        cycle_idx = 0
+        while len(ranked) < len(visited):
+            if not queue:
+                # break the cycle.
+                while visited[cycle_idx] in ranked:
+                    cycle_idx += 1
+                queue.append(visited[cycle_idx])
+            node = queue.popleft()
+            if node in ranked:
+                continue
+            ranked.add(node)
+            rank = nodes_rank.setdefault(node, 0) + 1
+            for connected_node in adjacency[node]:
+                if connected_node in ranked:
+                    continue
+                nodes_rank[connected_node] = max(
+                    nodes_rank.get(connected_node, 0), rank
+                )
+                in_degree[connected_node] -= 1
+                if in_degree[connected_node] == 0:
+                    queue.append(connected_node)
         return nodes_rank
 
-    def auto_layout_nodes(self, nodes=None, down_stream=True, start_nodes=None):
+    def auto_layout_nodes(self, nodes=None, down_stream=True, start_nodes=None,
+                          layout_engine=None):
         """
         Auto layout the nodes in the node graph.
 
@@ -2217,15 +2891,18 @@ class NodeGraph(QtCore.QObject):
             If the node graph is acyclic then the ``start_nodes`` will need
             to be specified.
 
+        See Also:
+            :class:`NodeGraphQt.LayeredNodeLayout`
+
         Args:
             nodes (list[NodeGraphQt.BaseNode]): list of nodes to auto layout
                 if nodes is None then all nodes is layed out.
             down_stream (bool): false to layout up stream.
             start_nodes (list[NodeGraphQt.BaseNode]):
                 list of nodes to start the auto layout from (Optional).
+            layout_engine (NodeGraphQt.LayeredNodeLayout): layout engine used
+                to compute the node positions (Optional).
         """
-        self.begin_undo('Auto Layout Nodes')
-
         nodes = nodes or self.all_nodes()
 
         # filter out the backdrops.
@@ -2235,69 +2912,51 @@ class NodeGraph(QtCore.QObject):
         filtered_nodes = [n for n in nodes if not isinstance(n, BackdropNode)]
 
         start_nodes = start_nodes or []
-        if down_stream:
-            start_nodes += [
-                n for n in filtered_nodes
-                if not any(n.connected_input_nodes().values())
-            ]
-        else:
-            start_nodes += [
-                n for n in filtered_nodes
-                if not any(n.connected_output_nodes().values())
-            ]
+        start_nodes += [
+            n for n in filtered_nodes
+            if not self._connected_node_ids(n, not down_stream)
+        ]
 
         if not start_nodes:
             return
 
-        node_views = [n.view for n in nodes]
-        nodes_center_0 = self.viewer().nodes_rect_center(node_views)
+        nodes_rank = self._compute_node_rank(start_nodes, down_stream)
+        edges = []
+        for node in nodes_rank:
+            for node_id in self._connected_node_ids(node, down_stream=True):
+                connected_node = self._model.nodes[node_id]
+                if connected_node in nodes_rank:
+                    edges.append((node, connected_node))
+
+        layout_engine = layout_engine or LayeredNodeLayout()
+        positions = layout_engine.compute_positions(
+            nodes_rank, edges, self._viewer.get_layout_direction(), down_stream
+        )
+        if not positions:
+            return
 
-        nodes_rank = NodeGraph._compute_node_rank(start_nodes, down_stream)
+        def rect_center(node_positions):
+            left = min(x for n, (x, y) in node_positions)
+            top = min(y for n, (x, y) in node_positions)
+            right = max(x + n.view.width for n, (x, y) in node_positions)
+            bottom = max(y + n.view.height for n, (x, y) in node_positions)
+            return (left + right) * 0.5, (top + bottom) * 0.5
 
-        rank_map = {}
-        for node, rank in nodes_rank.items():
-            if rank in rank_map:
-                rank_map[rank].append(node)
-            else:
-                rank_map[rank] = [node]
+        # keep the nodes centered on their previous location.
+        center_0 = rect_center([(n, n.pos()) for n in positions])
+        center_1 = rect_center(positions.items())
+        dx = center_0[0] - center_1[0]
+        dy = center_0[1] - center_1[1]
 
-        node_layout_direction = self._viewer.get_layout_direction()
+        self.begin_undo('Auto Layout Nodes')
 
-        if node_layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
-            current_x = 0
-            node_height = 120
-            for rank in sorted(range(len(rank_map)), reverse=not down_stream):
-                ranked_nodes = rank_map[rank]
-                max_width = max([node.view.width for node in ranked_nodes])
-                current_x += max_width
-                current_y = 0
-                for idx, node in enumerate(ranked_nodes):
-                    dy = max(node_height, node.view.height)
-                    current_y += 0 if idx == 0 else dy
-                    node.set_pos(current_x, current_y)
-                    current_y += dy * 0.5 + 10
-
-                current_x += max_width * 0.5 + 100
-        elif node_layout_direction is LayoutDirectionEnum.VERTICAL.value:
-            current_y = 0
-            node_width = 250
-            for rank in sorted(range(len(rank_map)), reverse=not down_stream):
-                ranked_nodes = rank_map[rank]
-                max_height = max([node.view.height for node in ranked_nodes])
-                current_y += max_height
-                current_x = 0
-                for idx, node in enumerate(ranked_nodes):
-                    dx = max(node_width, node.view.width)
-                    current_x += 0 if idx == 0 else dx
-                    node.set_pos(current_x, current_y)
-                    current_x += dx * 0.5 + 10
-
-                current_y += max_height * 0.5 + 100
-
-        nodes_center_1 = self.viewer().nodes_rect_center(node_views)
-        dx = nodes_center_0[0] - nodes_center_1[0]
-        dy = nodes_center_0[1] - nodes_center_1[1]
-        [n.set_pos(n.x_pos() + dx, n.y_pos() + dy) for n in nodes]
+        # the node positions are applied with a single move command.
+        undo_cmd = NodesMovedCmd(self, {
+            node.id: ([x + dx, y + dy], node.pos())
+            for node, (x, y) in positions.items()
+        })
+        undo_cmd.setText('auto layout nodes')
+        self._undo_stack.push(undo_cmd)
 
         # wrap the backdrop nodes.
         for backdrop, contained_nodes in backdrops.items():
@@ -2656,7 +3315,8 @@ class SubGraph(NodeGraph):
 
         return input_nodes, output_nodes
 
-    def _deserialize(self, data, relative_pos=False, pos=None):
+    def _deserialize(self, data, relative_pos=False, pos=None,
+                     push_undo=True):
         """
         deserialize node data.
         (used internally by the node graph)
@@ -2665,6 +3325,8 @@ class SubGraph(NodeGraph):
             data (dict): node data.
             relative_pos (bool): position node relative to the cursor.
             pos (tuple or list): custom x, y position.
+            push_undo (bool): register the commands to the undo stack.
+                (default: True)
 
         Returns:
             list[NodeGraphQt.Nodes]: list of node instances.
@@ -2721,18 +3383,22 @@ class SubGraph(NodeGraph):
             in_node = nodes.get(nid)
             if not in_node:
                 continue
-            in_port = in_node.inputs().get(pname) if in_node else None
+            in_port = in_node.get_input(pname) if in_node else None
 
             nid, pname = connection.get('out', ('', ''))
             out_node = nodes.get(nid)
             if not out_node:
                 continue
-            out_port = out_node.outputs().get(pname) if out_node else None
+            out_port = out_node.get_output(pname) if out_node else None
 
             if in_port and out_port:
-                self._undo_stack.push(
-                    PortConnectedCmd(in_port, out_port, emit_signal=False)
+                undo_cmd = PortConnectedCmd(
+                    in_port, out_port, emit_signal=False
                 )
+                if push_undo:
+                    self._undo_stack.push(undo_cmd)
+                else:
+                    undo_cmd.redo()
 
         node_objs = list(nodes.values())
         if relative_pos:
@@ -0,0 +1,285 @@
+#!/usr/bin/python
+from NodeGraphQt.constants import LayoutDirectionEnum
+
+
+class _DummyNode(object):
+    """
+    Place holder used to route a connection that spans more than one rank
+    through the ranks in between. (only used while ordering the ranks)
+    """
+
+    width = 0.0
+    height = 0.0
+
+
+class LayeredNodeLayout(object):
+    """
+    The ``LayeredNodeLayout`` is the default layout engine used by
+    :meth:`NodeGraph.auto_layout_nodes` it arranges the nodes in layers
+    (`"Sugiyama"` style) in 3 steps:
+
+    1. each node rank is used as the node layer.
+    2. the nodes in each layer are re-ordered by the barycenter of their
+       connected nodes to reduce the number of crossing pipes.
+    3. the node positions are assigned from the node width & height.
+
+    .. inheritance-diagram:: NodeGraphQt.LayeredNodeLayout
+        :parts: 1
+
+    example for using a custom layout engine.
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt import NodeGraph, LayeredNodeLayout
+
+        class MyLayout(LayeredNodeLayout):
+
+            def order_layers(self, layers, edges):
+                # keep the nodes in their rank order.
+                return layers
+
+        node_graph = NodeGraph()
+        node_graph.auto_layout_nodes(layout_engine=MyLayout())
+
+    Args:
+        sweeps (int): max number of up & down sweeps used to reduce crossings.
+        node_spacing (float): spacing between the nodes in the same layer.
+        layer_spacing (float): spacing between the layers.
+    """
+
+    def __init__(self, sweeps=8, node_spacing=40.0, layer_spacing=100.0):
+        self.sweeps = sweeps
+        self.node_spacing = node_spacing
+        self.layer_spacing = layer_spacing
+
+    def __repr__(self):
+        return '<{}() object at {}>'.format(
+            self.__class__.__name__, hex(id(self)))
+
+    @staticmethod
+    def build_layers(nodes_rank, edges):
+        """
+        Group the nodes by rank and split up the connections that span more
+        than one rank with dummy nodes.
+
+        Args:
+            nodes_rank (dict): {NodeGraphQt.BaseNode: node_rank, ...}
+            edges (list[tuple]): list of ``(upstream_node, downstream_node)``.
+
+        Returns:
+            tuple(list[list], list[tuple]): layers and the layered edges.
+        """
+        layers = [[] for _ in range(max(nodes_rank.values()) + 1)]
+        for node, rank in nodes_rank.items():
+            layers[rank].append(node)
+
+        layer_edges = []
+        for src, trg in edges:
+            src_rank, trg_rank = nodes_rank[src], nodes_rank[trg]
+            # edges going back up the ranks are from a cycle so we skip them.
+            if trg_rank <= src_rank:
+                continue
+            for rank in range(src_rank + 1, trg_rank):
+                dummy = _DummyNode()
+                layers[rank].append(dummy)
+                layer_edges.append((src, dummy))
+                src = dummy
+            layer_edges.append((src, trg))
+        return layers, layer_edges
+
+    def order_layers(self, layers, edges):
+        """
+        Re-order the nodes in each layer with the barycenter heuristic,
+        sweeping down and up the layers to reduce the edge crossings.
+
+        Args:
+            layers (list[list]): nodes grouped by layer.
+            edges (list[tuple]): list of ``(upstream_node, downstream_node)``
+                between adjacent layers.
+
+        Returns:
+            list[list]: re-ordered layers.
+        """
+        upstream = {}
+        downstream = {}
+        for src, trg in edges:
+            downstream.setdefault(src, []).append(trg)
+            upstream.setdefault(trg, []).append(src)
+
+        def sort_layer(layer, neighbors, order):
+            barycenters = {}
+            for idx, node in enumerate(layer):
+                connected = neighbors.get(node)
+                if connected:
+                    barycenters[node] = (
+                        sum(order[n] for n in connected) / len(connected)
+                    )
+                else:
+                    # unconnected nodes keep their current position.
+                    barycenters[node] = idx
+            layer.sort(key=lambda n: barycenters[n])
+
+        order = {}
+        for layer in layers:
+            order.update({n: i for i, n in enumerate(layer)})
+
+        best_layers = [list(layer) for layer in layers]
+        best_crossings = self.count_crossings(layers, downstream, order)
+        for _ in range(self.sweeps):
+            if best_crossings == 0:
+                break
+            for layer in layers[1:]:
+                sort_layer(layer, upstream, order)
+                order.update({n: i for i, n in enumerate(layer)})
+            for layer in reversed(layers[:-1]):
+                sort_layer(layer, downstream, order)
+                order.update({n: i for i, n in enumerate(layer)})
+
+            # stop sweeping once the crossings stop improving.
+            crossings = self.count_crossings(layers, downstream, order)
+            if crossings >= best_crossings:
+                break
+            best_crossings = crossings
+            best_layers = [list(layer) for layer in layers]
+        return best_layers
+
+    @staticmethod
+    def count_crossings(layers, downstream, order):
+        """
+        Count the edge crossings between the adjacent layers.
+
+        Args:
+            layers (list[list]): nodes grouped by layer.
+            downstream (dict): {node: [downstream_node, ...], ...}
+            order (dict): {node: index_in_layer, ...}
+
+        Returns:
+            int: number of edge crossings.
+        """
+        crossings = 0
+        for layer in layers[:-1]:
+            # edges sorted by the upstream node then the downstream node,
+            # each edge crosses every previous edge with a larger target.
+            targets = []
+            for node in layer:
+                targets += sorted(order[n] for n in downstream.get(node, []))
+            tree_size = max(targets) + 1 if targets else 0
+            tree = [0] * (tree_size + 1)
+            for count, target in enumerate(targets):
+                idx = target + 1
+                smaller_or_equal = 0
+                while idx > 0:
+                    smaller_or_equal += tree[idx]
+                    idx -= idx & -idx
+                crossings += count - smaller_or_equal
+                idx = target + 1
+                while idx <= tree_size:
+                    tree[idx] += 1
+                    idx += idx & -idx
+        return crossings
+
+    def assign_positions(self, layers, edges, layout_direction):
+        """
+        Assign the node center positions, each node is placed as close as
+        possible to the average position of its upstream nodes.
+
+        Args:
+            layers (list[list]): ordered nodes grouped by layer.
+            edges (list[tuple]): list of ``(upstream_node, downstream_node)``
+                between adjacent layers.
+            layout_direction (int): node graph layout direction.
+
+        Returns:
+            dict: {node: (x, y), ...} node center positions.
+        """
+        vertical = layout_direction is LayoutDirectionEnum.VERTICAL.value
+
+        def layer_size(node):
+            return node.view.height if vertical else node.view.width
+
+        def node_size(node):
+            if isinstance(node, _DummyNode):
+                return 0.0
+            return node.view.width if vertical else node.view.height
+
+        upstream = {}
+        for src, trg in edges:
+            upstream.setdefault(trg, []).append(src)
+
+        offsets = {}
+        layer_pos = 0.0
+        positions = {}
+        for layer in layers:
+            max_size = max([
+                layer_size(n) for n in layer if not isinstance(n, _DummyNode)
+            ] or [0.0])
+            layer_pos += max_size * 0.5
+
+            # place the nodes top to bottom without overlapping.
+            placed = []
+            prev_end = None
+            for node in layer:
+                size = node_size(node)
+                connected = upstream.get(node)
+                target = None
+                if connected:
+                    target = sum(offsets[n] for n in connected) / len(connected)
+                pos = target if target is not None else 0.0
+                if prev_end is not None:
+                    pos = max(pos, prev_end + self.node_spacing + size * 0.5)
+                offsets[node] = pos
+                prev_end = pos + size * 0.5
+                placed.append((node, target))
+
+            # shift the layer back towards the upstream nodes.
+            deltas = [t - offsets[n] for n, t in placed if t is not None]
+            if deltas:
+                shift = sum(deltas) / len(deltas)
+            else:
+                first, last = layer[0], layer[-1]
+                shift = -0.5 * (
+                    (offsets[first] - node_size(first) * 0.5) +
+                    (offsets[last] + node_size(last) * 0.5)
+                )
+            for node in layer:
+                offsets[node] += shift
+                if isinstance(node, _DummyNode):
+                    continue
+                if vertical:
+                    positions[node] = (offsets[node], layer_pos)
+                else:
+                    positions[node] = (layer_pos, offsets[node])
+
+            layer_pos += max_size * 0.5 + self.layer_spacing
+        return positions
+
+    def compute_positions(self, nodes_rank, edges, layout_direction,
+                          down_stream=True):
+        """
+        Compute the node positions.
+
+        Args:
+            nodes_rank (dict): {NodeGraphQt.BaseNode: node_rank, ...}
+            edges (list[tuple]): list of ``(upstream_node, downstream_node)``.
+            layout_direction (int): node graph layout direction.
+            down_stream (bool): false if the ranks were computed up stream.
+
+        Returns:
+            dict: {NodeGraphQt.BaseNode: (x, y), ...} node top left positions.
+        """
+        if not nodes_rank:
+            return {}
+
+        if not down_stream:
+            # flip the ranks so the up stream nodes are laid out first.
+            max_rank = max(nodes_rank.values())
+            nodes_rank = {n: max_rank - r for n, r in nodes_rank.items()}
+
+        layers, layer_edges = self.build_layers(nodes_rank, edges)
+        layers = self.order_layers(layers, layer_edges)
+        centers = self.assign_positions(layers, layer_edges, layout_direction)
+        return {
+            node: (x - node.view.width * 0.5, y - node.view.height * 0.5)
+            for node, (x, y) in centers.items()
+        }
@@ -1,11 +1,13 @@
 #!/usr/bin/python
 import json
+import re
 from collections import defaultdict
 
 from NodeGraphQt.constants import (
     LayoutDirectionEnum,
     NodePropWidgetEnum,
-    PipeLayoutEnum
+    PipeLayoutEnum,
+    PortTypeEnum
 )
 from NodeGraphQt.errors import NodePropertyError
 
@@ -446,6 +448,16 @@ class NodeGraphModel(object):
     def __init__(self):
         self.__common_node_props = {}
 
+        # node name registry, "{name: node_id}" and the next numbered suffix
+        # to try for each base node name.
+        self.__node_names = {}
+        self.__node_name_suffixes = {}
+
+        # port connection index "{<port_object>: {<port_object>: None}}"
+        # forward from the output ports and reverse from the input ports.
+        self.__out_port_connections = {}
+        self.__in_port_connections = {}
+
         self.accept_connection_types = {}
         self.reject_connection_types = {}
 
@@ -507,6 +519,143 @@ class NodeGraphModel(object):
                     continue
                 common_props[prop_name].update(prop_attrs)
 
+    @staticmethod
+    def _split_node_name(name):
+        """
+        Split a node name into its base name and numbered suffix.
+        `eg.` ``"foo 2"`` returns ``("foo", 2)``
+
+        Args:
+            name (str): node name.
+
+        Returns:
+            tuple(str, int): base name and suffix (``None`` if no suffix).
+        """
+        search = re.search(r'\w+ (\d+)$', name)
+        if not search:
+            return name, None
+        version = search.group(1)
+        return name[:len(version) * -1].strip(), int(version)
+
+    def get_node_id_by_name(self, name):
+        """
+        Return the node id registered to the node name.
+
+        Args:
+            name (str): node name.
+
+        Returns:
+            str: node id or ``None`` if the name is not registered.
+        """
+        return self.__node_names.get(name)
+
+    def add_node_name(self, name, node_id):
+        """
+        Register a node name to the node name registry.
+
+        Args:
+            name (str): node name.
+            node_id (str): node id.
+        """
+        self.__node_names[name] = node_id
+
+    def remove_node_name(self, name, node_id):
+        """
+        Remove a node name from the node name registry so it can be reused.
+
+        Args:
+            name (str): node name.
+            node_id (str): node id.
+        """
+        if self.__node_names.get(name) != node_id:
+            return
+        del self.__node_names[name]
+
+        # make the freed up numbered suffix available again.
+        base_name, suffix = self._split_node_name(name)
+        next_suffix = self.__node_name_suffixes.get(base_name)
+        if suffix is not None and next_suffix and suffix < next_suffix:
+            self.__node_name_suffixes[base_name] = suffix
+
+    def get_unique_node_name(self, name):
+        """
+        Return a node name that is not in the node name registry.
+        (if the name is taken the lowest free numbered suffix is appended
+        to the base name `eg.` ``"foo 1"``)
+
+        Args:
+            name (str): node name.
+
+        Returns:
+            str: unique node name.
+        """
+        name = ' '.join(name.split())
+        if name not in self.__node_names:
+            return name
+
+        base_name, _ = self._split_node_name(name)
+        suffix = self.__node_name_suffixes.get(base_name, 1)
+        new_name = '{} {}'.format(base_name, suffix)
+        while new_name in self.__node_names:
+            suffix += 1
+            new_name = '{} {}'.format(base_name, suffix)
+        self.__node_name_suffixes[base_name] = suffix
+        return new_name
+
+    def _port_connections(self, port):
+        """
+        Return the connection index for the port type.
+
+        Args:
+            port (NodeGraphQt.Port): port object.
+
+        Returns:
+            dict: port connection index.
+        """
+        if port.type_() == PortTypeEnum.IN.value:
+            return self.__in_port_connections
+        return self.__out_port_connections
+
+    def add_port_connection(self, port1, port2):
+        """
+        Add a port connection to the port connection index.
+
+        Args:
+            port1 (NodeGraphQt.Port): port object.
+            port2 (NodeGraphQt.Port): port object.
+        """
+        self._port_connections(port1).setdefault(port1, {})[port2] = None
+        self._port_connections(port2).setdefault(port2, {})[port1] = None
+
+    def remove_port_connection(self, port1, port2):
+        """
+        Remove a port connection from the port connection index.
+
+        Args:
+            port1 (NodeGraphQt.Port): port object.
+            port2 (NodeGraphQt.Port): port object.
+        """
+        for port, connected_port in [(port1, port2), (port2, port1)]:
+            connections = self._port_connections(port)
+            connected_ports = connections.get(port)
+            if connected_ports is None:
+                continue
+            connected_ports.pop(connected_port, None)
+            if not connected_ports:
+                del connections[port]
+
+    def get_connected_ports(self, port):
+        """
+        Return the ports connected to the port from the port connection index.
+
+        Args:
+            port (NodeGraphQt.Port): port object.
+
+        Returns:
+            list[NodeGraphQt.Port]: connected ports.
+        """
+        return list(self._port_connections(port).get(port, {}))
+
     def get_node_common_properties(self, node_type):
         """
         Return all the common properties for a registered node.
@@ -9,7 +9,6 @@ from NodeGraphQt.base.commands import (
     NodeInputDisconnectedCmd
 )
 from NodeGraphQt.base.model import PortModel
-from NodeGraphQt.constants import PortTypeEnum
 from NodeGraphQt.errors import PortError
 
 
@@ -199,16 +198,10 @@ class Port(object):
         Returns:
             list[NodeGraphQt.Port]: list of connected ports.
         """
-        ports = []
         graph = self.node().graph
-        for node_id, port_names in self.model.connected_ports.items():
-            for port_name in port_names:
-                node = graph.get_node_by_id(node_id)
-                if self.type_() == PortTypeEnum.IN.value:
-                    ports.append(node.outputs()[port_name])
-                elif self.type_() == PortTypeEnum.OUT.value:
-                    ports.append(node.inputs()[port_name])
-        return ports
+        if not graph:
+            return []
+        return graph.model.get_connected_ports(self)
 
     def connect_to(self, port=None, push_undo=True, emit_signal=True):
         """
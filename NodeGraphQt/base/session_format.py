@@ -0,0 +1,342 @@
+#!/usr/bin/python
+"""
+Binary node graph session format.
+
+The binary session stores the same data as the ``JSON`` session from
+:meth:`NodeGraph.serialize_session` in a compact layout:
+
+- every string (node ids, node types, port names, property names...) is
+  stored once in a string table and referenced by index.
+- the node positions are stored as one packed array of floats.
+- the connections are stored as one table of integer indices.
+
+file layout (little endian):
+
+.. code-block:: none
+
+    header       : magic "NGQB", uint16 version
+    string table : uint32 count, [uint32 length, utf-8 bytes] * count
+    graph        : value
+    nodes        : uint32 count,
+                   uint32 node id string index * count,
+                   uint32 node type string index * count,
+                   float64 x, y position * count,
+                   value (remaining node properties) * count
+    connections  : uint32 count,
+                   uint32 (out node id, out port, in node id, in port)
+                   string index * count
+    extra        : value (any other top level session data)
+"""
+import json
+import math
+import os
+import struct
+from pathlib import PurePath
+
+BINARY_SESSION_EXT = '.ngb'
+"""File extension used for the binary session format."""
+
+_MAGIC = b'NGQB'
+_VERSION = 1
+
+_HEADER = struct.Struct('<4sH')
+_UINT = struct.Struct('<I')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+
+# value type tags.
+_NONE, _TRUE, _FALSE, _INT_TAG, _FLOAT_TAG, _STR, _LIST, _DICT, _BIG_INT = \
+    range(9)
+
+
+class _Writer(object):
+    """
+    Encodes the session data into bytes while interning the strings.
+    """
+
+    def __init__(self):
+        self.strings = {}
+        self.body = bytearray()
+
+    def string_index(self, text):
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def write_uint(self, value):
+        self.body += _UINT.pack(value)
+
+    def write_uints(self, values):
+        self.body += struct.pack('<{}I'.format(len(values)), *values)
+
+    def write_value(self, value):
+        body = self.body
+        if value is None:
+            body.append(_NONE)
+        elif value is True:
+            body.append(_TRUE)
+        elif value is False:
+            body.append(_FALSE)
+        elif isinstance(value, int):
+            if -2 ** 63 <= value < 2 ** 63:
+                body.append(_INT_TAG)
+                body += _INT.pack(value)
+            else:
+                body.append(_BIG_INT)
+                body += _UINT.pack(self.string_index(str(value)))
+        elif isinstance(value, float):
+            body.append(_FLOAT_TAG)
+            body += _FLOAT.pack(value)
+        elif isinstance(value, str):
+            body.append(_STR)
+            body += _UINT.pack(self.string_index(value))
+        elif isinstance(value, PurePath):
+            self.write_value(str(value))
+        elif isinstance(value, dict):
+            body.append(_DICT)
+            body += _UINT.pack(len(value))
+            for key, val in value.items():
+                self.write_value(key)
+                self.write_value(val)
+        elif isinstance(value, (list, tuple, set)):
+            body.append(_LIST)
+            body += _UINT.pack(len(value))
+            for val in value:
+                self.write_value(val)
+        else:
+            raise TypeError(
+                'Object of type "{}" can\'t be written to a binary session.'
+                .format(type(value).__name__))
+
+    def to_bytes(self):
+        data = bytearray(_HEADER.pack(_MAGIC, _VERSION))
+        data += _UINT.pack(len(self.strings))
+        for text in self.strings:
+            encoded = text.encode('utf-8')
+            data += _UINT.pack(len(encoded))
+            data += encoded
+        data += self.body
+        return bytes(data)
+
+
+class _Reader(object):
+    """
+    Decodes the session data from bytes.
+    """
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+        self.strings = []
+
+        magic, version = self.unpack(_HEADER)
+        if magic != _MAGIC:
+            raise ValueError('Not a binary node graph session.')
+        if version > _VERSION:
+            raise ValueError(
+                'Binary session version "{}" is not supported.'
+                .format(version))
+
+        for _ in range(self.read_uint()):
+            length = self.read_uint()
+            text = bytes(self.data[self.offset:self.offset + length])
+            self.strings.append(text.decode('utf-8'))
+            self.offset += length
+
+    def unpack(self, struct_obj):
+        values = struct_obj.unpack_from(self.data, self.offset)
+        self.offset += struct_obj.size
+        return values
+
+    def read_uint(self):
+        return self.unpack(_UINT)[0]
+
+    def read_array(self, fmt, count):
+        struct_fmt = '<{}{}'.format(count, fmt)
+        values = struct.unpack_from(struct_fmt, self.data, self.offset)
+        self.offset += struct.calcsize(struct_fmt)
+        return values
+
+    def read_value(self):
+        tag = self.data[self.offset]
+        self.offset += 1
+        if tag == _NONE:
+            return None
+        elif tag == _TRUE:
+            return True
+        elif tag == _FALSE:
+            return False
+        elif tag == _INT_TAG:
+            return self.unpack(_INT)[0]
+        elif tag == _FLOAT_TAG:
+            return self.unpack(_FLOAT)[0]
+        elif tag == _STR:
+            return self.strings[self.read_uint()]
+        elif tag == _BIG_INT:
+            return int(self.strings[self.read_uint()])
+        elif tag == _LIST:
+            return [self.read_value() for _ in range(self.read_uint())]
+        elif tag == _DICT:
+            value = {}
+            for _ in range(self.read_uint()):
+                key = self.read_value()
+                value[key] = self.read_value()
+            return value
+        raise ValueError('Invalid value type in binary session.')
+
+
+def is_binary_session(file_path):
+    """
+    Returns true if the file path has the binary session file extension.
+
+    Args:
+        file_path (str): session file path.
+
+    Returns:
+        bool: true if binary session.
+    """
+    return os.path.splitext(file_path)[1].lower() == BINARY_SESSION_EXT
+
+
+def dumps_binary_session(data):
+    """
+    Encode the serialized session data to bytes.
+
+    Args:
+        data (dict): serialized session data.
+
+    Returns:
+        bytes: binary session data.
+    """
+    writer = _Writer()
+    writer.write_value(data.get('graph', {}))
+
+    nodes = data.get('nodes', {})
+    node_ids = list(nodes.keys())
+    writer.write_uint(len(node_ids))
+    writer.write_uints([writer.string_index(n_id) for n_id in node_ids])
+    writer.write_uints(
+        [writer.string_index(nodes[n_id].get('type_', '')) for n_id in node_ids]
+    )
+    positions = []
+    for n_id in node_ids:
+        pos = nodes[n_id].get('pos')
+        positions += [float(pos[0]), float(pos[1])] if pos else [math.nan] * 2
+    writer.body += struct.pack('<{}d'.format(len(positions)), *positions)
+    for n_id in node_ids:
+        writer.write_value({
+            k: v for k, v in nodes[n_id].items() if k not in ('type_', 'pos')
+        })
+
+    connections = data.get('connections', [])
+    writer.write_uint(len(connections))
+    edges = []
+    for connection in connections:
+        out_id, out_port = connection['out']
+        in_id, in_port = connection['in']
+        edges += [writer.string_index(out_id), writer.string_index(out_port),
+                  writer.string_index(in_id), writer.string_index(in_port)]
+    writer.write_uints(edges)
+
+    writer.write_value({
+        k: v for k, v in data.items()
+        if k not in ('graph', 'nodes', 'connections')
+    })
+    return writer.to_bytes()
+
+
+def loads_binary_session(data):
+    """
+    Decode the serialized session data from bytes.
+
+    Args:
+        data (bytes): binary session data.
+
+    Returns:
+        dict: serialized session data.
+    """
+    reader = _Reader(data)
+    strings = reader.strings
+    session = {}
+
+    graph_data = reader.read_value()
+    if graph_data:
+        session['graph'] = graph_data
+
+    node_count = reader.read_uint()
+    node_ids = reader.read_array('I', node_count)
+    node_types = reader.read_array('I', node_count)
+    positions = reader.read_array('d', node_count * 2)
+    nodes = {}
+    for idx, str_idx in enumerate(node_ids):
+        node_data = reader.read_value()
+        node_data['type_'] = strings[node_types[idx]]
+        x, y = positions[idx * 2], positions[idx * 2 + 1]
+        if not (math.isnan(x) or math.isnan(y)):
+            node_data['pos'] = [x, y]
+        nodes[strings[str_idx]] = node_data
+    if nodes:
+        session['nodes'] = nodes
+
+    edge_count = reader.read_uint()
+    edges = reader.read_array('I', edge_count * 4)
+    connections = []
+    for idx in range(0, len(edges), 4):
+        connections.append({
+            'out': [strings[edges[idx]], strings[edges[idx + 1]]],
+            'in': [strings[edges[idx + 2]], strings[edges[idx + 3]]]
+        })
+    if connections:
+        session['connections'] = connections
+
+    session.update(reader.read_value())
+    return session
+
+
+def write_binary_session(data, file_path):
+    """
+    Write the serialized session data to a binary session file.
+
+    Args:
+        data (dict): serialized session data.
+        file_path (str): path to the binary session file.
+    """
+    with open(file_path, 'wb') as file_out:
+        file_out.write(dumps_binary_session(data))
+
+
+def read_binary_session(file_path):
+    """
+    Read the serialized session data from a binary session file.
+
+    Args:
+        file_path (str): path to the binary session file.
+
+    Returns:
+        dict: serialized session data.
+    """
+    with open(file_path, 'rb') as file_in:
+        return loads_binary_session(file_in.read())
+
+
+def convert_session_file(src_path, dst_path):
+    """
+    Convert a session file between the ``JSON`` and binary format, the
+    formats are picked from the file extensions.
+
+    Args:
+        src_path (str): path to the session file to convert.
+        dst_path (str): path to the converted session file.
+    """
+    if is_binary_session(src_path):
+        data = read_binary_session(src_path)
+    else:
+        with open(src_path) as data_file:
+            data = json.load(data_file)
+
+    if is_binary_session(dst_path):
+        write_binary_session(data, dst_path)
+    else:
+        with open(dst_path, 'w') as file_out:
+            json.dump(data, file_out, indent=2, separators=(',', ':'))
@@ -0,0 +1,391 @@
+#!/usr/bin/python
+"""
+Incremental node graph session loading.
+
+The :class:`SessionLoader` reads the ``"nodes"`` and ``"connections"``
+sections of a ``JSON`` session file one entry at a time with a small pull
+parser and builds the nodes in chunks, returning to the Qt event loop in
+between so large sessions are loaded progressively without blocking the UI.
+"""
+import codecs
+import json
+import os
+import re
+
+from PyQt5 import QtCore
+from PyQt5.QtCore import pyqtSignal
+
+from NodeGraphQt.base.session_format import (
+    is_binary_session,
+    read_binary_session
+)
+
+_WHITESPACE = re.compile(r'\s*')
+
+
+class _JsonSessionReader(object):
+    """
+    Pull parser that walks a ``JSON`` session file and yields the session
+    entries as they're read from the file.
+
+    The events yielded from :meth:`events` are:
+
+    - ``('node', (node_id, node_data))`` for each entry in ``"nodes"``.
+    - ``('connection', connection_data)`` for each item in ``"connections"``.
+    - ``(key, value)`` for any other top level entry.
+    """
+
+    def __init__(self, file_obj, read_size=65536):
+        self._file = file_obj
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self.bytes_read = 0
+
+    def _fill(self):
+        if self._eof:
+            raise ValueError('Unexpected end of session file.')
+        data = self._file.read(self._read_size)
+        self.bytes_read += len(data)
+        if not data:
+            self._eof = True
+        text = self._text_decoder.decode(data, final=self._eof)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+
+    def _peek(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ''
+            self._fill()
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(
+                'Invalid session file, expected "{}" at character {}.'
+                .format(char, self._pos))
+        self._pos += 1
+
+    def _skip_comma(self):
+        if self._peek() == ',':
+            self._pos += 1
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # value is incomplete so we read more of the file.
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            # a number at the end of the buffer may continue in the file.
+            if end == len(self._buffer) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def events(self):
+        """
+        Yields the session entries in the order they're stored in the file.
+
+        Returns:
+            generator: ``(event, value)`` tuples.
+        """
+        self._expect('{')
+        while self._peek() not in ('}', ''):
+            key = self._value()
+            self._expect(':')
+            if key == 'nodes' and self._peek() == '{':
+                self._expect('{')
+                while self._peek() != '}':
+                    node_id = self._value()
+                    self._expect(':')
+                    yield 'node', (node_id, self._value())
+                    self._skip_comma()
+                self._expect('}')
+            elif key == 'connections' and self._peek() == '[':
+                self._expect('[')
+                while self._peek() != ']':
+                    yield 'connection', self._value()
+                    self._skip_comma()
+                self._expect(']')
+            else:
+                yield key, self._value()
+            self._skip_comma()
+        self._expect('}')
+
+
+def _iter_session_data(data):
+    """
+    Yields the entries of an already loaded session in the same format as
+    :meth:`_JsonSessionReader.events`.
+
+    Args:
+        data (dict): serialized session data.
+
+    Returns:
+        generator: ``(event, value)`` tuples.
+    """
+    for key, value in data.items():
+        if key == 'nodes':
+            for node_item in value.items():
+                yield 'node', node_item
+        elif key == 'connections':
+            for connection in value:
+                yield 'connection', connection
+        else:
+            yield key, value
+
+
+class SessionLoader(QtCore.QObject):
+    """
+    The ``SessionLoader`` loads a session file into the node graph a chunk of
+    nodes at a time from the Qt event loop, the loader is created and
+    started from :meth:`NodeGraph.load_session_incremental`.
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt import NodeGraph
+
+        def on_progress(loaded, total):
+            print('loaded {} of {} bytes'.format(loaded, total))
+
+        node_graph = NodeGraph()
+        loader = node_graph.load_session_incremental(
+            '/path/to/session.json', progress_callback=on_progress
+        )
+        loader.finished.connect(node_graph.fit_to_selection)
+
+        # stop loading and restore the graph to how it was.
+        loader.cancel()
+
+    Note:
+        The ``.ngb`` binary sessions are read in one go as they're compact
+        but the nodes are still built in chunks.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph to load the session into.
+        file_path (str): path to the serialized layout file.
+        clear_session (bool): clear the current session before loading.
+        chunk_size (int): number of nodes or connections built per chunk.
+        progress_callback (function): called after each chunk with the
+            loaded and total file size in bytes.
+    """
+
+    progress_changed = pyqtSignal(int, int)
+    """
+    Signal is triggered after each chunk has been loaded.
+
+    :parameters: int, int
+    :emits: loaded bytes, total bytes
+    """
+    finished = pyqtSignal()
+    """
+    Signal is triggered when the session has finished loading.
+    """
+    cancelled = pyqtSignal()
+    """
+    Signal is triggered when loading has been cancelled and the node graph
+    has been rolled back.
+    """
+
+    def __init__(self, graph, file_path, clear_session=True, chunk_size=200,
+                 progress_callback=None):
+        super(SessionLoader, self).__init__()
+        self._graph = graph
+        self._file_path = file_path.strip()
+        self._clear_session = clear_session
+        self._chunk_size = max(1, chunk_size)
+        self._progress_callback = progress_callback
+
+        self._file = None
+        self._reader = None
+        self._events = None
+        self._total = 0
+        self._running = False
+
+        # chunks are loaded from a timer so a cancelled load can be stopped
+        # before its next chunk.
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._load_chunk)
+
+        self._graph_data = {}
+        self._node_map = {}
+        self._pending_connections = []
+        self._snapshot = None
+        self._prev_session = None
+
+    def __repr__(self):
+        return '<{}("{}") object at {}>'.format(
+            self.__class__.__name__, self._file_path, hex(id(self)))
+
+    @property
+    def file_path(self):
+        """
+        Returns the session file path being loaded.
+
+        Returns:
+            str: file path.
+        """
+        return self._file_path
+
+    def is_running(self):
+        """
+        Returns true if the session is still loading.
+
+        Returns:
+            bool: true if loading.
+        """
+        return self._running
+
+    def start(self):
+        """
+        Start loading the session, the first chunk is loaded the next time
+        the Qt event loop is processed.
+        """
+        if self._running:
+            return
+        if not os.path.isfile(self._file_path):
+            raise IOError('file does not exist: {}'.format(self._file_path))
+
+        self._total = os.path.getsize(self._file_path)
+        if is_binary_session(self._file_path):
+            self._events = _iter_session_data(
+                read_binary_session(self._file_path)
+            )
+        else:
+            self._file = open(self._file_path, 'rb')
+            self._reader = _JsonSessionReader(self._file)
+            self._events = self._reader.events()
+
+        self._prev_session = self._graph.model.session
+        if self._clear_session:
+            self._snapshot = self._graph.serialize_session()
+            self._graph.clear_session()
+
+        self._running = True
+        self._timer.start()
+
+    def cancel(self):
+        """
+        Stop loading the session and roll back the node graph to how it was
+        before loading started.
+        """
+        if self._running:
+            self._rollback()
+
+    def _loaded_bytes(self):
+        if self._reader:
+            return self._reader.bytes_read
+        return self._total
+
+    def _load_chunk(self):
+        """
+        Build the next chunk of nodes or connections.
+        """
+        if not self._running:
+            return
+
+        nodes = {}
+        count = 0
+        try:
+            for event, value in self._events:
+                if event == 'node':
+                    nodes[value[0]] = value[1]
+                elif event == 'connection':
+                    self._pending_connections.append(value)
+                else:
+                    self._graph_data[event] = value
+                count += 1
+                if count >= self._chunk_size:
+                    break
+            else:
+                self._close_file()
+        except Exception as e:
+            print('Cannot read data from file.\n{}'.format(e))
+            self._rollback()
+            return
+
+        try:
+            # the graph settings are applied with the chunk they're read in.
+            graph_data = self._graph_data.pop('graph', {})
+            if nodes or graph_data:
+                self._graph._deserialize(
+                    {'graph': graph_data, 'nodes': nodes},
+                    push_undo=False,
+                    node_map=self._node_map
+                )
+            nodes_read = (self._events is None or
+                          (self._node_map and not nodes))
+            if self._pending_connections and nodes_read:
+                # connections are built once the nodes section has been
+                # read.
+                self._graph._deserialize(
+                    {'connections': self._pending_connections},
+                    push_undo=False,
+                    node_map=self._node_map
+                )
+                self._pending_connections = []
+        except Exception as e:
+            print('Cannot load session data.\n{}'.format(e))
+            self._rollback()
+            return
+
+        loaded = self._loaded_bytes()
+        self.progress_changed.emit(loaded, self._total)
+        if self._progress_callback:
+            self._progress_callback(loaded, self._total)
+
+        # the load can be cancelled from the progress callbacks.
+        if not self._running:
+            return
+        if self._events is None:
+            self._finish()
+        else:
+            self._timer.start()
+
+    def _close_file(self):
+        if self._file:
+            self._file.close()
+        self._file = None
+        self._events = None
+
+    def _finish(self):
+        self._running = False
+        graph = self._graph
+        graph.clear_selection()
+        graph.undo_stack().clear()
+        graph.model.session = self._file_path
+        graph.session_changed.emit(self._file_path)
+        self.finished.emit()
+
+    def _rollback(self):
+        self._timer.stop()
+        self._close_file()
+        self._running = False
+        graph = self._graph
+        if self._clear_session:
+            graph.clear_session()
+            if self._snapshot:
+                graph.deserialize_session(self._snapshot)
+        else:
+            nodes = [n for n in self._node_map.values()
+                     if graph.get_node_by_id(n.id)]
+            graph.delete_nodes(nodes, push_undo=False)
+        graph.model.session = self._prev_session
+        self._node_map = {}
+        self._pending_connections = []
+        self.cancelled.emit()
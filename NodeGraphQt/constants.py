@@ -86,6 +86,8 @@ class ViewerEnum(Enum):
     GRID_SIZE = 50
     #: grid line color.
     GRID_COLOR = (45, 45, 45)
+    #: milliseconds between the incremental marquee selection updates.
+    SELECTION_UPDATE_INTERVAL = 16
 
 
 class ViewerNavEnum(Enum):
@@ -98,6 +100,36 @@ class ViewerNavEnum(Enum):
     #: default item color.
     ITEM_COLOR = (35, 35, 35)
 
+
+class ViewerLODEnum(Enum):
+    """
+    Node graph viewer level of detail picked from the viewer zoom scale:
+    :py:mod:`NodeGraphQt.constants.ViewerLODEnum`
+    """
+    #: draw the nodes and pipes in full detail.
+    FULL = 0
+    #: draw the nodes without port labels or widgets and the pipes straight.
+    SIMPLIFIED = 1
+    #: draw the nodes as flat rects and only the pipes of selected nodes.
+    MINIMAL = 2
+    #: viewer scale below which the simplified level of detail is used.
+    SIMPLIFIED_SCALE = 0.45
+    #: viewer scale below which the minimal level of detail is used.
+    MINIMAL_SCALE = 0.2
+
+
+class ViewerRenderEnum(Enum):
+    """
+    Node graph viewer rendering profiles:
+    :py:mod:`NodeGraphQt.constants.ViewerRenderEnum`
+    """
+    #: repaint the whole viewport on each change with cached items.
+    FULL = 0
+    #: repaint the bounding rect of the changed areas with no item caching.
+    BOUNDING_RECT = 1
+    #: repaint the changed areas picked by Qt with cached items.
+    SMART = 2
+
 # ==================================== NODE ====================================
 
 
@@ -141,6 +173,8 @@ class PortEnum(Enum):
     HOVER_BORDER_COLOR = (136, 255, 35, 255)
     #: threshold for selecting a port.
     CLICK_FALLOFF = 15.0
+    #: distance in view pixels a live connection snaps to a port.
+    SNAP_RADIUS = 40.0
 
 
 class PortTypeEnum(Enum):
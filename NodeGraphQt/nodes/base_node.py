@@ -61,6 +61,10 @@ class BaseNode(NodeObject):
         self._inputs = []
         self._outputs = []
 
+        # port name lookups {<port_name>: <port_object>}
+        self._input_map = {}
+        self._output_map = {}
+
     def update_model(self):
         """
         Update the node model from view.
@@ -369,7 +373,7 @@ class BaseNode(NodeObject):
         Returns:
             NodeGraphQt.Port: the created port object.
         """
-        if name in self.inputs().keys():
+        if name in self._input_map:
             raise PortRegistrationError(
                 'port name "{}" already registered.'.format(name))
 
@@ -389,6 +393,7 @@ class BaseNode(NodeObject):
         port.model.multi_connection = multi_input
         port.model.locked = locked
         self._inputs.append(port)
+        self._input_map[port.name()] = port
         self.model.inputs[port.name()] = port.model
         return port
 
@@ -412,7 +417,7 @@ class BaseNode(NodeObject):
         Returns:
             NodeGraphQt.Port: the created port object.
         """
-        if name in self.outputs().keys():
+        if name in self._output_map:
             raise PortRegistrationError(
                 'port name "{}" already registered.'.format(name))
 
@@ -431,6 +436,7 @@ class BaseNode(NodeObject):
         port.model.multi_connection = multi_output
         port.model.locked = locked
         self._outputs.append(port)
+        self._output_map[port.name()] = port
         self.model.outputs[port.name()] = port.model
         return port
 
@@ -448,7 +454,7 @@ class BaseNode(NodeObject):
             if port < len(self._inputs):
                 return self._inputs[port]
         elif type(port) is str:
-            return self.inputs().get(port, None)
+            return self._input_map.get(port, None)
 
     def get_output(self, port):
         """
@@ -464,7 +470,7 @@ class BaseNode(NodeObject):
             if port < len(self._outputs):
                 return self._outputs[port]
         elif type(port) is str:
-            return self.outputs().get(port, None)
+            return self._output_map.get(port, None)
 
     def delete_input(self, port):
         """
@@ -491,6 +497,7 @@ class BaseNode(NodeObject):
         if port.locked():
             raise PortError('Error: Can\'t delete a port that is locked!')
         self._inputs.remove(port)
+        self._input_map.pop(port.name())
         self._model.inputs.pop(port.name())
         self._view.delete_input(port.view)
         port.model.node = None
@@ -521,6 +528,7 @@ class BaseNode(NodeObject):
         if port.locked():
             raise PortError('Error: Can\'t delete a port that is locked!')
         self._outputs.remove(port)
+        self._output_map.pop(port.name())
         self._model.outputs.pop(port.name())
         self._view.delete_output(port.view)
         port.model.node = None
@@ -599,6 +607,8 @@ class BaseNode(NodeObject):
             port.model.node = None
         self._inputs = []
         self._outputs = []
+        self._input_map = {}
+        self._output_map = {}
         self._model.outputs = {}
         self._model.inputs = {}
 
@@ -621,7 +631,7 @@ class BaseNode(NodeObject):
         Returns:
             dict: {<port_name>: <port_object>}
         """
-        return {p.name(): p for p in self._inputs}
+        return dict(self._input_map)
 
     def input_ports(self):
         """
@@ -639,7 +649,7 @@ class BaseNode(NodeObject):
         Returns:
             dict: {<port_name>: <port_object>}
         """
-        return {p.name(): p for p in self._outputs}
+        return dict(self._output_map)
 
     def output_ports(self):
         """
@@ -5,7 +5,8 @@ from NodeGraphQt.constants import (
     Z_VAL_NODE,
     ITEM_CACHE_MODE,
     LayoutDirectionEnum,
-    NodeEnum
+    NodeEnum,
+    ViewerLODEnum
 )
 
 
@@ -36,6 +37,9 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         }
         self._width = NodeEnum.WIDTH.value
         self._height = NodeEnum.HEIGHT.value
+        self._lod = ViewerLODEnum.FULL.value
+        # viewer grid holding the node while it's culled from the scene.
+        self._cull_grid = None
 
     def __repr__(self):
         return '{}.{}(\'{}\')'.format(
@@ -57,6 +61,32 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
     def setSelected(self, selected):
         self._properties['selected'] = selected
         super(AbstractNodeItem, self).setSelected(selected)
+        if selected and self._cull_grid:
+            # selected nodes are brought back into the scene.
+            self._cull_grid.mark_dirty(self)
+
+    def itemChange(self, change, value):
+        """
+        Re-implemented to keep the viewer selected nodes up to date.
+
+        Args:
+            change (QtWidgets.QGraphicsItem.GraphicsItemChange): change.
+            value (object): change value.
+        """
+        if change == QtWidgets.QGraphicsItem.ItemSelectedHasChanged:
+            viewer = self.viewer()
+            if viewer:
+                viewer.track_node_selection(self, bool(value))
+        elif change == QtWidgets.QGraphicsItem.ItemSceneChange:
+            # the item stays selected when removed from the scene.
+            viewer = self.viewer()
+            if viewer:
+                viewer.track_node_selection(self, False)
+        elif change == QtWidgets.QGraphicsItem.ItemSceneHasChanged:
+            viewer = value.viewer() if value else None
+            if viewer and self.isSelected():
+                viewer.track_node_selection(self, True)
+        return super(AbstractNodeItem, self).itemChange(change, value)
 
     def draw_node(self):
         """
@@ -87,6 +117,45 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         """
         return
 
+    @property
+    def cull_grid(self):
+        """
+        Returns the viewer grid the node is kept in while it's culled from
+        the scene in the virtualized viewer mode.
+
+        Returns:
+            NodeGraphQt.widgets.item_index.ItemGrid: grid or None.
+        """
+        return self._cull_grid
+
+    @cull_grid.setter
+    def cull_grid(self, grid=None):
+        self._cull_grid = grid
+
+    @property
+    def lod(self):
+        """
+        Returns the level of detail the node is drawn with.
+
+        Returns:
+            int: level of detail from :attr:`NodeGraphQt.constants.ViewerLODEnum`
+        """
+        return self._lod
+
+    def set_lod(self, lod):
+        """
+        Set the level of detail the node is drawn with.
+        (this is called from the viewer when the zoom level changes.)
+
+        Args:
+            lod (int): level of detail from
+                :attr:`NodeGraphQt.constants.ViewerLODEnum`
+        """
+        if lod == self._lod:
+            return
+        self._lod = lod
+        self.update()
+
     @property
     def id(self):
         return self._properties['id']
@@ -121,6 +190,7 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
 
     @width.setter
     def width(self, width=0.0):
+        self.prepareGeometryChange()
         self._width = width
 
     @property
@@ -129,6 +199,7 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
 
     @height.setter
     def height(self, height=0.0):
+        self.prepareGeometryChange()
         self._height = height
 
     @property
@@ -206,6 +277,8 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         """
         pos = pos or [0.0, 0.0]
         self.setPos(pos[0], pos[1])
+        if self._cull_grid:
+            self._cull_grid.mark_dirty(self)
 
     @property
     def name(self):
@@ -244,6 +317,9 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         """
         remove node view from the scene.
         """
+        if self._cull_grid:
+            self._cull_grid.remove(self)
+            self._cull_grid = None
         if self.scene():
             self.scene().removeItem(self)
 
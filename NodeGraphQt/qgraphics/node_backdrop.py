@@ -38,9 +38,11 @@ class BackdropNodeItem(AbstractNodeItem):
         self.node = node
 
     def _combined_rect(self, nodes):
-        group = self.scene().createItemGroup(nodes)
-        rect = group.boundingRect()
-        self.scene().destroyItemGroup(group)
+        rect = QtCore.QRectF()
+        for node in nodes:
+            rect |= node.mapRectToScene(
+                node.boundingRect() | node.childrenBoundingRect()
+            )
         return rect
 
     def mouseDoubleClickEvent(self, event):
@@ -82,6 +84,7 @@ class BackdropNodeItem(AbstractNodeItem):
         self._nodes = [self]
 
     def on_sizer_pos_changed(self, pos):
+        self.prepareGeometryChange()
         self._width = pos.x() + self._sizer.size
         self._height = pos.y() + self._sizer.size
 
@@ -10,12 +10,14 @@ from NodeGraphQt.constants import (
     NodeEnum,
     PortEnum,
     PortTypeEnum,
+    ViewerLODEnum,
     Z_VAL_NODE
 )
 from NodeGraphQt.errors import NodeWidgetError
 from NodeGraphQt.qgraphics.node_abstract import AbstractNodeItem
 from NodeGraphQt.qgraphics.node_overlay_disabled import XDisabledItem
 from NodeGraphQt.qgraphics.node_text_item import NodeTextItem
+from NodeGraphQt.qgraphics.pixmap_cache import PixmapCache
 from NodeGraphQt.qgraphics.port import PortItem, CustomPortItem
 
 
@@ -30,12 +32,7 @@ class NodeItem(AbstractNodeItem):
 
     def __init__(self, name='node', parent=None):
         super(NodeItem, self).__init__(name, parent)
-        pixmap = QtGui.QPixmap(ICON_NODE_BASE)
-        if pixmap.size().height() > NodeEnum.ICON_SIZE.value:
-            pixmap = pixmap.scaledToHeight(
-                NodeEnum.ICON_SIZE.value,
-                QtCore.Qt.SmoothTransformation
-            )
+        pixmap = PixmapCache.pixmap(ICON_NODE_BASE, NodeEnum.ICON_SIZE.value)
         self._properties['icon'] = ICON_NODE_BASE
         self._icon_item = QtWidgets.QGraphicsPixmapItem(pixmap, self)
         self._icon_item.setTransformationMode(QtCore.Qt.SmoothTransformation)
@@ -45,7 +42,10 @@ class NodeItem(AbstractNodeItem):
         self._output_items = OrderedDict()
         self._widgets = OrderedDict()
         self._proxy_mode = False
-        self._proxy_mode_threshold = 70
+        self._proxy_hidden_widgets = []
+        # brushes, pen and rects used for drawing the node in each state.
+        self._paint_cache = {}
+        self._paint_cache_key = None
 
     def post_init(self, viewer, pos=None):
         """
@@ -67,10 +67,29 @@ class NodeItem(AbstractNodeItem):
                 for text_item in self._output_items.values():
                     text_item.setVisible(False)
 
-    def _paint_horizontal(self, painter, option, widget):
-        painter.save()
-        painter.setPen(QtCore.Qt.NoPen)
-        painter.setBrush(QtCore.Qt.NoBrush)
+    def _paint_resources(self):
+        """
+        Returns the brushes, pen and rects for drawing the node in its
+        current state, they're built the first time the node is drawn in a
+        state and reused until the node size, colors or label changes.
+
+        Returns:
+            tuple: node rect, background brush, selected overlay brush or
+                None, label rects, label brush and border pen.
+        """
+        text_rect = self._text_item.boundingRect()
+        key = (self._width, self._height, self.color, self.border_color,
+               text_rect.x(), text_rect.height())
+        if key != self._paint_cache_key:
+            self._paint_cache.clear()
+            self._paint_cache_key = key
+
+        selected = self.selected
+        cosmetic = self.viewer().get_zoom() < 0.0
+        state = (self.layout_direction, selected, cosmetic)
+        resources = self._paint_cache.get(state)
+        if resources is not None:
+            return resources
 
         # base background.
         margin = 1.0
@@ -80,30 +99,36 @@ class NodeItem(AbstractNodeItem):
                              rect.width() - (margin * 2),
                              rect.height() - (margin * 2))
 
-        radius = 4.0
-        painter.setBrush(QtGui.QColor(*self.color))
-        painter.drawRoundedRect(rect, radius, radius)
-
         # light overlay on background when selected.
-        if self.selected:
-            painter.setBrush(QtGui.QColor(*NodeEnum.SELECTED_COLOR.value))
-            painter.drawRoundedRect(rect, radius, radius)
+        overlay = None
+        if selected:
+            overlay = QtGui.QBrush(QtGui.QColor(*NodeEnum.SELECTED_COLOR.value))
 
-        # node name background.
-        padding = 3.0, 2.0
-        text_rect = self._text_item.boundingRect()
-        text_rect = QtCore.QRectF(text_rect.x() + padding[0],
-                                  rect.y() + padding[1],
-                                  rect.width() - padding[0] - margin,
-                                  text_rect.height() - (padding[1] * 2))
-        if self.selected:
-            painter.setBrush(QtGui.QColor(*NodeEnum.SELECTED_COLOR.value))
+        if self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
+            # top & bottom edge background.
+            padding = 2.0
+            height = 10
+            label_rects = [
+                QtCore.QRectF(rect.x() + padding, y,
+                              rect.width() - (padding * 2), height)
+                for y in [rect.y() + padding, rect.height() - height - 1]
+            ]
+        else:
+            # node name background.
+            padding = 3.0, 2.0
+            label_rects = [
+                QtCore.QRectF(text_rect.x() + padding[0],
+                              rect.y() + padding[1],
+                              rect.width() - padding[0] - margin,
+                              text_rect.height() - (padding[1] * 2))
+            ]
+        if selected:
+            label_brush = overlay
         else:
-            painter.setBrush(QtGui.QColor(0, 0, 0, 80))
-        painter.drawRoundedRect(text_rect, 3.0, 3.0)
+            label_brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 80))
 
         # node border
-        if self.selected:
+        if selected:
             border_width = 1.2
             border_color = QtGui.QColor(
                 *NodeEnum.SELECTED_BORDER_COLOR.value
@@ -111,73 +136,61 @@ class NodeItem(AbstractNodeItem):
         else:
             border_width = 0.8
             border_color = QtGui.QColor(*self.border_color)
+        pen = QtGui.QPen(border_color, border_width)
+        pen.setCosmetic(cosmetic)
 
-        border_rect = QtCore.QRectF(rect.left(), rect.top(),
-                                    rect.width(), rect.height())
+        resources = (rect, QtGui.QBrush(QtGui.QColor(*self.color)), overlay,
+                     label_rects, label_brush, pen)
+        self._paint_cache[state] = resources
+        return resources
 
-        pen = QtGui.QPen(border_color, border_width)
-        pen.setCosmetic(self.viewer().get_zoom() < 0.0)
-        path = QtGui.QPainterPath()
-        path.addRoundedRect(border_rect, radius, radius)
-        painter.setBrush(QtCore.Qt.NoBrush)
-        painter.setPen(pen)
-        painter.drawPath(path)
+    def _paint_base(self, painter):
+        """
+        Draws the node background, label background and border from the
+        cached paint resources.
 
-        painter.restore()
+        Args:
+            painter (QtGui.QPainter): painter used for drawing the item.
+        """
+        rect, brush, overlay, label_rects, label_brush, pen = \
+            self._paint_resources()
 
-    def _paint_vertical(self, painter, option, widget):
         painter.save()
         painter.setPen(QtCore.Qt.NoPen)
-        painter.setBrush(QtCore.Qt.NoBrush)
-
-        # base background.
-        margin = 1.0
-        rect = self.boundingRect()
-        rect = QtCore.QRectF(rect.left() + margin,
-                             rect.top() + margin,
-                             rect.width() - (margin * 2),
-                             rect.height() - (margin * 2))
 
         radius = 4.0
-        painter.setBrush(QtGui.QColor(*self.color))
+        painter.setBrush(brush)
         painter.drawRoundedRect(rect, radius, radius)
-
-        # light overlay on background when selected.
-        if self.selected:
-            painter.setBrush(
-                QtGui.QColor(*NodeEnum.SELECTED_COLOR.value)
-            )
+        if overlay:
+            painter.setBrush(overlay)
             painter.drawRoundedRect(rect, radius, radius)
 
-        # top & bottom edge background.
-        padding = 2.0
-        height = 10
-        if self.selected:
-            painter.setBrush(QtGui.QColor(*NodeEnum.SELECTED_COLOR.value))
-        else:
-            painter.setBrush(QtGui.QColor(0, 0, 0, 80))
-        for y in [rect.y() + padding, rect.height() - height - 1]:
-            edge_rect = QtCore.QRectF(rect.x() + padding, y,
-                                     rect.width() - (padding * 2), height)
-            painter.drawRoundedRect(edge_rect, 3.0, 3.0)
-
-        # node border
-        border_width = 0.8
-        border_color = QtGui.QColor(*self.border_color)
-        if self.selected:
-            border_width = 1.2
-            border_color = QtGui.QColor(
-                *NodeEnum.SELECTED_BORDER_COLOR.value
-            )
-        border_rect = QtCore.QRectF(rect.left(), rect.top(),
-                                    rect.width(), rect.height())
+        painter.setBrush(label_brush)
+        for label_rect in label_rects:
+            painter.drawRoundedRect(label_rect, 3.0, 3.0)
 
-        pen = QtGui.QPen(border_color, border_width)
-        pen.setCosmetic(self.viewer().get_zoom() < 0.0)
         painter.setBrush(QtCore.Qt.NoBrush)
         painter.setPen(pen)
-        painter.drawRoundedRect(border_rect, radius, radius)
+        painter.drawRoundedRect(rect, radius, radius)
+
+        painter.restore()
+
+    def _paint_horizontal(self, painter, option, widget):
+        self._paint_base(painter)
+
+    def _paint_vertical(self, painter, option, widget):
+        self._paint_base(painter)
 
+    def _paint_flat(self, painter, option, widget):
+        painter.save()
+        painter.setPen(QtCore.Qt.NoPen)
+        if self.selected:
+            painter.setBrush(
+                QtGui.QColor(*NodeEnum.SELECTED_BORDER_COLOR.value)
+            )
+        else:
+            painter.setBrush(QtGui.QColor(*self.color))
+        painter.drawRect(self.boundingRect())
         painter.restore()
 
     def paint(self, painter, option, widget):
@@ -190,8 +203,9 @@ class NodeItem(AbstractNodeItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
-        self.auto_switch_mode()
-        if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
+        if self._lod == ViewerLODEnum.MINIMAL.value:
+            self._paint_flat(painter, option, widget)
+        elif self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
             self._paint_horizontal(painter, option, widget)
         elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
             self._paint_vertical(painter, option, widget)
@@ -259,9 +273,10 @@ class NodeItem(AbstractNodeItem):
             value:
         """
         if change == QtWidgets.QGraphicsItem.ItemSelectedChange and self.scene():
-            self.reset_pipes()
             if value:
                 self.highlight_pipes()
+            else:
+                self.reset_pipes()
             self.setZValue(Z_VAL_NODE)
             if not self.selected:
                 self.setZValue(Z_VAL_NODE + 1)
@@ -289,6 +304,8 @@ class NodeItem(AbstractNodeItem):
             add_w (float): add additional width.
             add_h (float): add additional height.
         """
+        self.prepareGeometryChange()
+        self._x_item.prepareGeometryChange()
         self._width, self._height = self.calc_size(add_w, add_h)
         if self._width < NodeEnum.WIDTH.value:
             self._width = NodeEnum.WIDTH.value
@@ -651,10 +668,10 @@ class NodeItem(AbstractNodeItem):
         # update port text items in visibility.
         for port, text in self._input_items.items():
             if port.isVisible():
-                text.setVisible(port.display_name)
+                text.setVisible(port.display_name and not self._proxy_mode)
         for port, text in self._output_items.items():
             if port.isVisible():
-                text.setVisible(port.display_name)
+                text.setVisible(port.display_name and not self._proxy_mode)
 
         # setup initial base size.
         self._set_base_size(add_h=height)
@@ -723,7 +740,7 @@ class NodeItem(AbstractNodeItem):
         Adjust the node layout and form after the node has been added.
 
         Args:
-            viewer (NodeGraphQt.widgets.viewer.NodeViewer): not used
+            viewer (NodeGraphQt.widgets.viewer.NodeViewer): main viewer.
             pos (tuple): cursor position.
         """
         self.draw_node()
@@ -732,23 +749,37 @@ class NodeItem(AbstractNodeItem):
         if pos:
             self.xy_pos = pos
 
+        # match the current viewer level of detail.
+        if viewer:
+            self.set_lod(viewer.get_lod())
+
     def auto_switch_mode(self):
         """
-        Decide whether to draw the node with proxy mode.
-        (this is called at the start in the "self.paint()" function.)
+        Decide whether to draw the node with proxy mode from the viewer
+        level of detail.
         """
-        if ITEM_CACHE_MODE is QtWidgets.QGraphicsItem.ItemCoordinateCache:
-            return
+        viewer = self.viewer()
+        if viewer:
+            self.set_lod(viewer.get_lod())
+
+    def set_lod(self, lod):
+        """
+        Set the level of detail the node is drawn with.
+        (this is called from the viewer when the zoom level changes.)
 
-        rect = self.sceneBoundingRect()
-        l = self.viewer().mapToGlobal(
-            self.viewer().mapFromScene(rect.topLeft()))
-        r = self.viewer().mapToGlobal(
-            self.viewer().mapFromScene(rect.topRight()))
-        # width is the node width in screen
-        width = r.x() - l.x()
+        Args:
+            lod (int): level of detail from
+                :attr:`NodeGraphQt.constants.ViewerLODEnum`
+        """
+        if lod == self._lod:
+            return
+        self._lod = lod
+        self.set_proxy_mode(lod != ViewerLODEnum.FULL.value)
 
-        self.set_proxy_mode(width < self._proxy_mode_threshold)
+        # ports are not drawn in the minimal level of detail.
+        for port in list(self._input_items) + list(self._output_items):
+            port.update()
+        self.update()
 
     def set_proxy_mode(self, mode):
         """
@@ -768,8 +799,14 @@ class NodeItem(AbstractNodeItem):
         self._x_item.proxy_mode = self._proxy_mode
 
         # node widget visibility.
-        for w in self._widgets.values():
-            w.widget().setVisible(visible)
+        if mode:
+            self._proxy_hidden_widgets = [
+                w for w in self._widgets.values() if w.isVisible()
+            ]
+        for w in self._proxy_hidden_widgets:
+            w.setVisible(visible)
+        if visible:
+            self._proxy_hidden_widgets = []
 
         # port text is not visible in vertical layout.
         if self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
@@ -798,12 +835,7 @@ class NodeItem(AbstractNodeItem):
     def icon(self, path=None):
         self._properties['icon'] = path
         path = path or ICON_NODE_BASE
-        pixmap = QtGui.QPixmap(str(path))
-        if pixmap.size().height() > NodeEnum.ICON_SIZE.value:
-            pixmap = pixmap.scaledToHeight(
-                NodeEnum.ICON_SIZE.value,
-                QtCore.Qt.SmoothTransformation
-            )
+        pixmap = PixmapCache.pixmap(path, NodeEnum.ICON_SIZE.value)
         self._icon_item.setPixmap(pixmap)
         if self.scene():
             self.post_init()
@@ -22,7 +22,12 @@ class XDisabledItem(QtWidgets.QGraphicsItem):
         self.text = text
 
     def boundingRect(self):
-        return self.parentItem().boundingRect()
+        # the overlay is drawn past the node by the margin, the cross pen
+        # width and the corner points.
+        extend = 14.0
+        return self.parentItem().boundingRect().adjusted(
+            -extend, -extend, extend, extend
+        )
 
     def paint(self, painter, option, widget):
         """
@@ -37,7 +42,7 @@ class XDisabledItem(QtWidgets.QGraphicsItem):
         painter.save()
 
         margin = 20
-        rect = self.boundingRect()
+        rect = self.parentItem().boundingRect()
         dis_rect = QtCore.QRectF(rect.left() - (margin / 2),
                                  rect.top() - (margin / 2),
                                  rect.width() + margin,
@@ -21,13 +21,13 @@ class PortOutputNodeItem(NodeItem):
         self._x_item.text = 'Port Locked'
 
     def _set_base_size(self, add_w=0.0, add_h=0.0):
+        self.prepareGeometryChange()
+        self._x_item.prepareGeometryChange()
         width, height = self.calc_size(add_w, add_h)
         self._width = width + 60
         self._height = height if height >= 60 else 60
 
     def _paint_horizontal(self, painter, option, widget):
-        self.auto_switch_mode()
-
         painter.save()
         painter.setBrush(QtCore.Qt.NoBrush)
         painter.setPen(QtCore.Qt.NoPen)
@@ -86,8 +86,6 @@ class PortOutputNodeItem(NodeItem):
         painter.restore()
 
     def _paint_vertical(self, painter, option, widget):
-        self.auto_switch_mode()
-
         painter.save()
         painter.setBrush(QtCore.Qt.NoBrush)
         painter.setPen(QtCore.Qt.NoPen)
@@ -163,8 +161,14 @@ class PortOutputNodeItem(NodeItem):
         self._x_item.proxy_mode = self._proxy_mode
 
         # node widget visibility.
-        for w in self._widgets.values():
-            w.widget().setVisible(visible)
+        if mode:
+            self._proxy_hidden_widgets = [
+                w for w in self._widgets.values() if w.isVisible()
+            ]
+        for w in self._proxy_hidden_widgets:
+            w.setVisible(visible)
+        if visible:
+            self._proxy_hidden_widgets = []
 
         # input port text visibility.
         for port, text in self._input_items.items():
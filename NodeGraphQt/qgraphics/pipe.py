@@ -8,6 +8,7 @@ from NodeGraphQt.constants import (
     PipeEnum,
     PipeLayoutEnum,
     PortTypeEnum,
+    ViewerLODEnum,
     ITEM_CACHE_MODE,
     Z_VAL_PIPE,
     Z_VAL_NODE_WIDGET
@@ -39,6 +40,9 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         self._highlight = False
         self._input_port = input_port
         self._output_port = output_port
+        self._lod = ViewerLODEnum.FULL.value
+        # scene positions of the pipe end points from the last draw.
+        self._path_ends = None
 
         size = 6.0
         self._poly = QtGui.QPolygonF()
@@ -60,6 +64,10 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         return '{}.Pipe(\'{}\', \'{}\')'.format(
             self.__module__, in_name, out_name)
 
+    def boundingRect(self):
+        # disabled pipes are drawn with a wider pen than the item pen.
+        return super(PipeItem, self).boundingRect().adjusted(-1, -1, 1, 1)
+
     def hoverEnterEvent(self, event):
         self.activate()
 
@@ -91,6 +99,11 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
+        if self._lod == ViewerLODEnum.MINIMAL.value:
+            # only the pipes connected to the selection are drawn.
+            if not (self._active or self._highlight or self.isSelected()):
+                return
+
         painter.save()
 
         pen = self.pen()
@@ -102,8 +115,15 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
 
         painter.setPen(pen)
         painter.setBrush(self.brush())
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        painter.drawPath(self.path())
+        path = self.path()
+        if self._lod == ViewerLODEnum.FULL.value:
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            painter.drawPath(path)
+        elif not path.isEmpty():
+            # draw a straight line between the pipe end points.
+            start = path.elementAt(0)
+            painter.drawLine(QtCore.QPointF(start.x, start.y),
+                             path.currentPosition())
 
         # QPaintDevice: Cannot destroy paint device that is being painted.
         painter.restore()
@@ -114,14 +134,28 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         y = math.pow((p2.y() - p1.y()), 2)
         return math.sqrt(x + y)
 
-    def _draw_direction_pointer(self):
+    def _draw_direction_pointer(self, center=None, direction=None,
+                                length=None):
         """
         updates the pipe direction pointer arrow.
+
+        The pointer placement is read from the path when the layout routine
+        didn't compute it.
+
+        Args:
+            center (QtCore.QPointF): pipe mid point.
+            direction (QtCore.QPointF): pipe tangent at the mid point.
+            length (float): pipe length.
         """
         if not (self.input_port and self.output_port):
             self._dir_pointer.setVisible(False)
             return
 
+        # the pointer is only drawn in the full level of detail.
+        if self._lod != ViewerLODEnum.FULL.value:
+            self._dir_pointer.setVisible(False)
+            return
+
         if self.disabled():
             if not (self._active or self._highlight):
                 color = QtGui.QColor(*PipeEnum.DISABLED_COLOR.value)
@@ -130,25 +164,85 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
                 self._dir_pointer.setPen(pen)
                 self._dir_pointer.setBrush(color.darker(200))
 
-        self._dir_pointer.setVisible(True)
-        loc_pt = self.path().pointAtPercent(0.49)
-        tgt_pt = self.path().pointAtPercent(0.51)
-        radians = math.atan2(tgt_pt.y() - loc_pt.y(),
-                             tgt_pt.x() - loc_pt.x())
+        if center is None:
+            path = self.path()
+            center = path.pointAtPercent(0.5)
+            direction = path.pointAtPercent(0.51) - path.pointAtPercent(0.49)
+            length = path.length()
+
+        radians = math.atan2(direction.y(), direction.x())
         degrees = math.degrees(radians) - 90
         self._dir_pointer.setRotation(degrees)
-        self._dir_pointer.setPos(self.path().pointAtPercent(0.5))
-
-        cen_x = self.path().pointAtPercent(0.5).x()
-        cen_y = self.path().pointAtPercent(0.5).y()
-        dist = math.hypot(tgt_pt.x() - cen_x, tgt_pt.y() - cen_y)
+        self._dir_pointer.setPos(center)
 
-        self._dir_pointer.setVisible(True)
+        # the pointer is scaled down on short pipes.
+        dist = length * 0.01
         if dist < 0.3:
             self._dir_pointer.setVisible(False)
             return
-        if dist < 1.0:
-            self._dir_pointer.setScale(dist)
+        self._dir_pointer.setScale(min(dist, 1.0))
+        self._dir_pointer.setVisible(True)
+
+    @staticmethod
+    def _curve_pointer(pos1, ctr_point1, ctr_point2, pos2):
+        """
+        Returns the direction pointer placement for a curved pipe.
+
+        The control points mirror each other around the middle of the end
+        points so the curve mid point and tangent are at ``t=0.5``.
+
+        Args:
+            pos1 (QPointF): start point.
+            ctr_point1 (QPointF): first control point.
+            ctr_point2 (QPointF): second control point.
+            pos2 (QPointF): end point.
+
+        Returns:
+            tuple: (center, direction, length)
+        """
+        center = (pos1 + pos2) * 0.5
+        direction = (pos2 - pos1) + (ctr_point2 - ctr_point1)
+        if direction.isNull():
+            direction = pos2 - pos1
+        # approximate arc length from the chord and control polygon.
+        chord = QtCore.QLineF(pos1, pos2).length()
+        polygon = (QtCore.QLineF(pos1, ctr_point1).length() +
+                   QtCore.QLineF(ctr_point1, ctr_point2).length() +
+                   QtCore.QLineF(ctr_point2, pos2).length())
+        return center, direction, (chord + polygon) * 0.5
+
+    @staticmethod
+    def _angle_pointer(pos1, ctr_point1, ctr_point2, pos2):
+        """
+        Returns the direction pointer placement for an angled pipe.
+
+        The first and last segments are the same length so the mid point is
+        in the middle of the center segment, the tangent is taken across the
+        corners when the center segment is shorter than 2% of the pipe.
+
+        Args:
+            pos1 (QPointF): start point.
+            ctr_point1 (QPointF): first corner point.
+            ctr_point2 (QPointF): second corner point.
+            pos2 (QPointF): end point.
+
+        Returns:
+            tuple: (center, direction, length)
+        """
+        center = (pos1 + pos2) * 0.5
+        line1 = QtCore.QLineF(ctr_point1, pos1)
+        line2 = QtCore.QLineF(ctr_point2, pos2)
+        mid_length = QtCore.QLineF(ctr_point1, ctr_point2).length()
+        length = line1.length() + mid_length + line2.length()
+
+        overlap = length * 0.01 - mid_length * 0.5
+        if overlap <= 0.0 or line1.length() == 0.0:
+            direction = ctr_point2 - ctr_point1
+        else:
+            line1.setLength(overlap)
+            line2.setLength(overlap)
+            direction = line2.p2() - line1.p2()
+        return center, direction, length
 
     def _draw_path_cycled_vertical(self, start_port, pos1, pos2, path):
         """
@@ -211,6 +305,9 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             pos1 (QPointF): start port position.
             pos2 (QPointF): end port position.
             path (QPainterPath): path to draw.
+
+        Returns:
+            tuple or None: direction pointer (center, direction, length).
         """
         if self.viewer_pipe_layout() == PipeLayoutEnum.CURVED.value:
             ctr_offset_y1, ctr_offset_y2 = pos1.y(), pos2.y()
@@ -229,6 +326,7 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             ctr_point2 = QtCore.QPointF(pos2.x(), ctr_offset_y2)
             path.cubicTo(ctr_point1, ctr_point2, pos2)
             self.setPath(path)
+            return self._curve_pointer(pos1, ctr_point1, ctr_point2, pos2)
         elif self.viewer_pipe_layout() == PipeLayoutEnum.ANGLE.value:
             ctr_offset_y1, ctr_offset_y2 = pos1.y(), pos2.y()
             distance = abs(ctr_offset_y1 - ctr_offset_y2)/2
@@ -245,6 +343,7 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             path.lineTo(ctr_point2)
             path.lineTo(pos2)
             self.setPath(path)
+            return self._angle_pointer(pos1, ctr_point1, ctr_point2, pos2)
 
     def _draw_path_horizontal(self, start_port, pos1, pos2, path):
         """
@@ -255,6 +354,9 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             pos1 (QPointF): start port position.
             pos2 (QPointF): end port position.
             path (QPainterPath): path to draw.
+
+        Returns:
+            tuple or None: direction pointer (center, direction, length).
         """
         if self.viewer_pipe_layout() == PipeLayoutEnum.CURVED.value:
             ctr_offset_x1, ctr_offset_x2 = pos1.x(), pos2.x()
@@ -273,6 +375,7 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             ctr_point2 = QtCore.QPointF(ctr_offset_x2, pos2.y())
             path.cubicTo(ctr_point1, ctr_point2, pos2)
             self.setPath(path)
+            return self._curve_pointer(pos1, ctr_point1, ctr_point2, pos2)
         elif self.viewer_pipe_layout() == PipeLayoutEnum.ANGLE.value:
             ctr_offset_x1, ctr_offset_x2 = pos1.x(), pos2.x()
             distance = abs(ctr_offset_x1 - ctr_offset_x2) / 2
@@ -289,6 +392,7 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             path.lineTo(ctr_point2)
             path.lineTo(pos2)
             self.setPath(path)
+            return self._angle_pointer(pos1, ctr_point1, ctr_point2, pos2)
 
     def draw_path(self, start_port, end_port=None, cursor_pos=None):
         """
@@ -304,15 +408,12 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             return
 
         # get start / end positions.
-        pos1 = start_port.scenePos()
-        pos1.setX(pos1.x() + (start_port.boundingRect().width() / 2))
-        pos1.setY(pos1.y() + (start_port.boundingRect().height() / 2))
+        port_center = start_port.boundingRect().center()
+        pos1 = start_port.scenePos() + port_center
         if cursor_pos:
             pos2 = cursor_pos
         elif end_port:
-            pos2 = end_port.scenePos()
-            pos2.setX(pos2.x() + (start_port.boundingRect().width() / 2))
-            pos2.setY(pos2.y() + (start_port.boundingRect().height() / 2))
+            pos2 = end_port.scenePos() + port_center
         else:
             return
 
@@ -328,8 +429,20 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
 
             # don't draw pipe if a port or node is not visible.
             if not is_visible:
+                self._path_ends = None
                 return
 
+            # both end points moved together so we only move the path.
+            if end_port and not cursor_pos and self._path_ends:
+                delta = pos1 - self._path_ends[0]
+                offset = pos2 - self._path_ends[1] - delta
+                if (not delta.isNull() and
+                        offset.manhattanLength() < 1e-6):
+                    self._translate_path(delta)
+                    self._path_ends = (pos1, pos2)
+                    return
+            self._path_ends = (pos1, pos2) if end_port else None
+
         line = QtCore.QLineF(pos1, pos2)
         path = QtGui.QPainterPath()
 
@@ -355,20 +468,36 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         if self.viewer_pipe_layout() == PipeLayoutEnum.STRAIGHT.value:
             path.lineTo(pos2)
             self.setPath(path)
-            self._draw_direction_pointer()
+            self._draw_direction_pointer(
+                (pos1 + pos2) * 0.5, pos2 - pos1, line.length()
+            )
             return
 
+        pointer = None
         if direction is LayoutDirectionEnum.VERTICAL.value:
-            self._draw_path_vertical(start_port, pos1, pos2, path)
+            pointer = self._draw_path_vertical(start_port, pos1, pos2, path)
         elif direction is LayoutDirectionEnum.HORIZONTAL.value:
-            self._draw_path_horizontal(start_port, pos1, pos2, path)
+            pointer = self._draw_path_horizontal(start_port, pos1, pos2, path)
 
-        self._draw_direction_pointer()
+        self._draw_direction_pointer(*(pointer or ()))
+
+    def _translate_path(self, delta):
+        """
+        Move the pipe path and direction pointer without redrawing the path.
+
+        Args:
+            delta (QtCore.QPointF): offset to move the path by.
+        """
+        path = self.path()
+        path.translate(delta)
+        self.setPath(path)
+        self._dir_pointer.setPos(self._dir_pointer.pos() + delta)
 
     def reset_path(self):
         """
         reset the pipe initial path position.
         """
+        self._path_ends = None
         path = QtGui.QPainterPath(QtCore.QPointF(0.0, 0.0))
         self.setPath(path)
         self._draw_direction_pointer()
@@ -442,6 +571,31 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         self._dir_pointer.setPen(pen)
         self._dir_pointer.setBrush(QtGui.QColor(*color).darker(200))
 
+    @property
+    def lod(self):
+        """
+        Returns the level of detail the pipe is drawn with.
+
+        Returns:
+            int: level of detail from :attr:`NodeGraphQt.constants.ViewerLODEnum`
+        """
+        return self._lod
+
+    def set_lod(self, lod):
+        """
+        Set the level of detail the pipe is drawn with.
+        (this is called from the viewer when the zoom level changes.)
+
+        Args:
+            lod (int): level of detail from
+                :attr:`NodeGraphQt.constants.ViewerLODEnum`
+        """
+        if lod == self._lod:
+            return
+        self._lod = lod
+        self._draw_direction_pointer()
+        self.update()
+
     def activate(self):
         self._active = True
         self.set_pipe_styling(
@@ -454,6 +608,8 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         return self._active
 
     def highlight(self):
+        if self._highlight and not self._active:
+            return
         self._highlight = True
         self.set_pipe_styling(
             color=PipeEnum.HIGHLIGHT_COLOR.value,
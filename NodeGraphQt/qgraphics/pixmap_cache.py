@@ -0,0 +1,143 @@
+#!/usr/bin/python
+from collections import OrderedDict
+
+from PyQt5 import QtCore, QtGui
+
+
+class PixmapCache(object):
+    """
+    Process wide least recently used cache of the scaled pixmaps used for
+    the node icons, so an icon file is only decoded and scaled once and the
+    pixmap is shared between the node items.
+
+    The pixmaps are keyed by ``(path, height, device pixel ratio)`` and the
+    least recently used pixmaps are evicted when the cache grows over the
+    max size.
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt import PixmapCache
+
+        # load the icons before creating the nodes.
+        PixmapCache.preload(['/path/to/icon_a.png', '/path/to/icon_b.png'])
+
+        # reload an icon after the file has been changed on disk.
+        PixmapCache.invalidate('/path/to/icon_a.png')
+    """
+
+    _pixmaps = OrderedDict()
+    _size = 0
+    _max_size = 32 * 1024 * 1024
+
+    @staticmethod
+    def _pixmap_size(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    @staticmethod
+    def _device_ratio():
+        app = QtGui.QGuiApplication.instance()
+        return app.devicePixelRatio() if app else 1.0
+
+    @classmethod
+    def pixmap(cls, path, height=None, device_ratio=None):
+        """
+        Returns the shared pixmap for the image file, images taller than
+        the height are scaled down to the height.
+
+        Args:
+            path (str): image file path.
+            height (int): max pixmap height. (optional)
+            device_ratio (float): device pixel ratio the pixmap is scaled
+                for. (defaults to the application device pixel ratio)
+
+        Returns:
+            QtGui.QPixmap: pixmap.
+        """
+        device_ratio = device_ratio or cls._device_ratio()
+        key = (str(path), height, device_ratio)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is not None:
+            cls._pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = QtGui.QPixmap(str(path))
+        if height and pixmap.height() > height:
+            pixmap = pixmap.scaledToHeight(
+                int(height * device_ratio), QtCore.Qt.SmoothTransformation
+            )
+            pixmap.setDevicePixelRatio(device_ratio)
+
+        cls._pixmaps[key] = pixmap
+        cls._size += cls._pixmap_size(pixmap)
+        cls._evict()
+        return pixmap
+
+    @classmethod
+    def preload(cls, paths, height=None, device_ratio=None):
+        """
+        Load the image files into the cache.
+
+        Args:
+            paths (list[str]): image file paths.
+            height (int): max pixmap height. (optional)
+            device_ratio (float): device pixel ratio the pixmaps are scaled
+                for. (optional)
+        """
+        for path in paths:
+            cls.pixmap(path, height, device_ratio)
+
+    @classmethod
+    def invalidate(cls, path=None):
+        """
+        Remove the cached pixmaps for the image file or clear the cache if
+        no path is specified.
+
+        Args:
+            path (str): image file path. (optional)
+        """
+        if path is None:
+            cls._pixmaps.clear()
+            cls._size = 0
+            return
+        for key in [k for k in cls._pixmaps if k[0] == str(path)]:
+            cls._size -= cls._pixmap_size(cls._pixmaps.pop(key))
+
+    @classmethod
+    def size(cls):
+        """
+        Returns the approximate size of the cached pixmaps.
+
+        Returns:
+            int: size in bytes.
+        """
+        return cls._size
+
+    @classmethod
+    def max_size(cls):
+        """
+        Returns the max size of the cache.
+
+        Returns:
+            int: size in bytes.
+        """
+        return cls._max_size
+
+    @classmethod
+    def set_max_size(cls, size):
+        """
+        Set the max size of the cache, the least recently used pixmaps are
+        evicted when the cache is over the size.
+
+        Args:
+            size (int): size in bytes.
+        """
+        cls._max_size = max(0, int(size))
+        cls._evict()
+
+    @classmethod
+    def _evict(cls):
+        # the most recently used pixmap is always kept.
+        while cls._size > cls._max_size and len(cls._pixmaps) > 1:
+            _, pixmap = cls._pixmaps.popitem(last=False)
+            cls._size -= cls._pixmap_size(pixmap)
@@ -3,6 +3,7 @@ from PyQt5 import QtGui, QtCore, QtWidgets
 
 from NodeGraphQt.constants import (
     PortTypeEnum, PortEnum,
+    ViewerLODEnum,
     Z_VAL_PORT,
     ITEM_CACHE_MODE)
 
@@ -31,6 +32,8 @@ class PortItem(QtWidgets.QGraphicsItem):
         self._port_type = None
         self._multi_connection = False
         self._locked = False
+        # pens, brushes and rects used for drawing the port in each state.
+        self._paint_cache = {}
 
     def __str__(self):
         return '{}.PortItem("{}")'.format(self.__module__, self.name)
@@ -53,6 +56,10 @@ class PortItem(QtWidgets.QGraphicsItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
+        # ports are not drawn when the node is drawn as a flat rect.
+        if self.node.lod == ViewerLODEnum.MINIMAL.value:
+            return
+
         painter.save()
 
         #  display falloff collision for debugging
@@ -63,59 +70,88 @@ class PortItem(QtWidgets.QGraphicsItem):
         # painter.drawRect(self.boundingRect())
         # ----------------------------------------------------------------------
 
+        pen, brush, port_rect, inner = self._paint_resources()
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.drawEllipse(port_rect)
+        if inner:
+            pen, brush, rect = inner
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            painter.drawEllipse(rect)
+        painter.restore()
+
+    def _paint_resources(self):
+        """
+        Returns the pens, brushes and rects for drawing the port in its
+        current state, they're built the first time the port is drawn in a
+        state and reused until the port colors change.
+
+        Returns:
+            tuple: pen, brush, port rect and the (pen, brush, rect) of the
+                inner circle or None.
+        """
+        connected = bool(self._pipes)
+        key = (self._hovered, connected, self._multi_connection)
+        resources = self._paint_cache.get(key)
+        if resources is not None:
+            return resources
+
         rect_w = self._width / 1.8
         rect_h = self._height / 1.8
-        rect_x = self.boundingRect().center().x() - (rect_w / 2)
-        rect_y = self.boundingRect().center().y() - (rect_h / 2)
-        port_rect = QtCore.QRectF(rect_x, rect_y, rect_w, rect_h)
+        center = self.boundingRect().center()
+        port_rect = QtCore.QRectF(center.x() - (rect_w / 2),
+                                  center.y() - (rect_h / 2),
+                                  rect_w, rect_h)
 
         if self._hovered:
             color = QtGui.QColor(*PortEnum.HOVER_COLOR.value)
             border_color = QtGui.QColor(*PortEnum.HOVER_BORDER_COLOR.value)
-        elif self.connected_pipes:
+        elif connected:
             color = QtGui.QColor(*PortEnum.ACTIVE_COLOR.value)
             border_color = QtGui.QColor(*PortEnum.ACTIVE_BORDER_COLOR.value)
         else:
             color = QtGui.QColor(*self.color)
             border_color = QtGui.QColor(*self.border_color)
-
         pen = QtGui.QPen(border_color, 1.8)
-        painter.setPen(pen)
-        painter.setBrush(color)
-        painter.drawEllipse(port_rect)
 
-        if self.connected_pipes and not self._hovered:
-            painter.setBrush(border_color)
-            w = port_rect.width() / 2.5
-            h = port_rect.height() / 2.5
-            rect = QtCore.QRectF(port_rect.center().x() - w / 2,
-                                 port_rect.center().y() - h / 2,
-                                 w, h)
-            border_color = QtGui.QColor(*self.border_color)
-            pen = QtGui.QPen(border_color, 1.6)
-            painter.setPen(pen)
-            painter.setBrush(border_color)
-            painter.drawEllipse(rect)
+        # inner circle pen, brush and size divisor.
+        inner = None
+        if connected and not self._hovered:
+            inner_color = QtGui.QColor(*self.border_color)
+            inner = (QtGui.QPen(inner_color, 1.6),
+                     QtGui.QBrush(inner_color), 2.5)
+        elif self._hovered and self._multi_connection:
+            inner = (QtGui.QPen(border_color, 1.4), QtGui.QBrush(color), 1.8)
         elif self._hovered:
-            if self.multi_connection:
-                pen = QtGui.QPen(border_color, 1.4)
-                painter.setPen(pen)
-                painter.setBrush(color)
-                w = port_rect.width() / 1.8
-                h = port_rect.height() / 1.8
-            else:
-                painter.setBrush(border_color)
-                w = port_rect.width() / 3.5
-                h = port_rect.height() / 3.5
+            inner = (pen, QtGui.QBrush(border_color), 3.5)
+        if inner:
+            inner_pen, inner_brush, divisor = inner
+            w = port_rect.width() / divisor
+            h = port_rect.height() / divisor
             rect = QtCore.QRectF(port_rect.center().x() - w / 2,
                                  port_rect.center().y() - h / 2,
                                  w, h)
-            painter.drawEllipse(rect)
-        painter.restore()
+            inner = (inner_pen, inner_brush, rect)
+
+        resources = (pen, QtGui.QBrush(color), port_rect, inner)
+        self._paint_cache[key] = resources
+        return resources
 
     def itemChange(self, change, value):
         if change == QtWidgets.QGraphicsItem.ItemScenePositionHasChanged:
-            self.redraw_connected_pipes()
+            viewer = self.scene().viewer() if self.scene() else None
+            if viewer:
+                viewer.queue_port_update(self)
+            if self.connected_pipes:
+                if not (viewer and
+                        viewer.queue_pipe_redraw(self.connected_pipes)):
+                    self.redraw_connected_pipes()
+        elif change in (QtWidgets.QGraphicsItem.ItemSceneChange,
+                        QtWidgets.QGraphicsItem.ItemSceneHasChanged):
+            viewer = self.scene().viewer() if self.scene() else None
+            if viewer:
+                viewer.queue_port_update(self)
         return super(PortItem, self).itemChange(change, value)
 
     def mousePressEvent(self, event):
@@ -201,6 +237,7 @@ class PortItem(QtWidgets.QGraphicsItem):
     @color.setter
     def color(self, color=(0, 0, 0, 255)):
         self._color = color
+        self._paint_cache.clear()
         self.update()
 
     @property
@@ -210,6 +247,7 @@ class PortItem(QtWidgets.QGraphicsItem):
     @border_color.setter
     def border_color(self, color=(0, 0, 0, 255)):
         self._border_color = color
+        self._paint_cache.clear()
 
     @property
     def border_size(self):
@@ -250,13 +288,23 @@ class PortItem(QtWidgets.QGraphicsItem):
     def port_type(self, port_type):
         self._port_type = port_type
 
-    def connect_to(self, port):
+    def connect_to(self, port, viewer=None):
+        """
+        Connect a pipe to the port.
+
+        Args:
+            port (PortItem): port to connect to.
+            viewer (NodeGraphQt.widgets.viewer.NodeViewer): viewer the
+                pipe is added to, defaults to the scene viewer. (required
+                when the node is culled from the scene)
+        """
         if not port:
             for pipe in self.connected_pipes:
                 pipe.delete()
             return
-        if self.scene():
+        if viewer is None and self.scene():
             viewer = self.scene().viewer()
+        if viewer:
             viewer.establish_connection(self, port)
         # redraw the ports.
         port.update()
@@ -305,6 +353,9 @@ class CustomPortItem(PortItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
+        if self.node.lod == ViewerLODEnum.MINIMAL.value:
+            return
+
         if self._port_painter:
             rect_w = self._width / 1.8
             rect_h = self._height / 1.8
@@ -0,0 +1,248 @@
+#!/usr/bin/python
+import math
+
+from PyQt5 import QtCore
+
+
+class ItemGrid(object):
+    """
+    Uniform grid of graphics item scene rects used by the viewer for
+    looking up items by area without querying the scene.
+
+    Items are queued with :meth:`ItemGrid.mark_dirty` when they change and
+    the grid is updated before the next lookup, an item is stored in every
+    cell its scene rect overlaps.
+
+    Args:
+        cell_size (float): grid cell size in scene units.
+        rect_func (function): returns the scene rect for an item.
+            (defaults to ``QGraphicsItem.sceneBoundingRect``)
+        on_change (function): called with the item when it's added, removed
+            or marked dirty. (optional)
+    """
+
+    #: items overlapping more cells than this are kept out of the cells and
+    #: tested on every lookup instead.
+    MAX_ITEM_CELLS = 64
+
+    def __init__(self, cell_size=100.0, rect_func=None, on_change=None):
+        self._cell_size = cell_size
+        self._rect_func = rect_func
+        self._on_change = on_change
+        self._members = set()
+        # {cell: {item: scene_rect}, ...}
+        self._cells = {}
+        self._large_items = {}
+        self._item_cells = {}
+        self._dirty = set()
+
+    def __repr__(self):
+        return '<{}() object at {}>'.format(
+            self.__class__.__name__, hex(id(self)))
+
+    def __contains__(self, item):
+        return item in self._members
+
+    def __len__(self):
+        return len(self._members)
+
+    def _cell(self, x, y):
+        return (int(math.floor(x / self._cell_size)),
+                int(math.floor(y / self._cell_size)))
+
+    def _cell_range(self, rect):
+        left, top = self._cell(rect.left(), rect.top())
+        right, bottom = self._cell(rect.right(), rect.bottom())
+        return left, top, right, bottom
+
+    def _item_rect(self, item):
+        if self._rect_func:
+            return self._rect_func(item)
+        return item.sceneBoundingRect()
+
+    def _is_indexed(self, item):
+        """
+        Returns true if the item should be in the grid.
+        """
+        return item in self._members
+
+    def items(self):
+        """
+        Returns all the items added to the grid.
+
+        Returns:
+            list: graphics items.
+        """
+        return list(self._members)
+
+    def add(self, item):
+        """
+        Add the item to the grid.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): graphics item.
+        """
+        self._members.add(item)
+        self.mark_dirty(item)
+
+    def remove(self, item):
+        """
+        Remove the item from the grid.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): graphics item.
+        """
+        self._members.discard(item)
+        self.mark_dirty(item)
+
+    def mark_dirty(self, item):
+        """
+        Queue the item to be updated in the grid.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): graphics item.
+        """
+        self._dirty.add(item)
+        if self._on_change:
+            self._on_change(item)
+
+    def clear(self):
+        """
+        Remove all the items from the grid.
+        """
+        self._members = set()
+        self._cells = {}
+        self._large_items = {}
+        self._item_cells = {}
+        self._dirty = set()
+
+    def _remove_cells(self, item):
+        cells = self._item_cells.pop(item, None)
+        if cells is None:
+            self._large_items.pop(item, None)
+            return
+        for cell in cells:
+            entries = self._cells[cell]
+            del entries[item]
+            if not entries:
+                del self._cells[cell]
+
+    def _update(self):
+        """
+        Update the queued items in the grid.
+        """
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        for item in dirty:
+            self._remove_cells(item)
+            if not self._is_indexed(item):
+                continue
+            rect = self._item_rect(item)
+            left, top, right, bottom = self._cell_range(rect)
+            if (right - left + 1) * (bottom - top + 1) > self.MAX_ITEM_CELLS:
+                self._large_items[item] = rect
+                continue
+            cells = []
+            for x in range(left, right + 1):
+                for y in range(top, bottom + 1):
+                    self._cells.setdefault((x, y), {})[item] = rect
+                    cells.append((x, y))
+            self._item_cells[item] = cells
+
+    def item_rects(self, rect):
+        """
+        Returns the items with a scene rect intersecting the area.
+
+        Args:
+            rect (QtCore.QRectF): scene area.
+
+        Returns:
+            dict: {item: scene_rect, ...}
+        """
+        self._update()
+        found = {}
+        left, top, right, bottom = self._cell_range(rect)
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                for item, item_rect in self._cells.get((x, y), {}).items():
+                    if item not in found and item_rect.intersects(rect):
+                        found[item] = item_rect
+        for item, item_rect in self._large_items.items():
+            if item_rect.intersects(rect):
+                found[item] = item_rect
+        return found
+
+
+class PortGrid(ItemGrid):
+    """
+    Grid of the port scene positions used by the viewer to find the ports
+    under or near the cursor while a live connection is dragged.
+
+    The port items queue themselves with :meth:`ItemGrid.mark_dirty` when
+    they're moved, added or removed from the scene.
+
+    Args:
+        cell_size (float): grid cell size in scene units.
+    """
+
+    def _is_indexed(self, item):
+        return item.scene() is not None
+
+    def _entries(self, rect):
+        """
+        Returns the visible ports in the area.
+        """
+        return [(port, port_rect)
+                for port, port_rect in self.item_rects(rect).items()
+                if port.isVisible()]
+
+    def port_at(self, pos):
+        """
+        Returns the port under the scene position, the port with the center
+        closest to the position is returned if the ports overlap.
+
+        Args:
+            pos (QtCore.QPointF): scene position.
+
+        Returns:
+            PortItem: port item or None.
+        """
+        found = None
+        found_dist = None
+        area = QtCore.QRectF(pos.x() - 0.5, pos.y() - 0.5, 1.0, 1.0)
+        for port, rect in self._entries(area):
+            if not rect.contains(pos):
+                continue
+            dist = (rect.center() - pos).manhattanLength()
+            if found_dist is None or dist < found_dist:
+                found, found_dist = port, dist
+        return found
+
+    def nearest_port(self, pos, radius, accept=None):
+        """
+        Returns the port with the center closest to the scene position
+        within the radius.
+
+        Args:
+            pos (QtCore.QPointF): scene position.
+            radius (float): search radius in scene units.
+            accept (function): called with the port item to filter the
+                ports. (optional)
+
+        Returns:
+            PortItem: port item or None.
+        """
+        rect = QtCore.QRectF(pos.x() - radius, pos.y() - radius,
+                             radius * 2, radius * 2)
+        found = None
+        found_dist = radius
+        for port, port_rect in self._entries(rect):
+            center = port_rect.center()
+            dist = math.hypot(center.x() - pos.x(), center.y() - pos.y())
+            if dist > found_dist:
+                continue
+            if accept and not accept(port):
+                continue
+            found, found_dist = port, dist
+        return found
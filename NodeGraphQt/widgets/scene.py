@@ -1,4 +1,6 @@
 #!/usr/bin/python
+import math
+
 from PyQt5 import QtGui, QtCore, QtWidgets
 
 from NodeGraphQt.constants import ViewerEnum
@@ -13,6 +15,11 @@ class NodeScene(QtWidgets.QGraphicsScene):
         self._bg_color = ViewerEnum.BACKGROUND_COLOR.value
         self.setBackgroundBrush(QtGui.QColor(*self._bg_color))
 
+        # cached grid tile "(view scale, texture brush, tile size)" the
+        # background is filled with, cleared when the grid mode or colors
+        # change.
+        self._grid_tile = None
+
     def __repr__(self):
         cls_name = str(self.__class__.__name__)
         return '<{}("{}") object at {}>'.format(
@@ -58,6 +65,21 @@ class NodeScene(QtWidgets.QGraphicsScene):
         painter.setPen(pen)
         painter.drawLines(lines)
 
+    def _dots_grid_size(self, grid_size):
+        """
+        Returns the spacing between the grid dots for the current zoom.
+
+        Args:
+            grid_size (int): grid size.
+
+        Returns:
+            int: dots spacing.
+        """
+        zoom = self.viewer().get_zoom()
+        if zoom < 0:
+            grid_size = int(abs(zoom) / 0.3 + 1) * grid_size
+        return grid_size
+
     def _draw_dots(self, painter, rect, pen, grid_size):
         """
         draws the grid dots in the scene.
@@ -68,9 +90,7 @@ class NodeScene(QtWidgets.QGraphicsScene):
             pen (QtGui.QPen): pen object.
             grid_size (int): grid size.
         """
-        zoom = self.viewer().get_zoom()
-        if zoom < 0:
-            grid_size = int(abs(zoom) / 0.3 + 1) * grid_size
+        grid_size = self._dots_grid_size(grid_size)
 
         left = int(rect.left())
         right = int(rect.right())
@@ -80,20 +100,27 @@ class NodeScene(QtWidgets.QGraphicsScene):
         first_left = left - (left % grid_size)
         first_top = top - (top % grid_size)
 
-        pen.setWidth(grid_size / 10)
+        pen.setWidth(int(grid_size / 10))
         painter.setPen(pen)
 
-        [painter.drawPoint(int(x), int(y))
-         for x in range(first_left, right, grid_size)
-         for y in range(first_top, bottom, grid_size)]
-
-    def drawBackground(self, painter, rect):
-        super(NodeScene, self).drawBackground(painter, rect)
+        points = QtGui.QPolygonF([
+            QtCore.QPointF(x, y)
+            for x in range(first_left, right, grid_size)
+            for y in range(first_top, bottom, grid_size)
+        ])
+        painter.drawPoints(points)
 
-        painter.save()
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
-        painter.setBrush(self.backgroundBrush())
+    def _draw_grid_tile(self, painter, rect):
+        """
+        draws one tile of the background grid.
 
+        Args:
+            painter (QtGui.QPainter): painter object.
+            rect (QtCore.QRectF): tile rect.
+        """
+        # extend the rect so the lines and dots on the far tile edges are
+        # drawn as well.
+        rect = rect.adjusted(0.0, 0.0, 1.0, 1.0)
         if self._grid_mode is ViewerEnum.GRID_DISPLAY_DOTS.value:
             pen = QtGui.QPen(QtGui.QColor(*self.grid_color), 0.65)
             self._draw_dots(painter, rect, pen, ViewerEnum.GRID_SIZE.value)
@@ -114,6 +141,72 @@ class NodeScene(QtWidgets.QGraphicsScene):
                 painter, rect, pen, ViewerEnum.GRID_SIZE.value * 8
             )
 
+    def _grid_brush(self, scale):
+        """
+        Returns the texture brush the background grid is tiled with.
+
+        The grid tile is rendered once in device pixels for the view scale
+        and cached until the zoom, grid mode or colors change. The tile
+        pixmap is rounded to whole pixels so the brush is scaled by the
+        rounding difference to keep the grid aligned to the scene.
+
+        Args:
+            scale (float): current view scale.
+
+        Returns:
+            tuple(QtGui.QBrush, int): grid texture brush, tile size.
+        """
+        if self._grid_tile and self._grid_tile[0] == scale:
+            return self._grid_tile[1:]
+
+        if self._grid_mode is ViewerEnum.GRID_DISPLAY_DOTS.value:
+            tile_size = self._dots_grid_size(ViewerEnum.GRID_SIZE.value)
+        else:
+            tile_size = ViewerEnum.GRID_SIZE.value * 8
+
+        pixel_size = max(1, int(round(tile_size * scale)))
+        pixmap = QtGui.QPixmap(pixel_size, pixel_size)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+        painter.scale(pixel_size / tile_size, pixel_size / tile_size)
+        self._draw_grid_tile(
+            painter, QtCore.QRectF(0.0, 0.0, tile_size, tile_size)
+        )
+        painter.end()
+
+        brush = QtGui.QBrush(pixmap)
+        brush_scale = (tile_size * scale) / pixel_size
+        brush.setTransform(QtGui.QTransform.fromScale(brush_scale, brush_scale))
+
+        self._grid_tile = (scale, brush, tile_size)
+        return self._grid_tile[1:]
+
+    def drawBackground(self, painter, rect):
+        super(NodeScene, self).drawBackground(painter, rect)
+
+        if self._grid_mode is ViewerEnum.GRID_DISPLAY_NONE.value:
+            return
+
+        transform = painter.worldTransform()
+        brush, tile_size = self._grid_brush(round(transform.m11(), 4))
+
+        # tile from the grid tile at the top left of the view.
+        view_pos = transform.inverted()[0].map(QtCore.QPointF(0.0, 0.0))
+        anchor = QtCore.QPointF(
+            math.floor(view_pos.x() / tile_size) * tile_size,
+            math.floor(view_pos.y() / tile_size) * tile_size
+        )
+
+        # fill in device coordinates so the tile pixmap isn't scaled by the
+        # view transform, the small brush scale is filtered so grid lines
+        # on a tile edge aren't dropped.
+        painter.save()
+        painter.resetTransform()
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, True)
+        painter.setBrushOrigin(transform.map(anchor))
+        painter.fillRect(transform.mapRect(rect), brush)
         painter.restore()
 
     def mousePressEvent(self, event):
@@ -152,6 +245,7 @@ class NodeScene(QtWidgets.QGraphicsScene):
         if mode is None:
             mode = ViewerEnum.GRID_DISPLAY_LINES.value
         self._grid_mode = mode
+        self._grid_tile = None
 
     @property
     def grid_color(self):
@@ -160,6 +254,7 @@ class NodeScene(QtWidgets.QGraphicsScene):
     @grid_color.setter
     def grid_color(self, color=(0, 0, 0)):
         self._grid_color = color
+        self._grid_tile = None
 
     @property
     def background_color(self):
@@ -168,4 +263,5 @@ class NodeScene(QtWidgets.QGraphicsScene):
     @background_color.setter
     def background_color(self, color=(0, 0, 0)):
         self._bg_color = color
+        self._grid_tile = None
         self.setBackgroundBrush(QtGui.QColor(*self._bg_color))
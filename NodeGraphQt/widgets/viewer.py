@@ -1,6 +1,7 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 import math
+from collections import deque
 from distutils.version import LooseVersion
 
 from PyQt5 import QtGui, QtCore, QtWidgets
@@ -8,11 +9,15 @@ from PyQt5.QtCore import pyqtSignal
 
 from NodeGraphQt.base.menu import BaseMenu
 from NodeGraphQt.constants import (
+    ITEM_CACHE_MODE,
     LayoutDirectionEnum,
     PortTypeEnum,
     PipeEnum,
     PipeLayoutEnum,
+    PortEnum,
     ViewerEnum,
+    ViewerLODEnum,
+    ViewerRenderEnum,
     Z_VAL_PIPE,
 )
 from NodeGraphQt.qgraphics.node_abstract import AbstractNodeItem
@@ -21,12 +26,34 @@ from NodeGraphQt.qgraphics.pipe import PipeItem, LivePipeItem
 from NodeGraphQt.qgraphics.port import PortItem
 from NodeGraphQt.qgraphics.slicer import SlicerPipeItem
 from NodeGraphQt.widgets.dialogs import BaseDialog, FileDialog
+from NodeGraphQt.widgets.item_index import ItemGrid, PortGrid
 from NodeGraphQt.widgets.scene import NodeScene
 from NodeGraphQt.widgets.tab_search import TabSearchMenuWidget
 
 ZOOM_MIN = -0.95
 ZOOM_MAX = 2.0
 
+# viewport update mode, item cache mode and optimization flags per profile.
+RENDER_PROFILES = {
+    ViewerRenderEnum.FULL.value: (
+        QtWidgets.QGraphicsView.FullViewportUpdate,
+        ITEM_CACHE_MODE,
+        QtWidgets.QGraphicsView.DontAdjustForAntialiasing
+    ),
+    # partial updates keep the antialiasing adjustment so the items edges
+    # are repainted.
+    ViewerRenderEnum.BOUNDING_RECT.value: (
+        QtWidgets.QGraphicsView.BoundingRectViewportUpdate,
+        QtWidgets.QGraphicsItem.NoCache,
+        QtWidgets.QGraphicsView.OptimizationFlags()
+    ),
+    ViewerRenderEnum.SMART.value: (
+        QtWidgets.QGraphicsView.SmartViewportUpdate,
+        QtWidgets.QGraphicsItem.DeviceCoordinateCache,
+        QtWidgets.QGraphicsView.OptimizationFlags()
+    ),
+}
+
 
 class NodeViewer(QtWidgets.QGraphicsView):
     """
@@ -67,14 +94,42 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self.setRenderHint(QtGui.QPainter.Antialiasing, True)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
         self.setCacheMode(QtWidgets.QGraphicsView.CacheBackground)
-        self.setOptimizationFlag(
-            QtWidgets.QGraphicsView.DontAdjustForAntialiasing)
+
+        self._render_profile = ViewerRenderEnum.FULL.value
+        self._item_cache_mode = ITEM_CACHE_MODE
+        update_mode, _, flags = RENDER_PROFILES[self._render_profile]
+        self.setViewportUpdateMode(update_mode)
+        self.setOptimizationFlags(flags)
 
         self.setAcceptDrops(True)
         self.resize(850, 800)
 
+        # level of detail the items are drawn with (updated from the zoom).
+        self._lod = ViewerLODEnum.FULL.value
+
+        # nodes and pipes culled from the scene in the virtualized mode.
+        self._virtualized = False
+        self._culling = False
+        self._cull_queued = False
+        self._cull_changes = set()
+        self._culled_nodes = ItemGrid(
+            500.0, on_change=self._on_culled_item_changed
+        )
+        self._culled_pipes = ItemGrid(
+            500.0,
+            rect_func=self._culled_pipe_rect,
+            on_change=self._on_culled_item_changed
+        )
+
+        # pipes waiting to be redrawn while the nodes are being moved.
+        self._dirty_pipes = None
+        self._batching = False
+
+        # selected node items (dict used as an ordered set) kept up to date
+        # from the node items so the scene isn't scanned for the selection.
+        self._selected_nodes = {}
+
         self._scene_range = QtCore.QRectF(
             0, 0, self.size().width(), self.size().height())
         self._update_scene()
@@ -86,6 +141,12 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self._detached_port = None
         self._start_port = None
         self._origin_pos = None
+
+        # port lookup used while dragging a live connection and the
+        # constrain checks cached for the duration of the live connection.
+        self._port_grid = PortGrid()
+        self._port_checks = {}
+        self._port_snap_radius = PortEnum.SNAP_RADIUS.value
         self._previous_pos = QtCore.QPoint(int(self.width() / 2),
                                            int(self.height() / 2))
         self._prev_selection_nodes = []
@@ -97,6 +158,23 @@ class NodeViewer(QtWidgets.QGraphicsView):
         )
         self._rubber_band.isActive = False
 
+        # incremental marquee selection, only the items entering or leaving
+        # the marquee are (de)selected and at most once a frame.
+        self._incremental_selection = False
+        self._rubber_band_items = set()
+        self._rubber_band_grid = None
+        self._rubber_band_rect = None
+        self._rubber_band_mode = None
+        self._rubber_band_pending = None
+        self._rubber_band_timer = QtCore.QTimer(self)
+        self._rubber_band_timer.setSingleShot(True)
+        self._rubber_band_timer.setInterval(
+            ViewerEnum.SELECTION_UPDATE_INTERVAL.value
+        )
+        self._rubber_band_timer.timeout.connect(
+            self._update_rubber_band_selection
+        )
+
         text_color = QtGui.QColor(*tuple(map(
             lambda i, j: i - j, (255, 255, 255),
             ViewerEnum.BACKGROUND_COLOR.value
@@ -121,6 +199,15 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self._SLICER_PIPE.setVisible(False)
         self.scene().addItem(self._SLICER_PIPE)
 
+        # straight line summary of the culled pipes crossing the view.
+        self._CULLED_PIPES = QtWidgets.QGraphicsPathItem()
+        pen = QtGui.QPen(QtGui.QColor(*PipeEnum.COLOR.value), 1)
+        pen.setCosmetic(True)
+        self._CULLED_PIPES.setPen(pen)
+        self._CULLED_PIPES.setZValue(Z_VAL_PIPE - 1)
+        self._CULLED_PIPES.setVisible(False)
+        self.scene().addItem(self._CULLED_PIPES)
+
         self._search_widget = TabSearchMenuWidget()
         self._search_widget.search_submitted.connect(self._on_search_submitted)
 
@@ -146,6 +233,10 @@ class NodeViewer(QtWidgets.QGraphicsView):
 
         self.acyclic = True
         self.pipe_collision = False
+
+        # topological order of the nodes "{node_id: index}" used to speed up
+        # the acyclic check, "None" when it needs to be rebuilt.
+        self._node_order = None
         self.pipe_slicing = True
 
         self.LMB_state = False
@@ -271,6 +362,29 @@ class NodeViewer(QtWidgets.QGraphicsView):
         """
         self.setSceneRect(self._scene_range)
         self.fitInView(self._scene_range, QtCore.Qt.KeepAspectRatio)
+        self._update_lod()
+        self._cull_items()
+
+    def _update_lod(self):
+        """
+        Update the level of detail of the node and pipe items from the
+        current zoom scale. (items are only updated when the level changes)
+        """
+        scale = self.transform().m11()
+        if scale < ViewerLODEnum.MINIMAL_SCALE.value:
+            lod = ViewerLODEnum.MINIMAL.value
+        elif scale < ViewerLODEnum.SIMPLIFIED_SCALE.value:
+            lod = ViewerLODEnum.SIMPLIFIED.value
+        else:
+            lod = ViewerLODEnum.FULL.value
+        if lod == self._lod:
+            return
+        self._lod = lod
+        for item in self.scene().items():
+            if isinstance(item, LivePipeItem):
+                continue
+            if isinstance(item, (AbstractNodeItem, PipeItem)):
+                item.set_lod(lod)
 
     def _combined_rect(self, nodes):
         """
@@ -282,9 +396,13 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             QtCore.QRectF: combined rect
         """
-        group = self.scene().createItemGroup(nodes)
-        rect = group.boundingRect()
-        self.scene().destroyItemGroup(group)
+        # the rects are united directly rather than grouping the nodes as
+        # the group reparents every item and redraws the connected pipes.
+        rect = QtCore.QRectF()
+        for node in nodes:
+            rect |= node.mapRectToScene(
+                node.boundingRect() | node.childrenBoundingRect()
+            )
         return rect
 
     def _items_near(self, pos, item_type=None, width=20, height=20):
@@ -304,7 +422,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         x, y = pos.x() - width, pos.y() - height
         rect = QtCore.QRectF(x, y, width, height)
         items = []
-        excl = [self._LIVE_PIPE, self._SLICER_PIPE]
+        excl = [self._LIVE_PIPE, self._SLICER_PIPE, self._CULLED_PIPES]
         for item in self.scene().items(rect):
             if item in excl:
                 continue
@@ -488,6 +606,9 @@ class NodeViewer(QtWidgets.QGraphicsView):
             self.scene().update(map_rect)
             self._rubber_band.setGeometry(rect)
             self._rubber_band.isActive = True
+            self._rubber_band_items = set()
+            self._rubber_band_grid = None
+            self._rubber_band_rect = None
 
         # stop here so we don't select a node.
         # (ctrl modifier can be used for something else in future.)
@@ -530,6 +651,13 @@ class NodeViewer(QtWidgets.QGraphicsView):
         # hide selection marquee
         if self._rubber_band.isActive:
             self._rubber_band.isActive = False
+            # apply the last marquee update still waiting on the timer.
+            if self._rubber_band_timer.isActive():
+                self._rubber_band_timer.stop()
+                self._update_rubber_band_selection()
+            self._rubber_band_items = set()
+            self._rubber_band_grid = None
+            self._rubber_band_rect = None
             if self._rubber_band.isVisible():
                 rect = self._rubber_band.rect()
                 map_rect = self.mapToScene(rect).boundingRect()
@@ -615,25 +743,33 @@ class NodeViewer(QtWidgets.QGraphicsView):
                 if not self._rubber_band.isVisible():
                     self._rubber_band.show()
                 map_rect = self.mapToScene(rect).boundingRect()
-                path = QtGui.QPainterPath()
-                path.addRect(map_rect)
                 self._rubber_band.setGeometry(rect)
-                self.scene().setSelectionArea(
-                    path, QtCore.Qt.IntersectsItemShape
-                )
                 self.scene().update(map_rect)
 
-                if self.SHIFT_state or self.CTRL_state:
-                    nodes, pipes = self.selected_items()
+                if self._incremental_selection:
+                    # the selection is updated from the timer at most once
+                    # a frame.
+                    self._rubber_band_pending = map_rect
+                    if not self._rubber_band_timer.isActive():
+                        self._rubber_band_timer.start()
+                else:
+                    path = QtGui.QPainterPath()
+                    path.addRect(map_rect)
+                    self.scene().setSelectionArea(
+                        path, QtCore.Qt.IntersectsItemShape
+                    )
+
+                    if self.SHIFT_state or self.CTRL_state:
+                        nodes, pipes = self.selected_items()
 
-                    for node in self._prev_selection_nodes:
-                        node.selected = True
+                        for node in self._prev_selection_nodes:
+                            node.selected = True
 
-                    if self.CTRL_state:
-                        for pipe in pipes:
-                            pipe.setSelected(False)
-                        for node in nodes:
-                            node.selected = False
+                        if self.CTRL_state:
+                            for pipe in pipes:
+                                pipe.setSelected(False)
+                            for node in nodes:
+                                node.selected = False
 
         elif self.LMB_state:
             self.COLLIDING_state = False
@@ -660,7 +796,17 @@ class NodeViewer(QtWidgets.QGraphicsView):
                             break
 
         self._previous_pos = event.pos()
-        super(NodeViewer, self).mouseMoveEvent(event)
+
+        # the pipes connected to the moved nodes are redrawn once after all
+        # the selected nodes have been moved.
+        batched = self._dirty_pipes is None
+        if batched:
+            self._dirty_pipes = set()
+        try:
+            super(NodeViewer, self).mouseMoveEvent(event)
+        finally:
+            if batched:
+                self._redraw_dirty_pipes()
 
     def wheelEvent(self, event):
         try:
@@ -780,33 +926,19 @@ class NodeViewer(QtWidgets.QGraphicsView):
 
         pos = event.scenePos()
         pointer_color = None
-        for item in self.scene().items(pos):
-            if not isinstance(item, PortItem):
-                continue
-
-            x = item.boundingRect().width() / 2
-            y = item.boundingRect().height() / 2
-            pos = item.scenePos()
-            pos.setX(pos.x() + x)
-            pos.setY(pos.y() + y)
-            if item == self._start_port:
-                break
+        item = self._live_connection_port(pos)
+        if item:
+            pos = item.scenePos() + item.boundingRect().center()
+        if item and item != self._start_port:
             pointer_color = PipeEnum.HIGHLIGHT_COLOR.value
-            accept = self._validate_accept_connection(self._start_port, item)
-            if not accept:
-                pointer_color = [150, 60, 255]
-                break
-            reject = self._validate_reject_connection(self._start_port, item)
-            if reject:
+            accept, reject = self._validate_connection(self._start_port, item)
+            if not accept or reject:
                 pointer_color = [150, 60, 255]
-                break
-
-            if self.acyclic:
+            elif self.acyclic:
                 if item.node == self._start_port.node:
                     pointer_color = PipeEnum.DISABLED_COLOR.value
                 elif item.port_type == self._start_port.port_type:
                     pointer_color = PipeEnum.DISABLED_COLOR.value
-            break
 
         self._LIVE_PIPE.draw_path(
             self._start_port, cursor_pos=pos, color=pointer_color
@@ -992,6 +1124,66 @@ class NodeViewer(QtWidgets.QGraphicsView):
             return False
         return False
 
+    def _validate_connection(self, from_port, to_port):
+        """
+        Returns the accept and reject constrain checks for the connection,
+        the result is cached until the live connection ends.
+
+        Args:
+            from_port (PortItem):
+            to_port (PortItem):
+
+        Returns:
+            tuple(bool, bool): true to accept, true to reject the connection.
+        """
+        key = (from_port, to_port)
+        if key not in self._port_checks:
+            self._port_checks[key] = (
+                self._validate_accept_connection(from_port, to_port),
+                self._validate_reject_connection(from_port, to_port)
+            )
+        return self._port_checks[key]
+
+    def _can_snap_to_port(self, port):
+        """
+        Returns true if the live connection can snap to the port.
+
+        Args:
+            port (PortItem): port item.
+
+        Returns:
+            bool: true if the port can be connected to the start port.
+        """
+        start_port = self._start_port
+        if port is start_port or port.locked:
+            return False
+        if port.port_type == start_port.port_type:
+            return False
+        if self.acyclic and port.node == start_port.node:
+            return False
+        accept, reject = self._validate_connection(start_port, port)
+        return accept and not reject
+
+    def _live_connection_port(self, pos):
+        """
+        Returns the port under the scene position while dragging a live
+        connection or the nearest port it can connect to within the snap
+        radius.
+
+        Args:
+            pos (QtCore.QPointF): scene position.
+
+        Returns:
+            PortItem: port item or None.
+        """
+        port = self._port_grid.port_at(pos)
+        if port or self._port_snap_radius <= 0:
+            return port
+        radius = self._port_snap_radius / self.transform().m11()
+        return self._port_grid.nearest_port(
+            pos, radius, self._can_snap_to_port
+        )
+
     def apply_live_connection(self, event):
         """
         triggered mouse press/release event for the scene.
@@ -1009,11 +1201,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self._start_port.hovered = False
 
         # find the end port.
-        end_port = None
-        for item in self.scene().items(event.scenePos()):
-            if isinstance(item, PortItem):
-                end_port = item
-                break
+        end_port = self._live_connection_port(event.scenePos())
 
         connected = []
         disconnected = []
@@ -1046,10 +1234,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
             same_node_connection = False
 
         # constrain check
-        accept_connection = self._validate_accept_connection(
-            self._start_port, end_port
-        )
-        reject_connection = self._validate_reject_connection(
+        accept_connection, reject_connection = self._validate_connection(
             self._start_port, end_port
         )
 
@@ -1123,6 +1308,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
             self._LIVE_PIPE.input_port = self._start_port
         elif self._start_port == PortTypeEnum.OUT.value:
             self._LIVE_PIPE.output_port = self._start_port
+        self._port_checks = {}
         self._LIVE_PIPE.setVisible(True)
         self._LIVE_PIPE.draw_index_pointer(
             selected_port,
@@ -1138,13 +1324,22 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self._LIVE_PIPE.setVisible(False)
         self._LIVE_PIPE.shift_selected = False
         self._start_port = None
+        self._port_checks = {}
 
     def establish_connection(self, start_port, end_port):
         """
         establish a new pipe connection.
         (adds a new pipe item to draw between 2 ports)
         """
+        self._update_node_order(start_port, end_port)
         pipe = PipeItem()
+        pipe.set_lod(self._lod)
+        self._apply_cache_mode(pipe)
+        if not (start_port.node.scene() or end_port.node.scene()):
+            # both nodes are culled from the scene.
+            pipe.set_connections(start_port, end_port)
+            self._culled_pipes.add(pipe)
+            return
         self.scene().addItem(pipe)
         pipe.set_connections(start_port, end_port)
         pipe.draw_path(pipe.input_port, pipe.output_port)
@@ -1154,7 +1349,114 @@ class NodeViewer(QtWidgets.QGraphicsView):
             pipe.hide()
 
     @staticmethod
-    def acyclic_check(start_port, end_port):
+    def _connected_node_items(node, down_stream=True):
+        """
+        Returns the node items connected to the node item.
+
+        Args:
+            node (AbstractNodeItem): node item.
+            down_stream (bool): true for the down stream connected nodes.
+
+        Returns:
+            list[AbstractNodeItem]: connected node items.
+        """
+        ports = getattr(node, 'outputs' if down_stream else 'inputs', [])
+        return [p.node for port in ports for p in port.connected_ports]
+
+    def _build_node_order(self):
+        """
+        Build the topological order of the nodes from the scene.
+        (unconnected nodes are left out and added to the end of the order
+        when they're first connected)
+
+        Returns:
+            dict: {node_id: index} or ``None`` if the nodes have a cycle.
+        """
+        nodes = []
+        in_degree = {}
+        for node in self.all_nodes():
+            if self._connected_node_items(node) or \
+                    self._connected_node_items(node, down_stream=False):
+                nodes.append(node)
+                in_degree[node] = 0
+        for node in nodes:
+            for connected_node in self._connected_node_items(node):
+                if connected_node in in_degree:
+                    in_degree[connected_node] += 1
+
+        node_order = {}
+        queue = deque(n for n in nodes if in_degree[n] == 0)
+        while queue:
+            node = queue.popleft()
+            node_order[node.id] = len(node_order)
+            for connected_node in self._connected_node_items(node):
+                if connected_node not in in_degree:
+                    continue
+                in_degree[connected_node] -= 1
+                if in_degree[connected_node] == 0:
+                    queue.append(connected_node)
+
+        if len(node_order) != len(nodes):
+            return None
+        return node_order
+
+    def _update_node_order(self, start_port, end_port):
+        """
+        Update the topological order of the nodes for a new connection.
+        (dynamic topological sort, only the nodes between the 2 connected
+        nodes in the current order are re-ordered)
+
+        Args:
+            start_port (PortItem): port item.
+            end_port (PortItem): port item.
+        """
+        if self._node_order is None:
+            return
+
+        if end_port.port_type == PortTypeEnum.IN.value:
+            src_node, trg_node = start_port.node, end_port.node
+        else:
+            src_node, trg_node = end_port.node, start_port.node
+
+        node_order = self._node_order
+        for node in (src_node, trg_node):
+            if node.id not in node_order:
+                node_order[node.id] = len(node_order)
+
+        lower, upper = node_order[trg_node.id], node_order[src_node.id]
+        if lower > upper:
+            return
+
+        def collect(node, down_stream):
+            nodes = {node: None}
+            stack = [node]
+            while stack:
+                for n in self._connected_node_items(stack.pop(), down_stream):
+                    if n in nodes or n.id not in node_order:
+                        continue
+                    if not lower <= node_order[n.id] <= upper:
+                        continue
+                    nodes[n] = None
+                    stack.append(n)
+            return list(nodes)
+
+        down_nodes = collect(trg_node, down_stream=True)
+        if src_node in down_nodes:
+            # the connection makes a cycle so the order can't be kept.
+            self._node_order = None
+            return
+        up_nodes = collect(src_node, down_stream=False)
+
+        # the up stream nodes take the lowest indexes followed by the
+        # down stream nodes.
+        sort_key = lambda n: node_order[n.id]
+        up_nodes.sort(key=sort_key)
+        down_nodes.sort(key=sort_key)
+        indexes = sorted(node_order[n.id] for n in up_nodes + down_nodes)
+        for node, index in zip(up_nodes + down_nodes, indexes):
+            node_order[node.id] = index
+
+    def acyclic_check(self, start_port, end_port):
         """
         Validate the node connections, so it doesn't loop itself.
 
@@ -1166,20 +1468,40 @@ class NodeViewer(QtWidgets.QGraphicsView):
             bool: True if port connection is valid.
         """
         start_node = start_port.node
-        check_nodes = [end_port.node]
-        io_types = {
-            PortTypeEnum.IN.value: 'outputs',
-            PortTypeEnum.OUT.value: 'inputs'
-        }
+        if self._node_order is None:
+            self._node_order = self._build_node_order()
+
+        # a node can only reach the nodes after it in the topological order.
+        node_order = self._node_order or {}
+        start_index = node_order.get(start_node.id)
+        end_index = node_order.get(end_port.node.id)
+        down_stream = end_port.port_type == PortTypeEnum.IN.value
+        if self._node_order is not None and \
+                (start_index is None or end_index is None):
+            # nodes left out of the order don't have any connections.
+            return True
+        if start_index is not None and end_index is not None:
+            if start_index != end_index and \
+                    (end_index > start_index) == down_stream:
+                return True
+
+        check_nodes = deque([end_port.node])
+        visited = {end_port.node}
         while check_nodes:
-            check_node = check_nodes.pop(0)
-            for check_port in getattr(check_node, io_types[end_port.port_type]):
-                if check_port.connected_ports:
-                    for port in check_port.connected_ports:
-                        if port.node != start_node:
-                            check_nodes.append(port.node)
-                        else:
-                            return False
+            check_node = check_nodes.popleft()
+            for node in self._connected_node_items(check_node, down_stream):
+                if node == start_node:
+                    return False
+                if node in visited:
+                    continue
+                visited.add(node)
+
+                # skip the nodes ordered past the start node.
+                index = node_order.get(node.id)
+                if start_index is not None and index is not None and \
+                        (index > start_index) == down_stream:
+                    continue
+                check_nodes.append(node)
         return True
 
     # --- viewer ---
@@ -1347,8 +1669,10 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             list[AbstractNodeItem]: instances of node items.
         """
-        return [i for i in self.scene().items()
-                if isinstance(i, AbstractNodeItem)]
+        nodes = [i for i in self.scene().items()
+                 if isinstance(i, AbstractNodeItem)]
+        return nodes + [n for n in self._culled_nodes.items()
+                        if n.scene() is None]
 
     def selected_nodes(self):
         """
@@ -1357,8 +1681,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             list[AbstractNodeItem]: instances of node items.
         """
-        return [i for i in self.scene().selectedItems()
-                if isinstance(i, AbstractNodeItem)]
+        return list(self._selected_nodes)
 
     def selected_pipes(self):
         """
@@ -1388,18 +1711,26 @@ class NodeViewer(QtWidgets.QGraphicsView):
                 pipes.append(item)
         return nodes, pipes
 
-    def add_node(self, node, pos=None):
+    def add_node(self, node, pos=None, draw=True):
         """
         Add node item into the scene.
 
         Args:
             node (AbstractNodeItem): node item instance.
             pos (tuple or list): node scene position.
+            draw (bool): call ``post_init`` to draw the node item, set to
+                ``False`` when the node is to be drawn later in a batch.
         """
         pos = pos or (self._previous_pos.x(), self._previous_pos.y())
         node.pre_init(self, pos)
+        self._apply_cache_mode(node)
         self.scene().addItem(node)
-        node.post_init(self, pos)
+        if draw:
+            node.post_init(self, pos)
+        else:
+            node.xy_pos = pos
+        if self._virtualized:
+            self._queue_cull_items()
 
     @staticmethod
     def remove_node(node):
@@ -1421,19 +1752,28 @@ class NodeViewer(QtWidgets.QGraphicsView):
             pos (tuple or list): custom x, y position.
             offset (tuple or list): x, y position offset.
         """
-        group = self.scene().createItemGroup(nodes)
-        group_rect = group.boundingRect()
         if pos:
             x, y = pos
         else:
+            center = self._combined_rect(nodes).center()
             pos = self.mapToScene(self._previous_pos)
-            x = pos.x() - group_rect.center().x()
-            y = pos.y() - group_rect.center().y()
+            x = pos.x() - center.x()
+            y = pos.y() - center.y()
         if offset:
             x += offset[0]
             y += offset[1]
-        group.setPos(x, y)
-        self.scene().destroyItemGroup(group)
+
+        # the pipes connected to the nodes are redrawn once after all the
+        # nodes have been moved.
+        batched = self._dirty_pipes is None
+        if batched:
+            self._dirty_pipes = set()
+        try:
+            for node in nodes:
+                node.xy_pos = [node.x() + x, node.y() + y]
+        finally:
+            if batched:
+                self._redraw_dirty_pipes()
 
     def get_pipes_from_nodes(self, nodes=None):
         nodes = nodes or self.selected_nodes()
@@ -1495,6 +1835,375 @@ class NodeViewer(QtWidgets.QGraphicsView):
         for pipe in self.all_pipes():
             pipe.draw_path(pipe.input_port, pipe.output_port)
 
+    def is_virtualized(self):
+        """
+        Returns true if the nodes outside the view are culled from the scene.
+
+        Returns:
+            bool: true if virtualized.
+        """
+        return self._virtualized
+
+    def set_virtualized(self, mode):
+        """
+        Set the virtualized mode, when enabled the node items outside the
+        view (and not selected) are removed from the scene and brought back
+        when the view is panned or zoomed to them. The pipes between two
+        culled nodes are drawn as a single straight line summary path.
+
+        Args:
+            mode (bool): true to enable.
+        """
+        if mode == self._virtualized:
+            return
+        self._virtualized = mode
+        if mode:
+            self._cull_items()
+            return
+        for node in self._culled_nodes.items():
+            self._restore_node(node)
+        self._culled_nodes.clear()
+        self._culled_pipes.clear()
+        self._cull_changes = set()
+        self._CULLED_PIPES.setPath(QtGui.QPainterPath())
+        self._CULLED_PIPES.setVisible(False)
+
+    @staticmethod
+    def _culled_pipe_rect(pipe):
+        """
+        Returns the scene rect between the pipe port centers.
+
+        Args:
+            pipe (PipeItem): pipe item.
+
+        Returns:
+            QtCore.QRectF: scene rect.
+        """
+        pos1 = pipe.input_port.scenePos() + \
+            pipe.input_port.boundingRect().center()
+        pos2 = pipe.output_port.scenePos() + \
+            pipe.output_port.boundingRect().center()
+        return QtCore.QRectF(pos1, pos2).normalized().adjusted(-1, -1, 1, 1)
+
+    def _on_culled_item_changed(self, item):
+        """
+        Called when a culled node or pipe is changed outside the viewer.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): node or pipe item.
+        """
+        if self._culling:
+            return
+        self._cull_changes.add(item)
+        self._queue_cull_items()
+
+    def _queue_cull_items(self):
+        """
+        Cull the items the next time the event loop is processed.
+        """
+        if not self._cull_queued:
+            self._cull_queued = True
+            QtCore.QTimer.singleShot(0, self._cull_items)
+
+    def _cull_node(self, node):
+        """
+        Remove the node item and the pipes to other culled nodes from the
+        scene.
+
+        Args:
+            node (AbstractNodeItem): node item.
+        """
+        self.scene().removeItem(node)
+        node.cull_grid = self._culled_nodes
+        self._culled_nodes.add(node)
+        for port in getattr(node, 'inputs', []) + getattr(node, 'outputs', []):
+            for pipe in port.connected_pipes:
+                if pipe.scene() and pipe.input_port and pipe.output_port:
+                    if not (pipe.input_port.node.scene() or
+                            pipe.output_port.node.scene()):
+                        self.scene().removeItem(pipe)
+                        self._culled_pipes.add(pipe)
+
+    def _restore_node(self, node):
+        """
+        Add the culled node item and its pipes back to the scene.
+
+        Args:
+            node (AbstractNodeItem): node item.
+        """
+        node.cull_grid = None
+        self._culled_nodes.remove(node)
+        if node.scene() is not self.scene():
+            self._apply_cache_mode(node)
+            self.scene().addItem(node)
+            node.set_lod(self._lod)
+        for port in getattr(node, 'inputs', []) + getattr(node, 'outputs', []):
+            for pipe in port.connected_pipes:
+                if pipe in self._culled_pipes:
+                    self._culled_pipes.remove(pipe)
+                    self._apply_cache_mode(pipe)
+                    self.scene().addItem(pipe)
+                    pipe.set_lod(self._lod)
+                pipe.draw_path(pipe.input_port, pipe.output_port)
+
+    def _cull_items(self):
+        """
+        Update the items culled from the scene in the virtualized mode, the
+        items near the view are kept in the scene.
+        """
+        self._cull_queued = False
+        if not self._virtualized:
+            return
+
+        rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        margin_x, margin_y = rect.width() * 0.5, rect.height() * 0.5
+        rect.adjust(-margin_x, -margin_y, margin_x, margin_y)
+
+        changes, self._cull_changes = self._cull_changes, set()
+        self._culling = True
+        try:
+            restore = set(self._culled_nodes.item_rects(rect))
+            for item in changes:
+                if isinstance(item, AbstractNodeItem) and \
+                        item in self._culled_nodes:
+                    if item.selected:
+                        restore.add(item)
+                    else:
+                        # the culled node was moved so its pipes are
+                        # updated in the pipe grid.
+                        for port in getattr(item, 'inputs', []) + \
+                                getattr(item, 'outputs', []):
+                            for pipe in port.connected_pipes:
+                                if pipe in self._culled_pipes:
+                                    self._culled_pipes.mark_dirty(pipe)
+                                elif pipe.scene():
+                                    pipe.draw_path(pipe.input_port,
+                                                   pipe.output_port)
+            for node in restore:
+                self._restore_node(node)
+
+            for item in self.scene().items():
+                if not isinstance(item, AbstractNodeItem) or item.selected:
+                    continue
+                if not item.sceneBoundingRect().intersects(rect):
+                    self._cull_node(item)
+
+            path = QtGui.QPainterPath()
+            for pipe in list(self._culled_pipes.item_rects(rect)):
+                # pipes deleted while culled are dropped from the grid.
+                if not (pipe.input_port and
+                        pipe in pipe.input_port.connected_pipes):
+                    self._culled_pipes.remove(pipe)
+                    continue
+                if not (pipe.input_port.node.isVisible() and
+                        pipe.output_port.node.isVisible()):
+                    continue
+                line = QtCore.QLineF(
+                    pipe.input_port.scenePos() +
+                    pipe.input_port.boundingRect().center(),
+                    pipe.output_port.scenePos() +
+                    pipe.output_port.boundingRect().center()
+                )
+                path.moveTo(line.p1())
+                path.lineTo(line.p2())
+            self._CULLED_PIPES.setPath(path)
+            self._CULLED_PIPES.setVisible(not path.isEmpty())
+        finally:
+            self._culling = False
+
+    @staticmethod
+    def _rect_difference(rect, other):
+        """
+        Returns the parts of the rect outside the other rect.
+
+        Args:
+            rect (QtCore.QRectF): rect.
+            other (QtCore.QRectF): rect to subtract.
+
+        Returns:
+            list[QtCore.QRectF]: up to 4 rects.
+        """
+        if not rect.intersects(other):
+            return [rect]
+        rects = []
+        if rect.top() < other.top():
+            rects.append(QtCore.QRectF(rect.left(), rect.top(), rect.width(),
+                                       other.top() - rect.top()))
+        if rect.bottom() > other.bottom():
+            rects.append(QtCore.QRectF(rect.left(), other.bottom(),
+                                       rect.width(),
+                                       rect.bottom() - other.bottom()))
+        top = max(rect.top(), other.top())
+        height = min(rect.bottom(), other.bottom()) - top
+        if rect.left() < other.left():
+            rects.append(QtCore.QRectF(rect.left(), top,
+                                       other.left() - rect.left(), height))
+        if rect.right() > other.right():
+            rects.append(QtCore.QRectF(other.right(), top,
+                                       rect.right() - other.right(), height))
+        return rects
+
+    def _update_rubber_band_selection(self):
+        """
+        Update the selection from the marquee in the incremental selection
+        mode, only the items in the area between the previous and current
+        marquee rect are checked and (de)selected.
+        """
+        rect = self._rubber_band_pending
+        self._rubber_band_pending = None
+        if rect is None or not self.scene():
+            return
+
+        # item shapes are only tested when drawn in full detail.
+        if self._lod == ViewerLODEnum.FULL.value:
+            mode = QtCore.Qt.IntersectsItemShape
+        else:
+            mode = QtCore.Qt.IntersectsItemBoundingRect
+
+        # the items don't move while the marquee is dragged so the item
+        # rects are indexed once instead of querying the scene.
+        grid = self._rubber_band_grid
+        if grid is None:
+            grid = self._rubber_band_grid = ItemGrid(500.0)
+            for item in self.scene().items():
+                if item.flags() & QtWidgets.QGraphicsItem.ItemIsSelectable:
+                    grid.add(item)
+
+        prev_rect = self._rubber_band_rect
+        if prev_rect is None:
+            candidates = grid.item_rects(rect)
+        elif mode != self._rubber_band_mode:
+            candidates = grid.item_rects(rect.united(prev_rect))
+        else:
+            candidates = {}
+            areas = (self._rect_difference(rect, prev_rect) +
+                     self._rect_difference(prev_rect, rect))
+            for area in areas:
+                candidates.update(grid.item_rects(area))
+        self._rubber_band_rect = rect
+        self._rubber_band_mode = mode
+
+        path = QtGui.QPainterPath()
+        path.addRect(rect)
+        prev_nodes = set(self._prev_selection_nodes)
+        for item, item_rect in candidates.items():
+            inside = item_rect.intersects(rect)
+            if inside and mode == QtCore.Qt.IntersectsItemShape:
+                inside = item.collidesWithPath(item.mapFromScene(path), mode)
+            if inside == (item in self._rubber_band_items):
+                continue
+            if inside:
+                self._rubber_band_items.add(item)
+            else:
+                self._rubber_band_items.discard(item)
+
+            # ctrl removes from the selection and shift adds to it.
+            if self.CTRL_state:
+                item.setSelected(not inside and item in prev_nodes)
+            elif self.SHIFT_state:
+                item.setSelected(inside or item in prev_nodes)
+            else:
+                item.setSelected(inside)
+
+    def get_incremental_selection(self):
+        """
+        Returns true if the marquee selection is updated incrementally.
+
+        Returns:
+            bool: true if incremental.
+        """
+        return self._incremental_selection
+
+    def set_incremental_selection(self, mode):
+        """
+        Set the incremental marquee selection mode, when enabled only the
+        items entering or leaving the marquee are (de)selected, at most
+        once a frame, and the item bounding rects are used instead of the
+        item shapes when zoomed out.
+
+        Args:
+            mode (bool): true to enable.
+        """
+        self._incremental_selection = mode
+
+    def get_port_snap_radius(self):
+        """
+        Returns the distance a live connection snaps to a port.
+
+        Returns:
+            float: snap radius in view pixels.
+        """
+        return self._port_snap_radius
+
+    def set_port_snap_radius(self, radius):
+        """
+        Set the distance a live connection snaps to the nearest port.
+
+        Args:
+            radius (float): snap radius in view pixels (0 to disable).
+        """
+        self._port_snap_radius = max(0.0, float(radius))
+
+    def get_render_profile(self):
+        """
+        Returns the rendering profile.
+
+        Returns:
+            int: rendering profile from
+                :attr:`NodeGraphQt.constants.ViewerRenderEnum`
+        """
+        return self._render_profile
+
+    def set_render_profile(self, profile):
+        """
+        Sets the rendering profile, this sets the viewport update mode,
+        optimization flags and the cache mode of the node, port and pipe
+        items including the items culled from the scene.
+
+        Args:
+            profile (int): rendering profile from
+                :attr:`NodeGraphQt.constants.ViewerRenderEnum`
+        """
+        update_mode, cache_mode, flags = RENDER_PROFILES[profile]
+        self._render_profile = profile
+        self.setViewportUpdateMode(update_mode)
+        self.setOptimizationFlags(flags)
+        if cache_mode != self._item_cache_mode:
+            self._item_cache_mode = cache_mode
+            items = [i for i in self.scene().items()
+                     if isinstance(i, (AbstractNodeItem, PipeItem))]
+            items += self._culled_nodes.items() + self._culled_pipes.items()
+            for item in items:
+                self._apply_cache_mode(item)
+        self.viewport().update()
+
+    def _apply_cache_mode(self, item):
+        """
+        Set the rendering profile cache mode on a node or pipe item, for
+        node items it's also set on the port items and the port labels.
+
+        Note:
+            Only the items created with the ``ITEM_CACHE_MODE`` are changed,
+            the other child items (eg. embedded widgets) keep their own
+            cache mode.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): node or pipe item.
+        """
+        if item in (self._LIVE_PIPE, self._SLICER_PIPE):
+            return
+        item.setCacheMode(self._item_cache_mode)
+        if not isinstance(item, AbstractNodeItem):
+            return
+        for child in item.childItems():
+            if isinstance(child, PortItem):
+                child.setCacheMode(self._item_cache_mode)
+        for port in getattr(item, 'inputs', []):
+            item.get_input_text_item(port).setCacheMode(self._item_cache_mode)
+        for port in getattr(item, 'outputs', []):
+            item.get_output_text_item(port).setCacheMode(
+                self._item_cache_mode)
+
     def get_layout_direction(self):
         """
         Returns the layout direction set on the node graph viewer
@@ -1531,6 +2240,90 @@ class NodeViewer(QtWidgets.QGraphicsView):
             self._scene_range.translate(cent - self._scene_range.center())
         self._update_scene()
 
+    def queue_pipe_redraw(self, pipes):
+        """
+        Queue the pipes to be redrawn once the current mouse move or batch
+        has been processed. (called from the port items when their node is
+        moved)
+
+        Args:
+            pipes (list[PipeItem]): pipes to redraw.
+
+        Returns:
+            bool: false if the pipes should be redrawn right away.
+        """
+        if self._dirty_pipes is None:
+            return False
+        self._dirty_pipes.update(pipes)
+        return True
+
+    def begin_batch(self):
+        """
+        Defer the viewport repaints and the pipe redraws until
+        :meth:`NodeViewer.end_batch` is called.
+        """
+        if self._batching:
+            return
+        self._batching = True
+        if self._dirty_pipes is None:
+            self._dirty_pipes = set()
+        self.setUpdatesEnabled(False)
+
+    def end_batch(self):
+        """
+        Redraw the pipes queued since :meth:`NodeViewer.begin_batch` and
+        repaint the viewport.
+        """
+        if not self._batching:
+            return
+        self._batching = False
+        self._redraw_dirty_pipes()
+        self.setUpdatesEnabled(True)
+
+    def track_node_selection(self, node, selected):
+        """
+        Update the selected nodes when a node item is (de)selected or
+        added to or removed from the scene.
+        (called from the node items)
+
+        Args:
+            node (AbstractNodeItem): node item.
+            selected (bool): true if the node is selected in the scene.
+        """
+        if selected:
+            self._selected_nodes[node] = None
+        else:
+            self._selected_nodes.pop(node, None)
+
+    def queue_port_update(self, port):
+        """
+        Queue the port to be updated in the port lookup grid.
+        (called from the port items when moved or added to the scene)
+
+        Args:
+            port (PortItem): port item.
+        """
+        self._port_grid.mark_dirty(port)
+
+    def _redraw_dirty_pipes(self):
+        """
+        Redraw the pipes queued from :meth:`NodeViewer.queue_pipe_redraw`.
+        """
+        pipes, self._dirty_pipes = self._dirty_pipes, None
+        for pipe in pipes or []:
+            if pipe.scene() and pipe.input_port and pipe.output_port:
+                pipe.draw_path(pipe.input_port, pipe.output_port)
+
+    def get_lod(self):
+        """
+        Returns the level of detail the items are drawn with for the
+        current zoom level.
+
+        Returns:
+            int: level of detail from :attr:`NodeGraphQt.constants.ViewerLODEnum`
+        """
+        return self._lod
+
     def get_zoom(self):
         """
         Returns the viewer zoom level.
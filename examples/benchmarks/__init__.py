@@ -0,0 +1,8 @@
+"""
+Standalone benchmark scripts, run them from the repository root as a
+module. (the Qt offscreen platform is used unless one is set)
+
+.. code-block:: bash
+
+    python -m examples.benchmarks.serialize_benchmark
+"""
@@ -0,0 +1,118 @@
+#!/usr/bin/python
+"""
+Shared helpers for the benchmark scripts.
+"""
+import os
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5 import QtWidgets
+
+from NodeGraphQt import BaseNode, NodeGraph
+
+
+class BenchmarkNode(BaseNode):
+    """
+    A node class with a multi connection input, 2 inputs and 2 outputs.
+    """
+
+    __identifier__ = 'nodes.benchmark'
+    NODE_NAME = 'node'
+
+    def __init__(self):
+        super(BenchmarkNode, self).__init__()
+        self.add_input('in', multi_input=True)
+        self.add_input('in A')
+        self.add_input('in B')
+        self.add_output('out')
+        self.add_output('out A')
+
+
+_APP = None
+
+
+def application():
+    """
+    Returns the Qt application, the application is created if there isn't
+    one already.
+
+    Returns:
+        QtWidgets.QApplication: application.
+    """
+    global _APP
+    _APP = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    return _APP
+
+
+def build_session(node_count, edges_per_node=1, columns=100):
+    """
+    Build serialized session data for a grid of benchmark nodes where the
+    multi connection input of each node is connected to the previous nodes.
+
+    Args:
+        node_count (int): number of nodes.
+        edges_per_node (int): number of connections made to each node.
+        columns (int): number of nodes per row.
+
+    Returns:
+        dict: serialized session data.
+    """
+    node_type = BenchmarkNode.type_
+    nodes = {}
+    connections = []
+    for idx in range(node_count):
+        node_id = 'node_{}'.format(idx)
+        nodes[node_id] = {
+            'type_': node_type,
+            'name': 'node {}'.format(idx),
+            'pos': [(idx % columns) * 250.0, (idx // columns) * 150.0],
+        }
+        for offset in range(1, edges_per_node + 1):
+            if idx - offset < 0:
+                break
+            connections.append({
+                'out': ['node_{}'.format(idx - offset), 'out'],
+                'in': [node_id, 'in'],
+            })
+    return {'nodes': nodes, 'connections': connections}
+
+
+def build_graph(node_count, edges_per_node=1, columns=100):
+    """
+    Create a node graph loaded with the :func:`build_session` data.
+
+    Args:
+        node_count (int): number of nodes.
+        edges_per_node (int): number of connections made to each node.
+        columns (int): number of nodes per row.
+
+    Returns:
+        NodeGraphQt.NodeGraph: node graph.
+    """
+    application()
+    graph = NodeGraph()
+    graph.register_node(BenchmarkNode)
+    graph.deserialize_session(
+        build_session(node_count, edges_per_node, columns)
+    )
+    return graph
+
+
+def timed(func, repeat=3):
+    """
+    Run the function a number of times and return the best time.
+
+    Args:
+        func (function): function to time.
+        repeat (int): number of runs.
+
+    Returns:
+        float: best time in milliseconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000.0
@@ -0,0 +1,62 @@
+#!/usr/bin/python
+"""
+Hover repaint benchmark on a 5k node scene for each of the viewer
+rendering profiles.
+
+The mouse is moved on and off the ports in view and the event loop is
+processed after each move so the viewport repaint is included in the time.
+
+.. code-block:: bash
+
+    python -m examples.benchmarks.hover_benchmark
+"""
+import time
+
+from PyQt5 import QtCore, QtTest
+
+from NodeGraphQt.constants import ViewerRenderEnum
+from examples.benchmarks.common import application, build_graph
+
+NODE_COUNT = 5000
+HOVER_COUNT = 100
+
+
+def move_mouse(viewer, pos):
+    QtTest.QTest.mouseMove(viewer.viewport(), pos)
+    application().processEvents()
+
+
+def main():
+    app = application()
+    graph = build_graph(NODE_COUNT, columns=100)
+    viewer = graph.viewer()
+    viewer.resize(1280, 800)
+    viewer.show()
+
+    # frame a block of nodes so they're drawn at the full level of detail.
+    nodes = graph.all_nodes()
+    block = [n for i, n in enumerate(nodes) if i % 100 < 6 and i < 500]
+    viewer.zoom_to_nodes([n.view for n in block])
+    app.processEvents()
+
+    ports = [p.view for n in block for p in n.input_ports() + n.output_ports()]
+    ports = (ports * (HOVER_COUNT // len(ports) + 1))[:HOVER_COUNT]
+    positions = [viewer.mapFromScene(p.sceneBoundingRect().center())
+                 for p in ports]
+    # empty area left of the framed nodes.
+    off_pos = QtCore.QPoint(5, 5)
+
+    for profile in ViewerRenderEnum:
+        graph.set_render_profile(profile.value)
+        app.processEvents()
+        start = time.perf_counter()
+        for pos in positions:
+            move_mouse(viewer, pos)
+            move_mouse(viewer, off_pos)
+        ms = (time.perf_counter() - start) * 1000.0 / (len(positions) * 2)
+        print('{:>13}: {:8.2f} ms per hover repaint'.format(profile.name, ms))
+    graph.close()
+
+
+if __name__ == '__main__':
+    main()
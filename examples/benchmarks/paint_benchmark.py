@@ -0,0 +1,60 @@
+#!/usr/bin/python
+"""
+Port and node paint benchmark, 50k port paints and 10k node paints with
+the items alternating between the normal and the hovered / selected state.
+
+The items are painted straight onto an image so only the item paint
+routines are timed.
+
+.. code-block:: bash
+
+    python -m examples.benchmarks.paint_benchmark
+"""
+from PyQt5 import QtGui, QtWidgets
+
+from examples.benchmarks.common import build_graph, timed
+
+NODE_COUNT = 1000
+PORT_PAINTS = 50000
+NODE_PAINTS = 10000
+
+
+def paint(items, count, toggle_state):
+    image = QtGui.QImage(256, 256, QtGui.QImage.Format_ARGB32_Premultiplied)
+    option = QtWidgets.QStyleOptionGraphicsItem()
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+    try:
+        for idx in range(count):
+            item = items[idx % len(items)]
+            if idx % len(items) == 0:
+                toggle_state(idx // len(items) % 2 == 1)
+            item.paint(painter, option, None)
+    finally:
+        painter.end()
+
+
+def main():
+    graph = build_graph(NODE_COUNT)
+    nodes = [n.view for n in graph.all_nodes()]
+    ports = [p for n in nodes for p in n.inputs + n.outputs]
+
+    def hover_ports(state):
+        for port in ports:
+            port.hovered = state
+
+    def select_nodes(state):
+        for node in nodes:
+            node.selected = state
+
+    ms = timed(lambda: paint(ports, PORT_PAINTS, hover_ports))
+    print('{:>6} port paints ({} ports): {:9.1f} ms'.format(
+        PORT_PAINTS, len(ports), ms))
+    ms = timed(lambda: paint(nodes, NODE_PAINTS, select_nodes))
+    print('{:>6} node paints ({} nodes): {:9.1f} ms'.format(
+        NODE_PAINTS, len(nodes), ms))
+    graph.close()
+
+
+if __name__ == '__main__':
+    main()
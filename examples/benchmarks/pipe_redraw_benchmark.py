@@ -0,0 +1,98 @@
+#!/usr/bin/python
+"""
+Pipe redraw micro-benchmark, every pipe path and direction pointer is
+redrawn for each pipe layout.
+
+The "before" column places the direction pointer by sampling the pipe path
+with ``QPainterPath.pointAtPercent`` the way the pipe item used to, the
+"after" column uses the placement computed from the layout points.
+
+.. code-block:: bash
+
+    python -m examples.benchmarks.pipe_redraw_benchmark
+"""
+import math
+
+from PyQt5 import QtGui
+
+from NodeGraphQt.constants import PipeEnum, PipeLayoutEnum, ViewerLODEnum
+from NodeGraphQt.qgraphics.pipe import PipeItem
+from examples.benchmarks.common import build_graph, timed
+
+NODE_COUNT = 1000
+EDGES_PER_NODE = 2
+
+
+def _path_direction_pointer(self, *args):
+    """
+    Direction pointer placement sampled from the pipe path.
+    """
+    if not (self.input_port and self.output_port):
+        self._dir_pointer.setVisible(False)
+        return
+
+    if self._lod != ViewerLODEnum.FULL.value:
+        self._dir_pointer.setVisible(False)
+        return
+
+    if self.disabled():
+        if not (self._active or self._highlight):
+            color = QtGui.QColor(*PipeEnum.DISABLED_COLOR.value)
+            pen = self._dir_pointer.pen()
+            pen.setColor(color)
+            self._dir_pointer.setPen(pen)
+            self._dir_pointer.setBrush(color.darker(200))
+
+    self._dir_pointer.setVisible(True)
+    loc_pt = self.path().pointAtPercent(0.49)
+    tgt_pt = self.path().pointAtPercent(0.51)
+    radians = math.atan2(tgt_pt.y() - loc_pt.y(),
+                         tgt_pt.x() - loc_pt.x())
+    degrees = math.degrees(radians) - 90
+    self._dir_pointer.setRotation(degrees)
+    self._dir_pointer.setPos(self.path().pointAtPercent(0.5))
+
+    cen_x = self.path().pointAtPercent(0.5).x()
+    cen_y = self.path().pointAtPercent(0.5).y()
+    dist = math.hypot(tgt_pt.x() - cen_x, tgt_pt.y() - cen_y)
+
+    self._dir_pointer.setVisible(True)
+    if dist < 0.3:
+        self._dir_pointer.setVisible(False)
+        return
+    if dist < 1.0:
+        self._dir_pointer.setScale(dist)
+
+
+def redraw(pipes):
+    for pipe in pipes:
+        # clear the cached end points so the full path is redrawn.
+        pipe._path_ends = None
+        pipe.draw_path(pipe.output_port, pipe.input_port)
+
+
+def main():
+    graph = build_graph(NODE_COUNT, EDGES_PER_NODE)
+    pipes = [i for i in graph.scene().items() if isinstance(i, PipeItem)
+             and i.input_port and i.output_port]
+
+    print('{} pipes'.format(len(pipes)))
+    print('{:>10} {:>12} {:>12}'.format('layout', 'before', 'after'))
+    for layout in PipeLayoutEnum:
+        graph.set_pipe_style(layout.value)
+
+        draw_direction_pointer = PipeItem._draw_direction_pointer
+        PipeItem._draw_direction_pointer = _path_direction_pointer
+        try:
+            before = timed(lambda: redraw(pipes))
+        finally:
+            PipeItem._draw_direction_pointer = draw_direction_pointer
+        after = timed(lambda: redraw(pipes))
+
+        print('{:>10} {:>9.1f} ms {:>9.1f} ms'.format(
+            layout.name, before, after))
+    graph.close()
+
+
+if __name__ == '__main__':
+    main()
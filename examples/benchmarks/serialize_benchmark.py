@@ -0,0 +1,29 @@
+#!/usr/bin/python
+"""
+Serialization benchmark for synthetic graphs of 1k, 10k and 50k
+connections, the connections must be serialized in linear time.
+
+.. code-block:: bash
+
+    python -m examples.benchmarks.serialize_benchmark
+"""
+from examples.benchmarks.common import build_graph, timed
+
+# (number of nodes, connections per node)
+GRAPH_SIZES = [(1000, 1), (2000, 5), (10000, 5)]
+
+
+def main():
+    for node_count, edges_per_node in GRAPH_SIZES:
+        graph = build_graph(node_count, edges_per_node)
+        nodes = graph.all_nodes()
+        data = graph.serialize_session()
+        edge_count = len(data.get('connections', []))
+        ms = timed(lambda: graph._serialize(nodes))
+        print('{:>6} nodes {:>6} connections: {:9.1f} ms'.format(
+            node_count, edge_count, ms))
+        graph.close()
+
+
+if __name__ == '__main__':
+    main()
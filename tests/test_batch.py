@@ -0,0 +1,58 @@
+#!/usr/bin/python
+import unittest
+
+from tests.utils import create_graph
+
+
+class BatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.graph, self.nodes = create_graph(3)
+        self.changes = []
+        self.graph.graph_changed.connect(self.changes.append)
+
+    def tearDown(self):
+        self.graph.close()
+
+    def pairs(self, *nodes):
+        return [(node.input(0), node.input(0).connected_ports()[0])
+                for node in nodes]
+
+    def test_delete_node(self):
+        pairs = self.pairs(*self.nodes[1:])
+        with self.graph.batch():
+            self.graph.delete_node(self.nodes[1])
+
+        self.assertEqual(len(self.changes), 1)
+        self.assertEqual(self.changes[0]['nodes_deleted'],
+                         [self.nodes[1].id])
+        self.assertCountEqual(self.changes[0]['ports_disconnected'], pairs)
+        self.assertEqual(self.changes[0]['ports_connected'], [])
+
+    def test_delete_node_undo(self):
+        with self.graph.batch():
+            self.graph.delete_node(self.nodes[1])
+            self.graph.undo_stack().undo()
+
+        # the delete and undo cancel each other out.
+        self.assertEqual(self.changes, [])
+
+    def test_disconnect_reconnect(self):
+        in_port, out_port = self.nodes[1].input(0), self.nodes[0].output(0)
+        with self.graph.batch():
+            in_port.disconnect_from(out_port)
+            in_port.connect_to(out_port)
+        self.assertEqual(self.changes, [])
+
+        with self.graph.batch():
+            in_port.disconnect_from(out_port)
+            in_port.connect_to(out_port)
+            in_port.disconnect_from(out_port)
+        self.assertEqual(len(self.changes), 1)
+        self.assertEqual(self.changes[0]['ports_disconnected'],
+                         [(in_port, out_port)])
+        self.assertEqual(self.changes[0]['ports_connected'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/python
+import math
+import unittest
+
+from PyQt5 import QtCore, QtGui
+
+from NodeGraphQt.constants import ViewerEnum
+from tests.utils import application, create_graph
+
+
+class GridTests(unittest.TestCase):
+
+    def setUp(self):
+        self.graph, _ = create_graph()
+        self.graph.set_grid_mode(ViewerEnum.GRID_DISPLAY_LINES.value)
+        self.viewer = self.graph.viewer()
+        self.viewer.resize(4000, 200)
+        self.viewer.show()
+
+    def tearDown(self):
+        self.graph.close()
+
+    def grid_columns(self):
+        image = self.viewer.viewport().grab().toImage()
+        # sum the columns so the horizontal grid lines are the same in
+        # every column.
+        values = [sum(image.pixelColor(x, y).lightness()
+                      for y in range(0, image.height(), 10))
+                  for x in range(image.width())]
+        background = max(set(values), key=values.count)
+        return [x for x, value in enumerate(values) if value < background - 3]
+
+    def test_grid_aligned_at_fractional_scale(self):
+        # the tile is 148.52 pixels wide at this scale.
+        self.viewer.setTransform(QtGui.QTransform.fromScale(0.3713, 0.3713))
+        application().processEvents()
+
+        transform = self.viewer.viewportTransform()
+        tile_size = self.graph.scene()._grid_tile[2]
+        left = transform.inverted()[0].map(QtCore.QPointF(0.0, 0.0)).x()
+        first = math.floor(left / tile_size)
+        expected = [transform.map(QtCore.QPointF(i * tile_size, 0.0)).x()
+                    for i in range(first, first + 30)]
+        width = self.viewer.viewport().width()
+        expected = [x for x in expected if 0.0 <= x < width - 1]
+
+        columns = self.grid_columns()
+        self.assertGreater(len(expected), 20)
+        for x in expected:
+            closest = min(columns, key=lambda c: abs(c - x))
+            self.assertLessEqual(abs(closest - x), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/python
+import unittest
+
+from PyQt5 import QtWidgets
+
+from NodeGraphQt.constants import ITEM_CACHE_MODE, ViewerRenderEnum
+from NodeGraphQt.widgets.node_widgets import NodeBaseWidget
+from tests.utils import create_graph
+
+NO_CACHE = QtWidgets.QGraphicsItem.NoCache
+
+
+class RenderProfileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.graph, self.nodes = create_graph(4)
+        self.nodes[0].add_text_input('text', 'text')
+        self.widget = self.nodes[0].view.get_widget('text')
+        self.viewer = self.graph.viewer()
+        self.viewer.resize(800, 600)
+        self.graph.clear_selection()
+
+    def tearDown(self):
+        self.graph.close()
+
+    def profile_items(self, node):
+        items = [node.view] + [p.view for p in node.input_ports()]
+        items += [node.view.get_input_text_item(p.view)
+                  for p in node.input_ports()]
+        items += [pipe for p in node.input_ports()
+                  for pipe in p.view.connected_pipes]
+        return items
+
+    def test_profile_keeps_other_cache_modes(self):
+        self.widget.setCacheMode(NO_CACHE)
+        self.graph.set_render_profile(ViewerRenderEnum.BOUNDING_RECT.value)
+        self.graph.set_render_profile(ViewerRenderEnum.SMART.value)
+
+        for item in self.profile_items(self.nodes[1]):
+            self.assertEqual(item.cacheMode(), ITEM_CACHE_MODE)
+        self.assertIsInstance(self.widget, NodeBaseWidget)
+        self.assertEqual(self.widget.cacheMode(), NO_CACHE)
+        self.assertEqual(self.viewer._CULLED_PIPES.cacheMode(), NO_CACHE)
+        self.assertEqual(self.viewer._LIVE_PIPE.cacheMode(), ITEM_CACHE_MODE)
+
+    def test_profile_applies_to_culled_items(self):
+        far_node = self.nodes[3]
+        far_node.set_pos(100000.0, 100000.0)
+        self.graph.set_virtualized(True)
+        self.assertIsNone(far_node.view.scene())
+
+        self.graph.set_render_profile(ViewerRenderEnum.BOUNDING_RECT.value)
+        for item in self.profile_items(far_node):
+            self.assertEqual(item.cacheMode(), NO_CACHE)
+
+        self.graph.set_render_profile(ViewerRenderEnum.FULL.value)
+        self.graph.set_virtualized(False)
+        self.assertIsNotNone(far_node.view.scene())
+        for item in self.profile_items(far_node):
+            self.assertEqual(item.cacheMode(), ITEM_CACHE_MODE)
+
+
+if __name__ == '__main__':
+    unittest.main()
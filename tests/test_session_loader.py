@@ -0,0 +1,83 @@
+#!/usr/bin/python
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from tests.utils import connections, create_graph, run_event_loop
+
+
+class SessionLoaderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.graph, _ = create_graph(4)
+        self.start_state = connections(self.graph)
+
+    def tearDown(self):
+        self.graph.close()
+        shutil.rmtree(self.temp_dir)
+
+    def save_session(self, file_name, node_count):
+        graph, _ = create_graph(node_count)
+        file_path = os.path.join(self.temp_dir, file_name)
+        graph.save_session(file_path)
+        graph.close()
+        return file_path
+
+    def test_restart_rolls_back_running_load(self):
+        path_a = self.save_session('a.json', 20)
+        path_b = self.save_session('b.json', 3)
+
+        loader_a = self.graph.load_session_incremental(path_a, chunk_size=2)
+        run_event_loop(loader_a.progress_changed)
+        self.assertTrue(loader_a.is_running())
+
+        loader_b = self.graph.load_session_incremental(path_b, chunk_size=2)
+        self.assertFalse(loader_a.is_running())
+        run_event_loop(loader_b.finished)
+
+        self.assertEqual(len(self.graph.all_nodes()), 3)
+        self.assertEqual(len(connections(self.graph)), 2)
+
+    def test_cancel_restarted_load_restores_graph(self):
+        path_a = self.save_session('a.json', 20)
+        path_b = self.save_session('b.json', 3)
+
+        loader_a = self.graph.load_session_incremental(path_a, chunk_size=2)
+        run_event_loop(loader_a.progress_changed)
+        loader_b = self.graph.load_session_incremental(path_b, chunk_size=2)
+        run_event_loop(loader_b.progress_changed)
+        loader_b.cancel()
+
+        self.assertFalse(loader_b.is_running())
+        self.assertEqual(len(self.graph.all_nodes()), 4)
+        self.assertEqual(connections(self.graph), self.start_state)
+
+    def test_build_error_rolls_back(self):
+        file_path = self.save_session('a.json', 20)
+        cancelled = []
+        loader = self.graph.load_session_incremental(file_path, chunk_size=2)
+        loader.cancelled.connect(lambda: cancelled.append(True))
+
+        deserialize = self.graph._deserialize
+        calls = []
+
+        def failing_deserialize(*args, **kwargs):
+            calls.append(True)
+            if len(calls) == 3:
+                raise ValueError('invalid node data')
+            return deserialize(*args, **kwargs)
+
+        with mock.patch.object(self.graph, '_deserialize',
+                               side_effect=failing_deserialize):
+            run_event_loop(loader.cancelled)
+
+        self.assertTrue(cancelled)
+        self.assertFalse(loader.is_running())
+        self.assertEqual(connections(self.graph), self.start_state)
+
+
+if __name__ == '__main__':
+    unittest.main()
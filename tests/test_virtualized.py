@@ -0,0 +1,72 @@
+#!/usr/bin/python
+import unittest
+
+from tests.utils import TestNode, application, create_graph
+
+
+class VirtualizedConnectionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.graph, _ = create_graph()
+        self.viewer = self.graph.viewer()
+        self.viewer.resize(800, 600)
+        self.visible = self.graph.create_node(
+            TestNode.type_, pos=[0.0, 0.0], push_undo=False)
+        self.culled = [
+            self.graph.create_node(
+                TestNode.type_, pos=[100000.0 + idx * 250.0, 100000.0],
+                push_undo=False)
+            for idx in range(2)
+        ]
+        self.graph.clear_selection()
+        self.viewer.centerOn(0.0, 0.0)
+        self.graph.set_virtualized(True)
+        application().processEvents()
+        # build the node order before the culled nodes are connected.
+        self.viewer.acyclic_check(self.visible.output(0).view,
+                                  self.culled[0].input(0).view)
+
+    def tearDown(self):
+        self.graph.close()
+
+    def pipes(self, port):
+        return port.view.connected_pipes
+
+    def test_connect_culled_ports(self):
+        self.assertIsNone(self.culled[0].view.scene())
+        self.assertIsNotNone(self.visible.view.scene())
+
+        # culled -> visible and culled -> culled.
+        self.visible.input(0).connect_to(self.culled[0].output(0))
+        self.culled[0].input(0).connect_to(self.culled[1].output(0))
+
+        visible_pipes = self.pipes(self.visible.input(0))
+        culled_pipes = self.pipes(self.culled[0].input(0))
+        self.assertEqual(len(visible_pipes), 1)
+        self.assertEqual(len(culled_pipes), 1)
+        self.assertIs(visible_pipes[0].scene(), self.graph.scene())
+        self.assertIn(culled_pipes[0], self.viewer._culled_pipes)
+
+        # connecting the visible node to the start of the chain is a cycle.
+        self.assertFalse(self.viewer.acyclic_check(
+            self.visible.output(0).view, self.culled[1].input(0).view))
+        self.assertTrue(self.viewer.acyclic_check(
+            self.culled[1].output(0).view, self.visible.input(1).view))
+
+        self.graph.set_virtualized(False)
+        for pipe in visible_pipes + culled_pipes:
+            self.assertIs(pipe.scene(), self.graph.scene())
+
+    def test_undo_culled_disconnect(self):
+        self.culled[0].input(0).connect_to(self.culled[1].output(0))
+        self.culled[0].input(0).disconnect_from(self.culled[1].output(0))
+        self.assertEqual(self.pipes(self.culled[0].input(0)), [])
+
+        self.graph.undo_stack().undo()
+        pipes = self.pipes(self.culled[0].input(0))
+        self.assertEqual(len(pipes), 1)
+        self.assertIn(pipes[0], self.viewer._culled_pipes)
+
+
+if __name__ == '__main__':
+    unittest.main()
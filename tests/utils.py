@@ -0,0 +1,98 @@
+#!/usr/bin/python
+"""
+Shared helpers for the node graph tests.
+"""
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5 import QtCore, QtWidgets
+
+from NodeGraphQt import BaseNode, NodeGraph
+
+_APP = None
+
+
+class TestNode(BaseNode):
+    """
+    A node class with a multi connection input, an input and an output.
+    """
+
+    __identifier__ = 'nodes.test'
+    NODE_NAME = 'node'
+    __test__ = False
+
+    def __init__(self):
+        super(TestNode, self).__init__()
+        self.add_input('in', multi_input=True)
+        self.add_input('in A')
+        self.add_output('out')
+
+
+def application():
+    """
+    Returns the Qt application, the application is created if there isn't
+    one already.
+
+    Returns:
+        QtWidgets.QApplication: application.
+    """
+    global _APP
+    _APP = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    return _APP
+
+
+def create_graph(node_count=0):
+    """
+    Create a node graph with a chain of connected test nodes.
+
+    Args:
+        node_count (int): number of nodes.
+
+    Returns:
+        tuple(NodeGraphQt.NodeGraph, list[TestNode]): graph and nodes.
+    """
+    application()
+    graph = NodeGraph()
+    graph.register_node(TestNode)
+    nodes = []
+    for idx in range(node_count):
+        node = graph.create_node(
+            TestNode.type_, pos=[idx * 250.0, 0.0], push_undo=False
+        )
+        if nodes:
+            node.input(0).connect_to(nodes[-1].output(0), push_undo=False)
+        nodes.append(node)
+    return graph, nodes
+
+
+def connections(graph):
+    """
+    Returns the connections in the node graph.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+
+    Returns:
+        list[tuple]: sorted (in node, in port, out node, out port) names.
+    """
+    return sorted(
+        (node.name(), port.name(), cp.node().name(), cp.name())
+        for node in graph.all_nodes()
+        for port in node.input_ports()
+        for cp in port.connected_ports()
+    )
+
+
+def run_event_loop(signal, timeout=10000):
+    """
+    Process the Qt event loop until the signal is emitted.
+
+    Args:
+        signal (QtCore.pyqtBoundSignal): signal to wait for.
+        timeout (int): max time to wait in milliseconds.
+    """
+    loop = QtCore.QEventLoop()
+    signal.connect(loop.quit)
+    QtCore.QTimer.singleShot(timeout, loop.quit)
+    loop.exec_()